@@ -1,23 +1,67 @@
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
+from datetime import tzinfo
+from typing import Protocol, runtime_checkable
+
+import numpy as np
 
 from investiq.api.execution import ExecutionView
 from investiq.api.feature import FeatureSnapshot
 from investiq.api.instruments import InstrumentSpec
-from investiq.api.market import MarketDataEvent, MarketSate
+from investiq.api.market import MarketDataEvent, MarketField, MarketSate
+
 
+@runtime_checkable
+class ColumnarSource(Protocol):
+    """
+    Event source that can also expose its full OHLCV series as columns
+    (same order as the events it yields). Required for bulk feature precompute.
+    """
+    def columns(self) -> Mapping[MarketField, np.ndarray]:
+        ...
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BacktestInput:
     instrument: InstrumentSpec
     events: Iterable[MarketDataEvent]
 
-@dataclass(frozen=True)
+    @property
+    def tz(self) -> tzinfo | str | None:
+        """
+        Timezone of the event timestamps, as declared by the events source
+        (e.g. DataFrameBacktestFeed.tz); UTC when it declares none.
+        """
+        return getattr(self.events, "tz", "UTC")
+
+@dataclass(frozen=True, slots=True)
+class MultiBacktestInput:
+    """
+    One BacktestInput per instrument, keyed by symbol (see MultiInstrumentEngine).
+    """
+    inputs: Mapping[str, BacktestInput]
+
+    @classmethod
+    def of(cls, *inputs: BacktestInput) -> "MultiBacktestInput":
+        by_symbol = {bt.instrument.symbol: bt for bt in inputs}
+        if len(by_symbol) != len(inputs):
+            raise ValueError("MultiBacktestInput: duplicate instrument symbols")
+        return cls(inputs=by_symbol)
+
+@dataclass(frozen=True, slots=True)
 class BacktestView:
     """
     The ONLY object passed to strategies/orchestrator.
     Read-only contract: strategies cannot mutate the world.
+
+    During a backtest the view is lazy and scoped to the current bar: history
+    is only materialized for the fields/features actually read, and reading an
+    input not declared in the component metadata raises UndeclaredInputError.
+
+    `collect_diagnostics` is False when the run discards decision diagnostics
+    (DiagnosticsLevel.OFF): strategies should then return `diagnostics=None`
+    instead of building them on every bar.
     """
     market: MarketSate
     features: FeatureSnapshot
-    execution: ExecutionView
\ No newline at end of file
+    execution: ExecutionView
+    collect_diagnostics: bool = True
\ No newline at end of file
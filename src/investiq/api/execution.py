@@ -1,29 +1,34 @@
 from collections.abc import Mapping
 from dataclasses import dataclass, field
+from datetime import tzinfo
 
 import pandas as pd
 
 from investiq.api.instruments import InstrumentSpec
+from investiq.api.market import EventTime
 from investiq.execution.portfolio.types import Fill
 from investiq.execution.transition.logs import TransitionLog
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Decision:
-    timestamp: pd.Timestamp
+    timestamp: EventTime
     target_position: float
     execution_price: float
     diagnostics: dict[str, object] | None = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionView:
     current_position: float
     cash: float
     realized_pnl: float
     unrealized_pnl: float
+    # With cash shared across instruments (InstrumentPortfolio): initial cash
+    # plus the cash flows of this instrument's own fills; None otherwise
+    instrument_cash: float | None = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunResult:
     run_id: str
     instrument: InstrumentSpec
@@ -32,4 +37,18 @@ class RunResult:
     metrics: Mapping[str, float]
     execution_log: list[Fill]
     transition_log: list[TransitionLog] = field(default_factory=tuple)
-    diagnostics: Mapping[str, object] = field(default_factory=dict)
\ No newline at end of file
+    diagnostics: Mapping[str, object] = field(default_factory=dict)
+    # Set when a stop condition ended the run early (the result is partial)
+    stop_reason: str | None = None
+    # Timezone of the source data (None = tz-naive): epoch-ns event times
+    # convert back with `to_timestamp(ts, tz)` at export
+    tz: tzinfo | str | None = "UTC"
+
+
+@dataclass(frozen=True, slots=True)
+class MultiRunResult:
+    run_id: str
+    start: pd.Timestamp
+    end: pd.Timestamp
+    metrics: Mapping[str, float]
+    results: Mapping[str, RunResult]
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Mapping, Sequence
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FeatureSnapshot:
     """
     Read-only snapshot of features at current timestamp.
@@ -9,7 +9,7 @@ from investiq.api.market import MarketField
 from investiq.api.planner import ExecutionPlan
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FilterMetadata:
     name: str
     version: str
@@ -20,6 +20,9 @@ class FilterMetadata:
     required_features: FrozenSet[str]
     required_market_fields: FrozenSet[MarketField]
 
+    # Number of most recent bars the filter reads from history (None = unbounded)
+    max_lookback: int | None = None
+
     component_type: str = "FILTER"
     created_at: datetime = datetime.now()
 
@@ -7,7 +7,7 @@ from investiq.market_data import BarSize
 class AssetClass(StrEnum):
     CONT_FUT = "CONT_FUT"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InstrumentSpec:
     symbol: str
     asset_class: AssetClass
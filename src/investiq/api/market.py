@@ -4,6 +4,12 @@ from enum import StrEnum
 
 import pandas as pd
 
+# Event time: a pandas Timestamp, or int epoch nanoseconds (UTC) in epoch-ns
+# mode (see DataFrameBacktestFeed(epoch_ns=True)); convert with
+# `investiq.utilities.time_utils.to_timestamp` (in the source timezone,
+# BacktestInput.tz / RunResult.tz) at export time.
+type EventTime = pd.Timestamp | int
+
 class MarketField(StrEnum):
     OPEN = "open"
     HIGH = "high"
@@ -11,7 +17,7 @@ class MarketField(StrEnum):
     CLOSE = "close"
     VOLUME = "volume"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OHLCV:
     open: float
     high: float
@@ -23,40 +29,49 @@ class OHLCV:
             self,
             key: str
     ) -> float:
-        try:
-            return getattr(self, key)
-        except AttributeError as e:
-            raise KeyError(key) from e
+        match key:
+            case MarketField.OPEN:
+                return self.open
+            case MarketField.HIGH:
+                return self.high
+            case MarketField.LOW:
+                return self.low
+            case MarketField.CLOSE:
+                return self.close
+            case MarketField.VOLUME:
+                return self.volume
+        raise KeyError(key)
 
     def __contains__(
             self,
             key: object
     ) -> bool:
-        return isinstance(key, str) and hasattr(self, key)
-
-    def items(self):
-        for k in (
-                "open",
-                "high",
-                "low",
-                "close",
-                "volume"
-        ):
-            yield k, getattr(self, k)
-
-@dataclass(frozen=True)
+        return isinstance(key, str) and key in _OHLCV_FIELDS
+
+    def items(self) -> tuple[tuple[MarketField, float], ...]:
+        return (
+            (MarketField.OPEN, self.open),
+            (MarketField.HIGH, self.high),
+            (MarketField.LOW, self.low),
+            (MarketField.CLOSE, self.close),
+            (MarketField.VOLUME, self.volume),
+        )
+
+_OHLCV_FIELDS: frozenset[str] = frozenset(MarketField)
+
+@dataclass(frozen=True, slots=True)
 class MarketDataEvent:
-    timestamp: pd.Timestamp
+    timestamp: EventTime
     bar: OHLCV
     symbol: str | None = None
     bar_size: str | None = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketSate:
     snapshot: MarketDataEvent
     history: Mapping[MarketField, Sequence[float]]
     @property
-    def timestamp(self) -> pd.Timestamp:
+    def timestamp(self) -> EventTime:
         return self.snapshot.timestamp
     @property
     def bar(self) -> OHLCV:
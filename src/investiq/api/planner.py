@@ -2,9 +2,9 @@ from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 
-import pandas as pd
+from investiq.api.market import EventTime, MarketField
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class OCO:
     """
     One-Cancels-Other bracket: stop loss and take profit.
@@ -13,19 +13,19 @@ class OCO:
     take_profit: float | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExecutionPlan:
     """
     Execution-ready representation of a decision.
     """
-    timestamp: pd.Timestamp
+    timestamp: EventTime
     target_position: float
     execution_price: float
     oco: OCO | None = None
     diagnostics: Mapping[str, object] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PlannerMetadata:
     """
     Metadata for execution planners (audit/repro).
@@ -33,5 +33,8 @@ class PlannerMetadata:
     name: str
     version: str
     parameters: Mapping[str, object] = field(default_factory=dict)
+    # Inputs the planner may read from the BacktestView (history / features)
+    required_fields: frozenset[MarketField] = frozenset()
+    required_features: frozenset[str] = frozenset()
     component_type: str = "EXECUTION_PLANNER"
     created_at: datetime = field(default_factory=datetime.now)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Protocol, FrozenSet
@@ -7,7 +7,7 @@ from investiq.api.backtest import BacktestView
 from investiq.api.execution import Decision
 from investiq.api.market import MarketField
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StrategyMetadata:
     name: str
     version: str
@@ -20,6 +20,16 @@ class StrategyMetadata:
     required_pipelines: FrozenSet[str]
     required_features: FrozenSet[str]
 
+    # Number of most recent bars the strategy reads from history (None = unbounded)
+    max_lookback: int | None = None
+
+    # Constructor parameters per required pipeline (NAME -> kwargs, or a
+    # sequence of kwargs for one instance each); pipelines not listed are
+    # built with their defaults
+    pipeline_parameters: Mapping[str, Mapping[str, object] | Sequence[Mapping[str, object]]] = field(
+        default_factory=dict
+    )
+
     component_type: str = "STRATEGY"
     created_at: datetime = field(default_factory=datetime.now)
 
@@ -0,0 +1,67 @@
+from collections import Counter
+from collections.abc import Mapping
+from enum import StrEnum
+from types import MappingProxyType
+from typing import Final
+
+from investiq.api.execution import Decision
+
+# Shared empty diagnostics (no per-bar allocation when diagnostics are off)
+EMPTY_DIAGNOSTICS: Final[Mapping[str, object]] = MappingProxyType({})
+
+
+class DiagnosticsLevel(StrEnum):
+    """
+    - OFF: no diagnostics objects are created per bar
+    - SUMMARY: per-bar diagnostics are folded into run-level counters
+    - FULL: nested per-bar diagnostics are attached to every Decision
+    """
+    OFF = "off"
+    SUMMARY = "summary"
+    FULL = "full"
+
+
+class DiagnosticsSummary:
+    """
+    Run-level aggregate of decision diagnostics.
+
+    Counts bars, the boolean flags raised by the strategy (e.g. `warming_up`)
+    and, per filter, how many bars it changed the target position.
+    """
+    __slots__ = ("bars", "strategy_flags", "filter_overrides")
+
+    def __init__(self):
+        self.bars: int = 0
+        self.strategy_flags: Counter[str] = Counter()
+        self.filter_overrides: Counter[str] = Counter()
+
+    def record_strategy(self, decision: Decision) -> None:
+        self.bars += 1
+        if decision.diagnostics:
+            for k, v in decision.diagnostics.items():
+                if v is True:
+                    self.strategy_flags[k] += 1
+
+    def record_filter(self, name: str, before: Decision, after: Decision) -> None:
+        if after.target_position != before.target_position:
+            self.filter_overrides[name] += 1
+
+    def reset(self) -> None:
+        self.bars = 0
+        self.strategy_flags.clear()
+        self.filter_overrides.clear()
+
+    def get_state(self) -> dict[str, object]:
+        return self.summary()
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self.bars = state["bars"]
+        self.strategy_flags = Counter(state["strategy_flags"])
+        self.filter_overrides = Counter(state["filter_overrides"])
+
+    def summary(self) -> dict[str, object]:
+        return {
+            "bars": self.bars,
+            "strategy_flags": dict(self.strategy_flags),
+            "filter_overrides": dict(self.filter_overrides),
+        }
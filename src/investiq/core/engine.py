@@ -1,17 +1,30 @@
-import pandas as pd
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import tzinfo
 
-from investiq.api.backtest import BacktestView, BacktestInput
+from investiq.api.backtest import BacktestInput, ColumnarSource
+from investiq.api.instruments import InstrumentSpec
 from investiq.api.execution import ExecutionView, RunResult
-from investiq.api.market import MarketDataEvent
+from investiq.api.market import EventTime, MarketDataEvent
+from investiq.core.checkpoint import CheckpointManager, EngineCheckpoint, SupportsCheckpoint
+from investiq.core.diagnostics import EMPTY_DIAGNOSTICS, DiagnosticsLevel
+from investiq.core.errors import CheckpointError
 from investiq.core.execution_planner import ExecutionPlanner
+from investiq.core.features.factory import FeaturePipelineFactory
+from investiq.core.features.graph import pipeline_key
 from investiq.core.features.store import FeatureStore
+from investiq.core.history_buffer import combine_lookbacks
 from investiq.core.invariants import BacktestInvariantError
 from investiq.core.market_state_builder import MarketStateBuilder
+from investiq.core.profiling import Stage, StageProfiler
+from investiq.core.stop_conditions import StopCondition
+from investiq.core.view_builder import LazyViewBuilder
 from investiq.utilities.logger.factory import LoggerFactory
+from investiq.utilities.time_utils import to_timestamp
 from investiq.execution.portfolio.portfolio import Portfolio
 from investiq.execution.transition.engine import TransitionEngine
+from investiq.execution.transition.types import get_id_counters, set_id_counters
 from investiq.core.orchestrator import StrategyOrchestrator
-from investiq.runs.audit import StepRecord
+from investiq.runs.audit import AuditSink, StepRecord
 
 
 class BacktestEngine:
@@ -25,6 +38,12 @@ class BacktestEngine:
             portfolio: Portfolio,
             market_store: MarketStateBuilder | None = None,
             feature_store: FeatureStore | None = None,
+            precompute_features: bool = False,
+            profiler: StageProfiler | None = None,
+            diagnostics_level: DiagnosticsLevel | None = None,
+            audit_sink: AuditSink | None = None,
+            checkpoints: CheckpointManager | None = None,
+            stop_conditions: Sequence[StopCondition] | None = None,
     ):
         self._logger = logger_factory.child("BacktestEngine").get()
         self._strategy_orchestrator = strategy_orchestrator
@@ -32,71 +51,288 @@ class BacktestEngine:
         self._transition_engine = transition_engine
         self._portfolio = portfolio
         self._market = market_store or MarketStateBuilder()
-        self._feature_store = feature_store or FeatureStore(logger=logger_factory.child("FeatureStore").get())
+        self._feature_store = feature_store or FeatureStore(
+            logger=logger_factory.child("FeatureStore").get(),
+            pipelines=FeaturePipelineFactory.create_all(strategy_orchestrator.pipeline_specs),
+        )
+        # Global readiness over this stack's own pipelines (and dependencies):
+        # a FeatureStore shared with other stacks may hold longer warmups.
+        # None (the whole store) when the store does not hold them all.
+        stack_keys = {
+            pipeline_key(p) for p in FeaturePipelineFactory.create_all(strategy_orchestrator.pipeline_specs)
+        }
+        self._ready_mask: int | None = (
+            self._feature_store.pipeline_mask(stack_keys)
+            if stack_keys <= self._feature_store.pipeline_keys() else None
+        )
+        self._precompute_features = precompute_features
+        # Opt-in: when None, each stage only pays an `is not None` check.
+        self._profiler = profiler
+        # None keeps the level the orchestrator was built with.
+        if diagnostics_level is not None:
+            self._strategy_orchestrator.set_diagnostics_level(diagnostics_level)
+        # Receives every StepRecord of `run` (the engine keeps none itself)
+        self._audit_sink = audit_sink
+        # Rebuilt only when the portfolio changes (see `_execution_view`).
+        self._exec_view: ExecutionView | None = None
 
-    def _execution_view(self) -> ExecutionView:
-        return ExecutionView(
-            current_position=self._portfolio.current_position,
-            cash=self._portfolio.cash,
-            realized_pnl=self._portfolio.realized_pnl,
-            unrealized_pnl=self._portfolio.unrealized_pnl,
+        # Evaluated after every bar of `run`; the first one to fire ends the run
+        self._stop_conditions = tuple(stop_conditions or ())
+        self._stop_reason: str | None = None
+
+        # Progress across `run` calls (a run continues where the last one stopped)
+        self._checkpoints = checkpoints
+        self._bars: int = 0
+        self._first_ts: EventTime | None = None
+        self._last_ts: EventTime | None = None
+
+        # Size rolling history buffers to the largest lookback declared by
+        # the strategy, its filters and the feature pipelines.
+        self._max_lookback = combine_lookbacks((
+            self._strategy_orchestrator.required_lookback,
+            self._feature_store.required_lookback(),
+        ))
+        self._market.set_max_lookback(self._max_lookback)
+        self._feature_store.set_max_lookback(self._max_lookback)
+        self._logger.info(f"History lookback: {self._max_lookback or 'unbounded'}")
+
+        # Per-bar views expose only the inputs declared by the strategy,
+        # its filters and the planner; history is materialized on access.
+        planner_meta = getattr(self._execution_planner, "metadata", None)
+        self._view_builder = LazyViewBuilder(
+            fields=self._strategy_orchestrator.required_fields
+            | getattr(planner_meta, "required_fields", frozenset()),
+            features=self._strategy_orchestrator.required_features
+            | getattr(planner_meta, "required_features", frozenset()),
         )
 
+    def _execution_view(self) -> ExecutionView:
+        """
+        Current ExecutionView, reused across bars while the portfolio is unchanged.
+        """
+        if self._exec_view is None:
+            self._exec_view = ExecutionView(
+                current_position=self._portfolio.current_position,
+                cash=self._portfolio.cash,
+                realized_pnl=self._portfolio.realized_pnl,
+                unrealized_pnl=self._portfolio.unrealized_pnl,
+                instrument_cash=getattr(self._portfolio, "instrument_cash", None),
+            )
+        return self._exec_view
+
+    def invalidate_execution_view(self) -> None:
+        """
+        Drop the cached ExecutionView (e.g. cash shared with other engines changed).
+        """
+        self._exec_view = None
+
     def step(
             self,
             event: MarketDataEvent,
     ) -> StepRecord:
 
+        prof = self._profiler
+        t = prof.start() if prof is not None else 0
+
         self._market.ingest(event=event)
+        if prof is not None:
+            t = prof.lap(Stage.MARKET_INGEST, t)
         self._feature_store.ingest(market_store=self._market)
+        if prof is not None:
+            prof.lap(Stage.FEATURE_INGEST, t)
+        return self.evaluate(event)
 
-        # 1. Build read-only view
-        view = BacktestView(
-            market=self._market.view(),
-            features=self._feature_store.view(),
+    def evaluate(
+            self,
+            event: MarketDataEvent,
+    ) -> StepRecord:
+        """
+        Decide, plan and execute on the already ingested bar `event`.
+
+        `step` without market/feature ingest: used when the stores are shared
+        with other engines and were fed once for all of them.
+        """
+        prof = self._profiler
+        t = prof.start() if prof is not None else 0
+
+        # 1. Build read-only (lazy) view
+        view = self._view_builder.build(
+            market_store=self._market,
+            feature_store=self._feature_store,
             execution=self._execution_view(),
+            collect_diagnostics=self._strategy_orchestrator.diagnostics_level is not DiagnosticsLevel.OFF,
+            ready_mask=self._ready_mask,
         )
+        if prof is not None:
+            t = prof.lap(Stage.VIEW_BUILD, t)
 
         # 2. Run decision and planner pipeline
-        decision = self._strategy_orchestrator.run(view=view)
+        decision = self._strategy_orchestrator.run(view=view, profiler=prof)
+        if prof is not None:
+            t = prof.start()
         plan = self._execution_planner.plan(view=view, decision=decision)
+        if prof is not None:
+            t = prof.lap(Stage.PLANNER, t)
 
         if plan.timestamp != view.market.timestamp:
             raise BacktestInvariantError("Decision timestamp must match market timestamp")
 
-        # 4) Pure transition computation
-        ops = self._transition_engine.process(
-            plan=plan,
-            current_position=view.execution.current_position,
-            fifo_queues=self._portfolio.fifo_queues,
-        )
+        if plan.target_position == view.execution.current_position:
+            # Fast path: unchanged target, no transition and no portfolio change
+            ops = self._transition_engine.process_unchanged(
+                plan=plan,
+                current_position=view.execution.current_position,
+            )
+            if prof is not None:
+                prof.lap(Stage.TRANSITION, t)
+            exec_after = view.execution
+        else:
+            # 4) Pure transition computation
+            ops = self._transition_engine.process(
+                plan=plan,
+                current_position=view.execution.current_position,
+                fifo_queues=self._portfolio.fifo_queues,
+            )
+            if prof is not None:
+                t = prof.lap(Stage.TRANSITION, t)
 
-        # 5) Mutate portfolio
-        self._portfolio.apply_operations(ops)
+            # 5) Mutate portfolio
+            self._portfolio.apply_operations(ops)
+            self._exec_view = None
+            if prof is not None:
+                prof.lap(Stage.PORTFOLIO, t)
+            exec_after = self._execution_view()
 
         # 6. Immutable audit record
-        exec_after = self._execution_view()
         return StepRecord(
             timestamp=view.market.timestamp,
             event=event,
             decision=decision,
             transition_result=ops,
             execution_after=exec_after,
-            diagnostics=decision.diagnostics,
+            diagnostics=decision.diagnostics if decision.diagnostics is not None else EMPTY_DIAGNOSTICS,
         )
 
-    def run(self, bt_input: BacktestInput) -> RunResult:
+    def _precompute(self, bt_input: BacktestInput) -> None:
+        """
+        Bulk mode: compute all features with NumPy before the loop.
+        When continuing a run, the columns are recomputed over the new feed
+        and the row cursor is carried over.
+        """
+        if not isinstance(bt_input.events, ColumnarSource):
+            raise BacktestInvariantError(
+                "precompute_features requires events exposing columns() (e.g. DataFrameBacktestFeed)"
+            )
+        state = self._feature_store.get_state() if self._feature_store.is_precomputed else None
+        if state is not None:
+            self._feature_store.reset()
+        self._feature_store.precompute(bt_input.events.columns())
+        if state is not None:
+            self._feature_store.set_state(state)
+
+    def run(self, bt_input: BacktestInput, resume: bool = False) -> RunResult:
+        """
+        Run the backtest over `bt_input.events`.
+
+        State persists across calls: events at or before the last processed
+        timestamp are skipped, so calling `run` again with a feed holding
+        appended bars continues without replaying history. With `resume=True`,
+        the engine is first restored from the latest checkpoint on disk.
+        Checkpoints are written every `checkpoints.every_n_bars` bars and at
+        the end of the run.
+
+        When a stop condition fires, the run ends after the current bar and
+        the partial RunResult carries the condition's `stop_reason`.
+        """
+        self.prepare(bt_input, resume=resume)
+        stop_reason = self.consume(self.pending(bt_input.events))
+        self.finish()
+        return self.result(bt_input.instrument, stop_reason=stop_reason, tz=bt_input.tz)
+
+    def consume(self, events: Iterable[MarketDataEvent]) -> str | None:
+        """
+        Process `events` as given (no skipping, see `pending`) until exhausted
+        or until a stop condition fires; returns that condition's reason.
+        """
+        self._stop_reason = None
+        if not self._stop_conditions:
+            for event in events:
+                self.process(event)
+            return None
+        for event in events:
+            self.process(event)
+            if self._stop_reason is not None:
+                return self._stop_reason
+        return None
 
-        first_ts: pd.Timestamp | None = None
-        last_ts: pd.Timestamp | None = None
+    def prepare(self, bt_input: BacktestInput, resume: bool = False) -> None:
+        """
+        Restore the latest checkpoint (`resume=True`) and, in bulk mode,
+        precompute features over the feed. First phase of `run`.
+        """
+        checkpoint: EngineCheckpoint | None = None
+        if resume:
+            if self._checkpoints is None:
+                raise CheckpointError("resume=True requires a CheckpointManager")
+            checkpoint = self._checkpoints.latest()
+        # Bulk mode: columns are (re)computed over the whole feed first
+        if self._precompute_features:
+            self._precompute(bt_input)
+        if checkpoint is not None:
+            self.restore(checkpoint)
+            self._logger.info(f"Resumed from checkpoint at bar {checkpoint.bars}")
 
-        for event in bt_input.events:
-            step_record = self.step(event)
-            if first_ts is None:
-                first_ts = step_record.timestamp
-            last_ts = step_record.timestamp
+    def process(self, event: MarketDataEvent, ingested: bool = False) -> StepRecord:
+        """
+        `step` (or `evaluate` when the bar is already `ingested`) plus run
+        bookkeeping: audit sink, bar counters, stop conditions (see
+        `stop_reason`) and periodic checkpoints.
+        """
+        stops = self._stop_conditions
+        # Continued / resumed runs keep the conditions' state (see `restore`)
+        if stops and not self._bars:
+            for condition in stops:
+                condition.start()
+        step_record = self.evaluate(event) if ingested else self.step(event)
+        if self._audit_sink is not None:
+            self._audit_sink.write(step_record)
+        if self._first_ts is None:
+            self._first_ts = step_record.timestamp
+        self._last_ts = step_record.timestamp
+        self._bars += 1
+        # Checked before the checkpoint, so that it holds the conditions' state after this bar
+        for condition in stops:
+            stop_reason = condition.check(step_record)
+            if stop_reason is not None:
+                self._logger.info(f"Run stopped early at bar {self._bars}: {stop_reason}")
+                self._stop_reason = stop_reason
+                break
+        ckpt = self._checkpoints
+        if ckpt is not None and ckpt.due(self._bars):
+            ckpt.save(self.checkpoint())
+        return step_record
 
-        if first_ts is None or last_ts is None:
+    def finish(self) -> None:
+        """
+        Flush the audit sink and write the final checkpoint.
+        """
+        if self._audit_sink is not None:
+            self._audit_sink.flush()
+        ckpt = self._checkpoints
+        if ckpt is not None and self._bars and not ckpt.due(self._bars):
+            ckpt.save(self.checkpoint())
+
+    def result(
+            self,
+            instrument: InstrumentSpec,
+            stop_reason: str | None = None,
+            tz: tzinfo | str | None = "UTC",
+    ) -> RunResult:
+        """
+        RunResult of the bars processed so far; `tz` is the source timezone
+        (BacktestInput.tz) epoch-ns event times are converted back to.
+        """
+        if self._first_ts is None or self._last_ts is None:
             raise BacktestInvariantError("No events provided")
 
         metrics = {
@@ -108,19 +344,137 @@ class BacktestEngine:
 
         return RunResult(
             run_id="run_id",
-            instrument=bt_input.instrument,
-            start=first_ts,
-            end=last_ts,
+            instrument=instrument,
+            start=to_timestamp(self._first_ts, tz),
+            end=to_timestamp(self._last_ts, tz),
             metrics=metrics,
             execution_log=self._portfolio.execution_log,
-            transition_log=[],
-            diagnostics={}
+            transition_log=list(self._transition_engine.transition_log),
+            diagnostics=self._run_diagnostics(),
+            stop_reason=stop_reason,
+            tz=tz,
         )
 
+    def pending(self, events: Iterable[MarketDataEvent]) -> Iterator[MarketDataEvent]:
+        """
+        Events not processed yet (timestamp after the last processed bar).
+        In bulk mode the feed must replay the processed prefix exactly, since
+        precomputed rows are indexed by bar position.
+        """
+        it = iter(events)
+        last = self._last_ts
+        if last is None:
+            yield from it
+            return
+        skipped = 0
+        for event in it:
+            if event.timestamp <= last:
+                skipped += 1
+                continue
+            if self._feature_store.is_precomputed and skipped != self._bars:
+                raise CheckpointError(
+                    f"Bulk mode: feed skipped {skipped} bars but {self._bars} were processed"
+                )
+            yield event
+            break
+        yield from it
+
+    def _components(self) -> dict[str, SupportsCheckpoint]:
+        components: dict[str, SupportsCheckpoint] = {
+            "market": self._market,
+            "features": self._feature_store,
+            "orchestrator": self._strategy_orchestrator,
+            "transition": self._transition_engine,
+            "portfolio": self._portfolio,
+        }
+        if isinstance(self._execution_planner, SupportsCheckpoint):
+            components["planner"] = self._execution_planner
+        if isinstance(self._audit_sink, SupportsCheckpoint):
+            components["audit"] = self._audit_sink
+        for i, condition in enumerate(self._stop_conditions):
+            if isinstance(condition, SupportsCheckpoint):
+                components[f"stop.{i}.{condition.NAME}"] = condition
+        return components
+
+    def _config(self) -> dict[str, object]:
+        return {
+            **self._strategy_orchestrator.config,
+            "planner": type(self._execution_planner).__name__,
+            "pipelines": sorted(self._feature_store.pipeline_keys()),
+            "precompute_features": self._precompute_features,
+        }
+
+    def checkpoint(self) -> EngineCheckpoint:
+        """
+        Capture the full engine state after the last processed bar.
+        """
+        return EngineCheckpoint(
+            bars=self._bars,
+            first_timestamp=self._first_ts,
+            last_timestamp=self._last_ts,
+            config=self._config(),
+            components={name: c.get_state() for name, c in self._components().items()},
+            id_counters=get_id_counters(),
+        )
+
+    def restore(self, checkpoint: EngineCheckpoint) -> None:
+        """
+        Restore a checkpoint into a freshly built engine with the same config.
+        """
+        if self._bars:
+            raise CheckpointError("restore() requires an engine that has not processed any bar")
+        config = self._config()
+        if checkpoint.config != config:
+            raise CheckpointError(f"Checkpoint config {checkpoint.config} does not match engine config {config}")
+        components = self._components()
+        if set(checkpoint.components) != set(components):
+            raise CheckpointError(
+                f"Checkpoint components {sorted(checkpoint.components)} do not match {sorted(components)}"
+            )
+        for name, c in components.items():
+            c.set_state(checkpoint.components[name])
+        set_id_counters(checkpoint.id_counters)
+        self._bars = checkpoint.bars
+        self._first_ts = checkpoint.first_timestamp
+        self._last_ts = checkpoint.last_timestamp
+        self._exec_view = None
+
+    def _run_diagnostics(self) -> dict[str, object]:
+        diagnostics: dict[str, object] = {}
+        if self._profiler is not None:
+            diagnostics["stage_timings"] = self._profiler.summary()
+        if self._strategy_orchestrator.diagnostics_level is DiagnosticsLevel.SUMMARY:
+            diagnostics["decisions"] = self._strategy_orchestrator.diagnostics_summary()
+        return diagnostics
+
+    @property
+    def diagnostics_level(self) -> DiagnosticsLevel:
+        return self._strategy_orchestrator.diagnostics_level
+
+    @property
+    def bars(self) -> int:
+        return self._bars
+
+    @property
+    def stop_reason(self) -> str | None:
+        """
+        Reason of the stop condition that fired on the last processed bar
+        (cleared when `consume` starts).
+        """
+        return self._stop_reason
+
+    @property
+    def max_lookback(self) -> int | None:
+        return self._max_lookback
+
     @property
     def market_store(self) -> MarketStateBuilder:
         return self._market
 
+    @property
+    def feature_store(self) -> FeatureStore:
+        return self._feature_store
+
     @property
     def portfolio(self) -> "Portfolio":
         return self._portfolio
\ No newline at end of file
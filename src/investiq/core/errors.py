@@ -1,3 +1,12 @@
 
 class ContextNotInitializedError(RuntimeError):
-    pass
\ No newline at end of file
+    pass
+
+class StaleSnapshotError(RuntimeError):
+    pass
+
+class UndeclaredInputError(RuntimeError):
+    pass
+
+class CheckpointError(RuntimeError):
+    pass
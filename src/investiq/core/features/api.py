@@ -1,5 +1,9 @@
-from typing import ClassVar, Protocol, TYPE_CHECKING
+from collections.abc import Mapping
+from typing import ClassVar, Protocol, TYPE_CHECKING, runtime_checkable
 
+import numpy as np
+
+from investiq.api.market import MarketField
 from investiq.core.market_state_builder import MarketStateBuilder
 
 if TYPE_CHECKING:
@@ -11,9 +15,27 @@ class FeaturePipeline(Protocol):
 
     It may keep internal state (allowed): determinism is ensured because
     the state is inside the engine, not inside the strategies.
+
+    Pipelines may additionally implement `compute_bulk` (see
+    SupportsBulkCompute) to be precomputed over a whole series at once, and
+    `get_state` / `set_state` (see SupportsCheckpoint) to be checkpointed.
     """
     NAME: ClassVar[str]
 
+    # Number of most recent bars the pipeline reads from history (None = unbounded)
+    max_lookback: int | None
+
+    # Optional dependency declarations (see FeatureGraph):
+    # consumes: frozenset[str]              features read from the FeatureStore
+    # produces: frozenset[str]              features written to the FeatureStore
+    # market_inputs: frozenset[MarketField] market fields read (undeclared = all);
+    #                                       empty = pure function of `consumes`
+    # dependencies: Sequence[PipelineSpec]  upstream pipelines to build with this one
+    # key: str                              instance identity (default NAME); pipelines
+    #                                       built with several parameterizations in one
+    #                                       store namespace it, like their features.
+    #                                       Readiness is tracked per key.
+
     def reset(self) -> None:
         ...
     def update(
@@ -21,4 +43,23 @@ class FeaturePipeline(Protocol):
             market_store: MarketStateBuilder,
             feature_store: "FeatureStore"
     ) -> None:
-        ...
\ No newline at end of file
+        ...
+
+
+@runtime_checkable
+class SupportsBulkCompute(Protocol):
+    """
+    Optional FeaturePipeline extension: vectorized computation over full columns.
+
+    Must return, for every feature the pipeline publishes, a float64 array of
+    the same length as the input columns, with NaN on bars where `update()`
+    would not have written the feature. Results must match `update()` exactly.
+
+    `arrays` holds the market columns plus the precomputed columns of every
+    feature produced upstream (pipelines are precomputed in dependency order).
+    """
+    def compute_bulk(
+            self,
+            arrays: Mapping[MarketField, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        ...
@@ -0,0 +1,80 @@
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from investiq.api.strategy import StrategyMetadata
+from investiq.core.features.api import FeaturePipeline
+from investiq.core.features.graph import pipeline_key
+from investiq.core.features.registry import FeaturePipelineRegistry
+
+
+@dataclass(frozen=True)
+class PipelineSpec:
+    """
+    A registered pipeline NAME plus its constructor parameters.
+    Parameters are stored as sorted (key, value) pairs so specs are hashable.
+    """
+    name: str
+    parameters: tuple[tuple[str, object], ...] = field(default=())
+
+    @classmethod
+    def of(cls, name: str, parameters: Mapping[str, object] | None = None) -> "PipelineSpec":
+        return cls(name=name, parameters=tuple(sorted((parameters or {}).items())))
+
+
+def pipeline_specs(metadata: StrategyMetadata) -> list[PipelineSpec]:
+    """
+    Specs for the pipelines a strategy requires, with its per-pipeline parameters
+    (a sequence of parameter mappings requests one instance per mapping).
+    """
+    unknown = set(metadata.pipeline_parameters) - metadata.required_pipelines
+    if unknown:
+        raise ValueError(
+            f"Strategy '{metadata.name}' has parameters for pipelines it does not require: {sorted(unknown)}"
+        )
+    specs: list[PipelineSpec] = []
+    for name in sorted(metadata.required_pipelines):
+        parameters = metadata.pipeline_parameters.get(name)
+        if parameters is None or isinstance(parameters, Mapping):
+            specs.append(PipelineSpec.of(name, parameters))
+        else:
+            specs.extend(PipelineSpec.of(name, p) for p in parameters)
+    return specs
+
+
+class FeaturePipelineFactory:
+    @staticmethod
+    def create(spec: PipelineSpec) -> FeaturePipeline:
+        pipeline_cls = FeaturePipelineRegistry.get(spec.name)
+        return pipeline_cls(**dict(spec.parameters))
+
+    @staticmethod
+    def create_all(specs: Iterable[PipelineSpec]) -> list[FeaturePipeline]:
+        """
+        Build one pipeline per distinct spec (identical specs are deduplicated),
+        plus, transitively, the pipelines they declare in `dependencies`
+        (shared intermediates are built once).
+
+        Several parameterizations of one NAME are allowed when the pipeline
+        namespaces them (distinct `key`); otherwise they are rejected, since
+        both instances would publish the same feature names.
+        """
+        seen: set[PipelineSpec] = set()
+        by_key: dict[str, PipelineSpec] = {}
+        built: list[FeaturePipeline] = []
+        pending = list(specs)
+        while pending:
+            spec = pending.pop(0)
+            if spec in seen:
+                continue
+            seen.add(spec)
+            pipeline = FeaturePipelineFactory.create(spec)
+            key = pipeline_key(pipeline)
+            other = by_key.setdefault(key, spec)
+            if other != spec:
+                raise ValueError(
+                    f"FeaturePipeline {spec.name} requested with conflicting parameters: "
+                    f"{dict(other.parameters)} vs {dict(spec.parameters)}"
+                )
+            built.append(pipeline)
+            pending.extend(getattr(pipeline, "dependencies", ()))
+        return built
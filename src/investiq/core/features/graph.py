@@ -0,0 +1,98 @@
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+
+from investiq.api.market import MarketField
+from investiq.core.features.api import FeaturePipeline
+
+
+def consumes(pipeline: FeaturePipeline) -> frozenset[str]:
+    return frozenset(getattr(pipeline, "consumes", frozenset()))
+
+
+def produces(pipeline: FeaturePipeline) -> frozenset[str]:
+    return frozenset(getattr(pipeline, "produces", frozenset()))
+
+
+def pipeline_key(pipeline: FeaturePipeline) -> str:
+    # Instance identity: NAME unless the pipeline namespaces its parameterization
+    return getattr(pipeline, "key", pipeline.NAME)
+
+
+def market_inputs(pipeline: FeaturePipeline) -> frozenset[MarketField]:
+    # Undeclared: assume the pipeline reads the market (it runs on every bar)
+    return frozenset(getattr(pipeline, "market_inputs", frozenset(MarketField)))
+
+
+@dataclass(frozen=True)
+class FeatureGraph:
+    """
+    Dependency DAG of feature pipelines (keyed by `pipeline_key`).
+
+    An edge A -> B exists when B consumes a feature produced by A. `order`
+    is a topological order (ties keep the given pipeline order), so a
+    pipeline always runs after the producers of its inputs.
+
+    `skippable` pipelines read no market field: they only depend on the
+    features they consume and are skipped on bars where none changed.
+    """
+    order: tuple[str, ...]
+    producer: Mapping[str, str]
+    inputs: Mapping[str, frozenset[str]]
+    skippable: frozenset[str]
+
+    @classmethod
+    def build(cls, pipelines: Mapping[str, FeaturePipeline]) -> "FeatureGraph":
+        # 1. Feature -> producing pipeline (one producer per feature)
+        producer: dict[str, str] = {}
+        for name, p in pipelines.items():
+            for feature in produces(p):
+                other = producer.setdefault(feature, name)
+                if other != name:
+                    raise ValueError(f"Feature {feature} produced by both {other} and {name}")
+
+        # 2. Edges (every consumed feature must have a producer)
+        deps: dict[str, set[str]] = {}
+        for name, p in pipelines.items():
+            missing = consumes(p) - producer.keys()
+            if missing:
+                raise ValueError(f"FeaturePipeline {name} consumes unknown feature(s): {sorted(missing)}")
+            deps[name] = {producer[f] for f in consumes(p)}
+
+        order = _topological_order(list(pipelines), deps)
+        return cls(
+            order=tuple(order),
+            producer=producer,
+            inputs={name: consumes(p) for name, p in pipelines.items()},
+            skippable=frozenset(
+                name for name, p in pipelines.items()
+                if consumes(p) and not market_inputs(p)
+            ),
+        )
+
+
+def _topological_order(names: Sequence[str], deps: Mapping[str, set[str]]) -> list[str]:
+    """
+    Stable topological sort; raises ValueError naming a cycle if there is one.
+    """
+    order: list[str] = []
+    state: dict[str, int] = {}  # 1 = visiting, 2 = done
+    stack: list[str] = []
+
+    def visit(name: str) -> None:
+        s = state.get(name)
+        if s == 2:
+            return
+        if s == 1:
+            cycle = stack[stack.index(name):] + [name]
+            raise ValueError(f"Feature pipeline dependency cycle: {' -> '.join(cycle)}")
+        state[name] = 1
+        stack.append(name)
+        for dep in sorted(deps[name], key=names.index):
+            visit(dep)
+        stack.pop()
+        state[name] = 2
+        order.append(name)
+
+    for name in names:
+        visit(name)
+    return order
@@ -1,20 +1,164 @@
-from collections import defaultdict
-from collections.abc import Sequence
-
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from math import isnan
+from types import MappingProxyType
 from typing import Final
 
+import numpy as np
+
 from investiq.api.feature import FeatureSnapshot
-from investiq.core.features.api import FeaturePipeline
+from investiq.api.market import MarketField
+from investiq.core.checkpoint import SupportsCheckpoint
+from investiq.core.errors import CheckpointError, StaleSnapshotError
+from investiq.core.features.api import FeaturePipeline, SupportsBulkCompute
+from investiq.core.features.graph import FeatureGraph, pipeline_key, produces
 from investiq.core.features.registry import FeaturePipelineRegistry
+from investiq.core.history_buffer import HistoryBuffer, combine_lookbacks
+from investiq.core.invariants import BacktestInvariantError
 from investiq.core.market_state_builder import MarketStateBuilder
 from investiq.utilities.logger.protocol import LoggerProtocol
 
+_INITIAL_FEATURE_SLOTS: Final[int] = 16
+
+
+class _FeatureValues(Mapping[str, float]):
+    """
+    Read-only mapping feature name -> latest value over a columnar float64 array.
+    """
+    __slots__ = ("_slots", "_values")
+
+    def __init__(self, slots: Mapping[str, int], values: np.ndarray):
+        self._slots = slots
+        self._values = values
+
+    def __getitem__(self, name: str) -> float:
+        return float(self._values[self._slots[name]])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._slots)
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+class _PipelineReadiness(Mapping[str, bool]):
+    """
+    Read-only mapping pipeline key -> readiness, decoded from a bitmask.
+    """
+    __slots__ = ("_bits", "_mask")
+
+    def __init__(self, bits: Mapping[str, int], mask: int):
+        self._bits = bits
+        self._mask = mask
+
+    def __getitem__(self, pipeline: str) -> bool:
+        return bool(self._mask & self._bits[pipeline])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._bits)
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+
+class _StepHistory(Mapping[str, np.ndarray]):
+    """
+    Lazy history mapping bound to one ingest step of a FeatureStore.
+    Views are created on access; reading it after the next ingest raises.
+    """
+    __slots__ = ("_store", "_epoch", "_buffers")
+
+    def __init__(self, store: "FeatureStore", epoch: int, buffers: Mapping[str, HistoryBuffer]):
+        self._store = store
+        self._epoch = epoch
+        self._buffers = buffers
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        self._store._check_epoch(self._epoch)
+        return self._buffers[name].view()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._buffers)
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+
+class _BulkFeatureValues(Mapping[str, float]):
+    """
+    Read-only mapping feature name -> value at one row of precomputed columns.
+    NaN cells are reported as missing.
+    """
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns: Mapping[str, np.ndarray], row: int):
+        self._columns = columns
+        self._row = row
+
+    def __getitem__(self, name: str) -> float:
+        v = float(self._columns[name][self._row])
+        if isnan(v):
+            raise KeyError(name)
+        return v
+
+    def __iter__(self) -> Iterator[str]:
+        return (k for k, col in self._columns.items() if not isnan(col[self._row]))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class _BulkFeatureHistory(Mapping[str, np.ndarray]):
+    """
+    Read-only mapping feature name -> history up to one row of precomputed columns.
+    History starts at the first published (non-NaN) value, bounded by `max_lookback`.
+    """
+    __slots__ = ("_columns", "_first_valid", "_row", "_max_lookback")
+
+    def __init__(
+            self,
+            columns: Mapping[str, np.ndarray],
+            first_valid: Mapping[str, int],
+            row: int,
+            max_lookback: int | None,
+    ):
+        self._columns = columns
+        self._first_valid = first_valid
+        self._row = row
+        self._max_lookback = max_lookback
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        start = self._first_valid[name]
+        if self._row < start:
+            raise KeyError(name)
+        if self._max_lookback is not None:
+            start = max(start, self._row + 1 - self._max_lookback)
+        return self._columns[name][start:self._row + 1]
+
+    def __iter__(self) -> Iterator[str]:
+        return (k for k, start in self._first_valid.items() if start <= self._row)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
 
 class FeatureStore:
     """
     Generic FeatureStore:
         - holds latest value and optional history
         - runs pipelines to compute / update features
+
+    Storage is columnar: latest values live in one float64 array (one slot per
+    feature), history in one HistoryBuffer per feature, and pipeline readiness
+    in an integer bitmask (one bit per pipeline).
+
+    Pipelines run in the topological order of their declared `consumes` /
+    `produces` features (see FeatureGraph), so a pipeline can reuse features
+    published earlier in the same step instead of recomputing them. Pipelines
+    that read only features are skipped on bars where none of their inputs
+    changed (their readiness, values and history carry over).
+
+    Bulk mode: after `precompute()`, pipelines are no longer run per bar;
+    each `ingest()` advances a row cursor over the precomputed columns.
     """
 
     def __init__(
@@ -22,98 +166,374 @@ class FeatureStore:
             logger: LoggerProtocol,
             pipelines: Sequence[FeaturePipeline] | None = None,
             keep_history: bool = True,
+            max_lookback: int | None = None,
     ):
         self._logger = logger
         self.keep_history: Final[bool] = keep_history
-        self._values: dict[str, float] = {}
-        self._history: dict[str, list[float]] = defaultdict(list)
+        self._max_lookback: int | None = max_lookback
 
-        # 1. Build pipeline dict indexed by logical identity (NAME)
+        # Slot / buffer dicts are copy-on-write (replaced when a feature is
+        # added), so snapshots can share them without copying.
+        self._slots: dict[str, int] = {}
+        self._latest: np.ndarray = np.empty(_INITIAL_FEATURE_SLOTS, dtype=np.float64)
+        self._history: dict[str, HistoryBuffer] = {}
+        self._epoch: int = 0
+
+        # 1. Build pipeline dict indexed by logical identity (key, NAME by default)
+        #    (None = every registered pipeline with default parameters)
         if pipelines is None:
-            pipeline_items = [(cls_.NAME, cls_()) for cls_ in FeaturePipelineRegistry.all()]
-        else:
-            pipeline_items = [(p.NAME, p) for p in pipelines]
+            pipelines = [cls_() for cls_ in FeaturePipelineRegistry.all()]
+        pipeline_items = [(pipeline_key(p), p) for p in pipelines]
 
         names = [name for name, _ in pipeline_items]
         if len(names) != len(set(names)):
             dup = sorted({n for n in names if names.count(n) > 1})
-            raise ValueError(f"Duplicate pipeline NAME(s): {dup}")
+            raise ValueError(f"Duplicate pipeline key(s): {dup}")
+
+        # Dependency DAG (fails fast on cycles / unknown inputs), in run order
+        self._graph = FeatureGraph.build(dict(pipeline_items))
+        pipelines_by_name = dict(pipeline_items)
+        self._pipelines: dict[str, FeaturePipeline] = {n: pipelines_by_name[n] for n in self._graph.order}
+        self._produces: dict[str, frozenset[str]] = {n: produces(p) for n, p in self._pipelines.items()}
+        # Features written during the current step (only tracked if a pipeline can be skipped)
+        self._track_changes: bool = bool(self._graph.skippable)
+        self._changed: set[str] = set()
 
-        self._pipelines: dict[str, FeaturePipeline] = dict(pipeline_items)
-        self._pipelines_ready: dict[str, bool] = {name: False for name in self._pipelines}
+        # 2. Readiness bitmask: one bit per pipeline key
+        self._pipeline_bits: dict[str, int] = {name: 1 << i for i, name in enumerate(self._pipelines)}
+        self._all_ready_mask: Final[int] = (1 << len(self._pipelines)) - 1
+        self._ready_mask: int = 0
+
+        # 3. Bulk mode (see `precompute()`)
+        self._bulk_columns: dict[str, np.ndarray] | None = None
+        self._bulk_first_valid: dict[str, int] = {}
+        self._bulk_ready: np.ndarray | None = None
+        self._row: int = -1
+
+    @property
+    def max_lookback(self) -> int | None:
+        return self._max_lookback
+
+    def set_max_lookback(self, max_lookback: int | None) -> None:
+        """
+        Bound the retained feature history. Must be called before the first value is written.
+        """
+        if self._slots:
+            raise ValueError("max_lookback must be set before the first ingest")
+        self._max_lookback = max_lookback
+
+    def required_lookback(self) -> int | None:
+        """
+        Largest lookback declared by the configured pipelines (None = unbounded).
+        """
+        return combine_lookbacks(getattr(p, "max_lookback", None) for p in self._pipelines.values())
 
     def reset(self) -> None:
         """
         Reset stored values/history and reset pipelines + readiness.
         """
-        self._values.clear()
-        self._history.clear()
-        for name in self._pipelines_ready:
-            self._pipelines_ready[name] = False
+        self._slots = {}
+        self._history = {}
+        self._ready_mask = 0
+        self._epoch += 1
+        self._bulk_columns = None
+        self._bulk_first_valid = {}
+        self._bulk_ready = None
+        self._row = -1
         for p in self._pipelines.values():
             p.reset()
 
     def set_pipeline_ready(self, pipeline: str) -> None:
         """
-        Mark a pipeline as ready for the current ingest step.
+        Mark a pipeline (by key, see `pipeline_keys`) as ready for the current ingest step.
 
         Readiness is recomputed at each call to `ingest()`: all pipelines are first
         marked as not ready, then each pipeline sets its readiness during its
         `update()` execution if its outputs are valid for the current market state.
         """
         self._require_pipeline(pipeline)
-        self._pipelines_ready[pipeline] = True
+        self._ready_mask |= self._pipeline_bits[pipeline]
 
     def pipeline_ready(self, pipeline: str) -> bool:
         self._require_pipeline(pipeline)
-        return self._pipelines_ready[pipeline]
+        return bool(self._ready_mask & self._pipeline_bits[pipeline])
+
+    def global_ready(self, mask: int | None = None) -> bool:
+        """
+        Global readiness: all pipelines warmed up, or only those of `mask`
+        (see `pipeline_mask`) when the store is shared by several stacks.
+        """
+        # Neutral element: if no pipelines configured, the full mask is 0.
+        if mask is None:
+            mask = self._all_ready_mask
+        return (self._ready_mask & mask) == mask
 
-    def global_ready(self) -> bool:
+    def pipeline_mask(self, keys: Iterable[str]) -> int:
         """
-        Global readiness: all pipelines warmed up.
+        Readiness bits of the given pipeline keys (for `global_ready`).
         """
-        # Neutral element: if no pipelines configured, consider store ready.
-        return all(self._pipelines_ready.values()) if self._pipelines_ready else True
+        mask = 0
+        for key in keys:
+            self._require_pipeline(key)
+            mask |= self._pipeline_bits[key]
+        return mask
 
     def set_value(self, name: str, value: float) -> None:
         """
         Write/update a feature value (and history if enabled).
         This method is called from the FeaturePipeline.
         """
+        slot = self._slots.get(name)
         v = float(value)
-        self._values[name] = v
+        if slot is None:
+            slot = self._add_feature(name)
+            if self._track_changes:
+                self._changed.add(name)
+        elif self._track_changes and self._latest[slot] != v:
+            self._changed.add(name)
+        self._latest[slot] = v
         if self.keep_history:
             self._history[name].append(v)
 
+    def get_value(self, name: str) -> float:
+        """
+        Latest value of a feature (read by downstream pipelines during `ingest()`).
+        """
+        if self._bulk_columns is not None:
+            return _BulkFeatureValues(self._bulk_columns, self._row)[name]
+        return float(self._latest[self._slots[name]])
+
+    @property
+    def is_precomputed(self) -> bool:
+        return self._bulk_columns is not None
+
+    def precompute(self, columns: Mapping[MarketField, np.ndarray]) -> None:
+        """
+        Switch to bulk mode: compute every feature over the full market columns
+        up front with each pipeline's `compute_bulk`.
+
+        Row i of the precomputed columns is served at the (i+1)-th `ingest()`;
+        a pipeline is ready on a row when all its outputs are non-NaN.
+        """
+        if self._row >= 0 or self._slots:
+            raise ValueError("precompute() must be called before the first ingest")
+        lengths = {len(col) for col in columns.values()}
+        if len(lengths) != 1:
+            raise ValueError(f"Market columns must have the same length, got {sorted(lengths)}")
+        n = lengths.pop()
+
+        feature_columns: dict[str, np.ndarray] = {}
+        ready = np.zeros(n, dtype=np.int64)
+        for name, p in self._pipelines.items():
+            if not isinstance(p, SupportsBulkCompute):
+                raise TypeError(f"FeaturePipeline {name} does not implement compute_bulk()")
+            # topological order: consumed feature columns are already computed
+            outputs = p.compute_bulk({**columns, **feature_columns})
+            pipeline_ready = np.ones(n, dtype=bool)
+            for feature, col in outputs.items():
+                col = np.asarray(col, dtype=np.float64)
+                if col.shape != (n,):
+                    raise ValueError(
+                        f"FeaturePipeline {name} returned {feature} with shape {col.shape}, expected ({n},)"
+                    )
+                if feature in feature_columns:
+                    raise ValueError(f"Feature {feature} produced by more than one pipeline")
+                col.flags.writeable = False
+                feature_columns[feature] = col
+                pipeline_ready &= ~np.isnan(col)
+            ready[pipeline_ready] |= self._pipeline_bits[name]
+
+        self._bulk_first_valid = {
+            k: int(np.argmax(~np.isnan(col))) if not np.isnan(col).all() else n
+            for k, col in feature_columns.items()
+        }
+        self._bulk_columns = feature_columns
+        self._bulk_ready = ready
+        self._logger.info(f"Precomputed {len(feature_columns)} feature(s) over {n} bars")
+
+    def share_precomputed(self, source: "FeatureStore") -> None:
+        """
+        Switch to bulk mode with the columns `source` already precomputed
+        (read-only, so stores can share them) instead of computing them again.
+        Both stores must run the same pipelines. To start at a later bar,
+        follow with `set_state({"bulk": True, "row": start - 1})`.
+        """
+        if self._row >= 0 or self._slots:
+            raise ValueError("share_precomputed() must be called before the first ingest")
+        if not source.is_precomputed:
+            raise ValueError("Source FeatureStore is not precomputed")
+        # precomputed readiness masks are only valid for the same pipeline -> bit mapping
+        if source._pipeline_bits != self._pipeline_bits:
+            raise ValueError(
+                f"Source pipelines {list(source._pipeline_bits)} do not match {list(self._pipeline_bits)}"
+            )
+        self._bulk_columns = source._bulk_columns
+        self._bulk_first_valid = source._bulk_first_valid
+        self._bulk_ready = source._bulk_ready
+
     def ingest(self, market_store: MarketStateBuilder) -> None:
         """
          Run all pipelines once for the given market snapshot.
          This method is called from the Strategy orchestrator.
         """
-        self._pipelines_ready = {k: False for k in self._pipelines_ready}
-        for p in self._pipelines.values():
+        self._epoch += 1
+        if self._bulk_ready is not None:
+            self._row += 1
+            if self._row >= self._bulk_ready.shape[0]:
+                raise BacktestInvariantError("More market events than precomputed feature rows")
+            self._ready_mask = int(self._bulk_ready[self._row])
+            return
+        if not self._track_changes:
+            self._ready_mask = 0
+            for p in self._pipelines.values():
+                p.update(
+                    market_store=market_store,
+                    feature_store=self
+                )
+            return
+        prev_mask = self._ready_mask
+        self._ready_mask = 0
+        changed = self._changed
+        changed.clear()
+        skippable = self._graph.skippable
+        inputs = self._graph.inputs
+        for name, p in self._pipelines.items():
+            if name in skippable and changed.isdisjoint(inputs[name]):
+                self._carry_over(name, prev_mask)
+                continue
             p.update(
                 market_store=market_store,
                 feature_store=self
             )
 
-    def view(self, snapshot_history: bool = True) -> FeatureSnapshot:
+    def _carry_over(self, pipeline: str, prev_mask: int) -> None:
         """
-        Return a snapshot of current feature values, history, and readiness.
-        If `snapshot_history` is True, history is copied as immutable tuples;
-        otherwise the underlying history storage is returned by reference.
+        Skipped pipeline: keep last step's readiness and outputs (same inputs,
+        same outputs); history is extended so it stays aligned with the bars.
         """
+        self._ready_mask |= prev_mask & self._pipeline_bits[pipeline]
+        if self.keep_history:
+            for feature in self._produces[pipeline]:
+                slot = self._slots.get(feature)
+                if slot is not None:
+                    self._history[feature].append(self._latest[slot])
+
+    def view(self, snapshot_history: bool = True, ready_mask: int | None = None) -> FeatureSnapshot:
+        """
+        Return a snapshot of current feature values, history, and readiness
+        (`global_ready` over the pipelines of `ready_mask`, all by default).
+
+        Values are copied out of the columnar store (one small array) and
+        readiness is captured as a bitmask. History is never copied:
+        - `snapshot_history=True`: read-only array views taken now; they stay
+          valid for as long as they are referenced
+        - `snapshot_history=False`: views are created lazily on access; the
+          mapping is only valid until the next `ingest()`
+
+        In bulk mode, values and history index into the precomputed columns
+        at the current row (O(1), nothing is copied).
+        """
+        if self._bulk_columns is not None:
+            return FeatureSnapshot(
+                values=_BulkFeatureValues(self._bulk_columns, self._row),
+                history=_BulkFeatureHistory(
+                    self._bulk_columns, self._bulk_first_valid, self._row, self._max_lookback
+                ),
+                pipeline_ready=_PipelineReadiness(self._pipeline_bits, self._ready_mask),
+                global_ready=self.global_ready(ready_mask)
+            )
         if snapshot_history:
-            hist = {k: tuple(v) for k, v in self._history.items()}
+            hist: Mapping[str, Sequence[float]] = MappingProxyType(
+                {k: buf.view() for k, buf in self._history.items()}
+            )
         else:
-            hist = self._history
+            hist = _StepHistory(self, self._epoch, self._history)
         return FeatureSnapshot(
-            values=dict(self._values),
+            values=_FeatureValues(self._slots, self._latest[:len(self._slots)].copy()),
             history=hist,
-            pipeline_ready=dict(self._pipelines_ready),
-            global_ready=self.global_ready()
+            pipeline_ready=_PipelineReadiness(self._pipeline_bits, self._ready_mask),
+            global_ready=self.global_ready(ready_mask)
         )
 
+    def get_state(self) -> dict[str, object]:
+        """
+        Checkpoint state: feature values/history, readiness and the internal
+        state of every pipeline (which must implement SupportsCheckpoint).
+
+        In bulk mode only the row cursor is saved: the columns are recomputed
+        by `precompute()` before `set_state()`.
+        """
+        if self._bulk_columns is not None:
+            return {"bulk": True, "row": self._row}
+        pipelines: dict[str, dict[str, object]] = {}
+        for name, p in self._pipelines.items():
+            if not isinstance(p, SupportsCheckpoint):
+                raise CheckpointError(f"FeaturePipeline {name} does not implement get_state()/set_state()")
+            pipelines[name] = p.get_state()
+        n = len(self._slots)
+        return {
+            "bulk": False,
+            "values": dict(zip(self._slots, self._latest[:n].tolist())),
+            "history": {k: buf.view().copy() for k, buf in self._history.items()},
+            "ready_mask": self._ready_mask,
+            "pipelines": pipelines,
+        }
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        """
+        Restore a `get_state()` checkpoint (before the first ingest).
+        """
+        if self._slots or self._row >= 0:
+            raise CheckpointError("FeatureStore state can only be restored before the first ingest")
+        if state["bulk"]:
+            if self._bulk_ready is None:
+                raise CheckpointError("Bulk-mode checkpoint: call precompute() before set_state()")
+            row = int(state["row"])
+            if row >= self._bulk_ready.shape[0]:
+                raise CheckpointError(
+                    "Checkpoint row is past the precomputed columns (bulk mode needs a feed that "
+                    "includes the already processed bars)"
+                )
+            self._row = row
+            self._ready_mask = int(self._bulk_ready[row]) if row >= 0 else 0
+            self._epoch += 1
+            return
+        if self._bulk_columns is not None:
+            raise CheckpointError("Per-bar checkpoint cannot be restored into a precomputed FeatureStore")
+        pipelines: Mapping[str, Mapping[str, object]] = state["pipelines"]
+        if set(pipelines) != set(self._pipelines):
+            raise CheckpointError(
+                f"Checkpoint pipelines {sorted(pipelines)} do not match {sorted(self._pipelines)}"
+            )
+        for name, value in state["values"].items():
+            self._latest[self._add_feature(name)] = value
+        if self.keep_history:
+            for name, values in state["history"].items():
+                self._history[name].extend(values)
+        self._ready_mask = int(state["ready_mask"])
+        for name, p in self._pipelines.items():
+            if not isinstance(p, SupportsCheckpoint):
+                raise CheckpointError(f"FeaturePipeline {name} does not implement get_state()/set_state()")
+            p.set_state(pipelines[name])
+        self._epoch += 1
+
+    def _add_feature(self, name: str) -> int:
+        slot = len(self._slots)
+        if slot == self._latest.shape[0]:
+            latest = np.empty(2 * slot, dtype=np.float64)
+            latest[:slot] = self._latest
+            self._latest = latest
+        self._slots = self._slots | {name: slot}
+        if self.keep_history:
+            self._history = self._history | {name: HistoryBuffer(maxlen=self._max_lookback)}
+        return slot
+
+    def _check_epoch(self, epoch: int) -> None:
+        if epoch != self._epoch:
+            raise StaleSnapshotError(
+                "Feature history snapshot used after the FeatureStore moved to a new step"
+            )
+
     def _require_pipeline(self, name: str) -> None:
         if name not in self._pipelines:
             raise KeyError(
@@ -122,4 +542,13 @@ class FeatureStore:
             )
 
     def pipeline_names(self) -> frozenset[str]:
-        return frozenset(self._pipelines)
\ No newline at end of file
+        """
+        Registered NAMEs of the configured pipelines (what strategies require).
+        """
+        return frozenset(p.NAME for p in self._pipelines.values())
+
+    def pipeline_keys(self) -> frozenset[str]:
+        """
+        Keys of the configured pipeline instances (readiness is tracked per key).
+        """
+        return frozenset(self._pipelines)
@@ -0,0 +1,120 @@
+from collections.abc import Iterable
+from typing import Final
+
+import numpy as np
+
+_MIN_CAPACITY: Final[int] = 1024
+_GROWTH_FACTOR: Final[int] = 2
+
+
+class HistoryBuffer:
+    """
+    Float64 history backed by a preallocated NumPy array.
+
+    - unbounded (maxlen=None): capacity grows geometrically, `append()` is amortized O(1)
+    - bounded (maxlen=N): only the last N values are kept, memory stays flat
+    - `view()` returns a read-only view of the retained values (no copy)
+
+    Values already written are never overwritten in place: a view taken at
+    step t keeps describing the history as of step t, even after later appends
+    or a reallocation.
+    """
+    __slots__ = ("_buf", "_start", "_size", "_maxlen")
+
+    def __init__(
+            self,
+            initial_capacity: int = _MIN_CAPACITY,
+            maxlen: int | None = None,
+    ):
+        if initial_capacity <= 0:
+            raise ValueError("initial_capacity must be positive")
+        if maxlen is not None and maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        capacity = initial_capacity if maxlen is None else _GROWTH_FACTOR * maxlen
+        self._buf: np.ndarray = np.empty(capacity, dtype=np.float64)
+        self._start: int = 0
+        self._size: int = 0
+        self._maxlen: Final[int | None] = maxlen
+
+    @property
+    def maxlen(self) -> int | None:
+        return self._maxlen
+
+    def __len__(self) -> int:
+        return self._size - self._start
+
+    def append(self, value: float) -> None:
+        if self._size == self._buf.shape[0]:
+            if self._maxlen is None:
+                self._grow()
+            else:
+                self._roll()
+        self._buf[self._size] = value
+        self._size += 1
+        if self._maxlen is not None and self._size - self._start > self._maxlen:
+            self._start += 1
+
+    def extend(self, values: np.ndarray) -> None:
+        """
+        Append a block of values at once (same result as appending one by one).
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if self._maxlen is not None and values.shape[0] >= self._maxlen:
+            self.clear()
+            values = values[-self._maxlen:]
+        n = values.shape[0]
+        if self._size + n > self._buf.shape[0]:
+            if self._maxlen is None:
+                capacity = self._buf.shape[0]
+                while capacity < self._size + n:
+                    capacity *= _GROWTH_FACTOR
+                new_buf = np.empty(capacity, dtype=np.float64)
+                new_buf[:self._size] = self._buf[:self._size]
+                self._buf = new_buf
+            else:
+                self._roll()
+        self._buf[self._size:self._size + n] = values
+        self._size += n
+        if self._maxlen is not None and self._size - self._start > self._maxlen:
+            self._start = self._size - self._maxlen
+
+    def view(self) -> np.ndarray:
+        v = self._buf[self._start:self._size]
+        v.flags.writeable = False
+        return v
+
+    def clear(self) -> None:
+        # Fresh storage: views handed out before the reset stay untouched.
+        self._buf = np.empty(self._buf.shape[0], dtype=np.float64)
+        self._start = 0
+        self._size = 0
+
+    def _grow(self) -> None:
+        new_buf = np.empty(self._buf.shape[0] * _GROWTH_FACTOR, dtype=np.float64)
+        new_buf[:self._size] = self._buf[:self._size]
+        self._buf = new_buf
+
+    def _roll(self) -> None:
+        # Move the retained window to the front of a fresh array (amortized O(1):
+        # happens once every `maxlen` appends).
+        kept = self._size - self._start
+        new_buf = np.empty(self._buf.shape[0], dtype=np.float64)
+        new_buf[:kept] = self._buf[self._start:self._size]
+        self._buf = new_buf
+        self._start = 0
+        self._size = kept
+
+
+def combine_lookbacks(lookbacks: Iterable[int | None]) -> int | None:
+    """
+    Largest declared lookback, or None (unbounded) if any component did not
+    declare one: an undeclared reader may look arbitrarily far back.
+    """
+    result = 1
+    for lb in lookbacks:
+        if lb is None:
+            return None
+        if lb <= 0:
+            raise ValueError(f"max_lookback must be positive, got {lb}")
+        result = max(result, lb)
+    return result
@@ -1,7 +1,36 @@
+from collections.abc import Iterator, Mapping
 from types import MappingProxyType
 
+import numpy as np
+
 from investiq.api.market import MarketDataEvent, MarketField, MarketSate
-from investiq.core.errors import ContextNotInitializedError
+from investiq.core.errors import CheckpointError, ContextNotInitializedError, StaleSnapshotError
+from investiq.core.history_buffer import HistoryBuffer
+
+
+class _StepMarketHistory(Mapping[MarketField, np.ndarray]):
+    """
+    Lazy history mapping bound to one ingest step of a MarketStateBuilder.
+    Views are created on access; reading it after the next ingest raises.
+    """
+    __slots__ = ("_builder", "_epoch")
+
+    def __init__(self, builder: "MarketStateBuilder", epoch: int):
+        self._builder = builder
+        self._epoch = epoch
+
+    def __getitem__(self, field: MarketField) -> np.ndarray:
+        if self._epoch != self._builder._epoch:
+            raise StaleSnapshotError(
+                "Market history snapshot used after the MarketStateBuilder moved to a new step"
+            )
+        return self._builder._history[field].view()
+
+    def __iter__(self) -> Iterator[MarketField]:
+        return iter(self._builder._history)
+
+    def __len__(self) -> int:
+        return len(self._builder._history)
 
 
 class MarketStateBuilder:
@@ -11,22 +40,86 @@ class MarketStateBuilder:
     Updates rolling per-field history at each event and exposes an immutable
     MarketState snapshot via `view()`, ensuring downstream components read a
     consistent, read-only representation of the latest market data.
+
+    History is stored in array-backed buffers: `view()` hands out read-only
+    NumPy views instead of copies, so building a snapshot is O(1) per bar.
+    With `max_lookback` set, only the last `max_lookback` bars are retained.
     """
-    def __init__(self):
+    def __init__(self, max_lookback: int | None = None):
         self._snapshot: MarketDataEvent | None = None
-        self._history: dict[MarketField, list[float]] = {}
+        self._max_lookback: int | None = max_lookback
+        self._history: dict[MarketField, HistoryBuffer] = {}
+        self._state: MarketSate | None = None
+        self._epoch: int = 0
+
+    @property
+    def max_lookback(self) -> int | None:
+        return self._max_lookback
+
+    def set_max_lookback(self, max_lookback: int | None) -> None:
+        """
+        Bound the retained history. Must be called before the first ingest.
+        """
+        if self._snapshot is not None:
+            raise ValueError("max_lookback must be set before the first ingest")
+        self._max_lookback = max_lookback
 
     def ingest(self, event: MarketDataEvent) -> None:
         self._snapshot = event
+        self._state = None
+        self._epoch += 1
         for k, v in event.bar.items():
-            self._history.setdefault(MarketField(k), []).append(v)
+            buf = self._history.get(k)
+            if buf is None:
+                buf = self._history[MarketField(k)] = HistoryBuffer(maxlen=self._max_lookback)
+            buf.append(v)
 
     def view(self) -> MarketSate:
         if self._snapshot is None:
             raise ContextNotInitializedError("No MarketEvent processed yet")
-        # freeze lists into tuples (no accidental mutation)
-        frozen = {k: tuple(v) for k, v in self._history.items()}
+        # built once per ingest; read-only views (no accidental mutation)
+        if self._state is None:
+            frozen = {k: buf.view() for k, buf in self._history.items()}
+            self._state = MarketSate(
+                snapshot=self._snapshot,
+                history=MappingProxyType(frozen),
+            )
+        return self._state
+
+    def lazy_view(self) -> MarketSate:
+        """
+        O(1) snapshot whose history views are only created when a field is read.
+        The history mapping is only valid until the next `ingest()`.
+        """
+        if self._snapshot is None:
+            raise ContextNotInitializedError("No MarketEvent processed yet")
         return MarketSate(
             snapshot=self._snapshot,
-            history=MappingProxyType(frozen),
-        )
\ No newline at end of file
+            history=_StepMarketHistory(self, self._epoch),
+        )
+
+    def get_state(self) -> dict[str, object]:
+        """
+        Checkpoint state: latest event and a copy of the retained history.
+        """
+        return {
+            "snapshot": self._snapshot,
+            "history": {k: buf.view().copy() for k, buf in self._history.items()},
+        }
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        """
+        Restore a `get_state()` checkpoint into an empty builder.
+        History is re-bounded to this builder's `max_lookback`.
+        """
+        if self._snapshot is not None:
+            raise CheckpointError("MarketStateBuilder state can only be restored before the first ingest")
+        history: dict[MarketField, HistoryBuffer] = {}
+        for k, values in state["history"].items():
+            buf = HistoryBuffer(maxlen=self._max_lookback)
+            buf.extend(values)
+            history[MarketField(k)] = buf
+        self._history = history
+        self._snapshot = state["snapshot"]
+        self._state = None
+        self._epoch += 1
@@ -0,0 +1,103 @@
+from collections.abc import Mapping
+
+from investiq.api.backtest import MultiBacktestInput
+from investiq.api.execution import MultiRunResult
+from investiq.core.engine import BacktestEngine
+from investiq.core.invariants import BacktestInvariantError
+from investiq.execution.portfolio.account import CashAccount
+from investiq.market_data.feeds.merge import merge_feeds
+from investiq.utilities.logger.factory import LoggerFactory
+
+
+class MultiInstrumentEngine:
+    """
+    Backtests several instruments on one timeline with shared capital.
+
+    Each symbol keeps its own BacktestEngine (market and feature state,
+    strategy, planner, transition engine and FIFO queues); their portfolios
+    draw on one CashAccount. Feeds are heap-merged by timestamp and each bar
+    is dispatched to its symbol's engine only, so the per-bar cost is
+    O(log k) in the number of symbols k rather than O(k).
+
+    Each engine checks its own stop conditions: once one fires, that symbol
+    receives no further bars and its RunResult carries the `stop_reason`;
+    the run ends when every symbol has stopped or the feeds are exhausted.
+    """
+
+    def __init__(
+            self,
+            logger_factory: LoggerFactory,
+            engines: Mapping[str, BacktestEngine],
+            account: CashAccount,
+    ):
+        if not engines:
+            raise ValueError("MultiInstrumentEngine requires at least one engine")
+        self._logger = logger_factory.child("MultiInstrumentEngine").get()
+        self._engines = dict(engines)
+        self._account = account
+
+    def run(self, bt_input: MultiBacktestInput) -> MultiRunResult:
+        inputs = bt_input.inputs
+        if set(inputs) != set(self._engines):
+            raise ValueError(
+                f"Inputs {sorted(inputs)} do not match engine symbols {sorted(self._engines)}"
+            )
+        engines = self._engines
+        account = self._account
+
+        for symbol, bt in inputs.items():
+            engines[symbol].prepare(bt)
+        feeds = {symbol: engines[symbol].pending(bt.events) for symbol, bt in inputs.items()}
+        self._logger.info(f"Merging {len(feeds)} feeds")
+
+        # Cash version each engine's cached ExecutionView was built against:
+        # a fill on one symbol only invalidates the others lazily, on their next bar.
+        seen = dict.fromkeys(engines, account.version)
+        active = {symbol for symbol, engine in engines.items() if engine.stop_reason is None}
+        for symbol, event in merge_feeds(feeds):
+            if symbol not in active:
+                continue
+            engine = engines[symbol]
+            if seen[symbol] != account.version:
+                engine.invalidate_execution_view()
+            engine.process(event)
+            seen[symbol] = account.version
+            if engine.stop_reason is not None:
+                active.discard(symbol)
+                if not active:
+                    self._logger.info("Every symbol stopped early")
+                    break
+
+        for engine in engines.values():
+            engine.finish()
+
+        results = {
+            symbol: engines[symbol].result(bt.instrument, stop_reason=engines[symbol].stop_reason, tz=bt.tz)
+            for symbol, bt in inputs.items()
+            if engines[symbol].bars
+        }
+        if not results:
+            raise BacktestInvariantError("No events provided")
+
+        metrics = {
+            "Realized PnL": float(sum(r.metrics["Realized PnL"] for r in results.values())),
+            "Unrealized PnL": float(sum(r.metrics["Unrealized PnL"] for r in results.values())),
+            "Final Cash": float(account.cash),
+            "Open Positions": float(sum(1 for r in results.values() if r.metrics["Final Position"])),
+        }
+
+        return MultiRunResult(
+            run_id="run_id",
+            start=min(r.start for r in results.values()),
+            end=max(r.end for r in results.values()),
+            metrics=metrics,
+            results=results,
+        )
+
+    @property
+    def engines(self) -> Mapping[str, BacktestEngine]:
+        return self._engines
+
+    @property
+    def account(self) -> CashAccount:
+        return self._account
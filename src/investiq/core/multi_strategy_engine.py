@@ -0,0 +1,113 @@
+from collections.abc import Mapping
+
+from investiq.api.backtest import BacktestInput, ColumnarSource
+from investiq.api.execution import MultiRunResult
+from investiq.core.engine import BacktestEngine
+from investiq.core.features.store import FeatureStore
+from investiq.core.history_buffer import combine_lookbacks
+from investiq.core.invariants import BacktestInvariantError
+from investiq.utilities.logger.factory import LoggerFactory
+
+
+class MultiStrategyEngine:
+    """
+    Runs N strategy stacks (orchestrator + planner + transition engine +
+    portfolio, each a BacktestEngine) over one shared market state.
+
+    All engines must share the same MarketStateBuilder; engines whose
+    strategies require the same pipelines with the same parameters should
+    also share a FeatureStore (see `bootstrap_multi_strategy_engine`). Each
+    bar is ingested once into the market store and once into every distinct
+    FeatureStore, then evaluated by every stack.
+
+    Each stack checks its own stop conditions: once one fires, the stack is
+    no longer evaluated and its RunResult carries the `stop_reason`; the
+    shared stores keep ingesting for the other stacks.
+    """
+
+    def __init__(
+            self,
+            logger_factory: LoggerFactory,
+            engines: Mapping[str, BacktestEngine],
+            precompute_features: bool = False,
+    ):
+        if not engines:
+            raise ValueError("MultiStrategyEngine requires at least one engine")
+        self._logger = logger_factory.child("MultiStrategyEngine").get()
+        self._engines = dict(engines)
+        self._precompute_features = precompute_features
+
+        markets = {id(e.market_store): e.market_store for e in self._engines.values()}
+        if len(markets) != 1:
+            raise ValueError("All engines of a MultiStrategyEngine must share one MarketStateBuilder")
+        self._market = next(iter(markets.values()))
+        self._feature_stores: list[FeatureStore] = list(
+            {id(e.feature_store): e.feature_store for e in self._engines.values()}.values()
+        )
+
+        # Each engine sized the shared buffers to its own lookback: resize to the largest
+        self._market.set_max_lookback(combine_lookbacks(e.max_lookback for e in self._engines.values()))
+        for store in self._feature_stores:
+            store.set_max_lookback(combine_lookbacks(
+                e.max_lookback for e in self._engines.values() if e.feature_store is store
+            ))
+        self._logger.info(
+            f"{len(self._engines)} strategy stacks over {len(self._feature_stores)} feature store(s)"
+        )
+
+    def run(self, bt_input: BacktestInput) -> MultiRunResult:
+        if self._precompute_features:
+            if not isinstance(bt_input.events, ColumnarSource):
+                raise BacktestInvariantError(
+                    "precompute_features requires events exposing columns() (e.g. DataFrameBacktestFeed)"
+                )
+            columns = bt_input.events.columns()
+            for store in self._feature_stores:
+                # Continuing a run: recompute over the new feed, keep the row cursor
+                state = store.get_state() if store.is_precomputed else None
+                if state is not None:
+                    store.reset()
+                store.precompute(columns)
+                if state is not None:
+                    store.set_state(state)
+
+        engines = list(self._engines.values())
+        market = self._market
+        stores = self._feature_stores
+        active = [engine for engine in engines if engine.stop_reason is None]
+        # Active engines advance in lockstep, ahead of (or with) stopped ones:
+        # the furthest one knows where the run stopped
+        lead = max(engines, key=lambda e: e.bars)
+        for event in lead.pending(bt_input.events):
+            if not active:
+                self._logger.info("Every strategy stack stopped early")
+                break
+            market.ingest(event=event)
+            for store in stores:
+                store.ingest(market_store=market)
+            for engine in active:
+                engine.process(event, ingested=True)
+            if any(engine.stop_reason is not None for engine in active):
+                active = [engine for engine in active if engine.stop_reason is None]
+
+        for engine in engines:
+            engine.finish()
+        results = {
+            name: engine.result(bt_input.instrument, stop_reason=engine.stop_reason, tz=bt_input.tz)
+            for name, engine in self._engines.items()
+        }
+
+        return MultiRunResult(
+            run_id="run_id",
+            start=min(r.start for r in results.values()),
+            end=max(r.end for r in results.values()),
+            metrics={
+                "Strategies": float(len(engines)),
+                "Feature Stores": float(len(stores)),
+            },
+            results=results,
+        )
+
+    @property
+    def engines(self) -> Mapping[str, BacktestEngine]:
+        return self._engines
@@ -1,9 +1,14 @@
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 
 from investiq.api.backtest import BacktestView
 from investiq.api.execution import Decision
 from investiq.api.filter import Filter
+from investiq.api.market import MarketField
 from investiq.api.strategy import Strategy
+from investiq.core.diagnostics import DiagnosticsLevel, DiagnosticsSummary
+from investiq.core.features.factory import PipelineSpec, pipeline_specs
+from investiq.core.history_buffer import combine_lookbacks
+from investiq.core.profiling import Stage, StageProfiler
 
 
 class StrategyOrchestrator:
@@ -11,13 +16,15 @@ class StrategyOrchestrator:
     - consumes a read-only view (BacktestView), never a mutable context
     - strategy + filters are pure transformations (no state mutation)
     - invariants are checked at the boundary
-    - diagnostics are aggregated deterministically
+    - diagnostics are aggregated deterministically, at the configured level
+      (off / summary / full, see DiagnosticsLevel)
     """
     def __init__(
             self,
             available_pipelines: frozenset[str],
             strategy: Strategy,
-            filters: Sequence[Filter] | None = None
+            filters: Sequence[Filter] | None = None,
+            diagnostics_level: DiagnosticsLevel = DiagnosticsLevel.FULL,
     ):
         # --- CONFIG VALIDATION  ---
         required = strategy.metadata.required_pipelines
@@ -29,19 +36,111 @@ class StrategyOrchestrator:
             )
         self._strategy = strategy
         self._filters = list(filters) if filters else []
+        self._diagnostics_level = DiagnosticsLevel(diagnostics_level)
+        self._summary = DiagnosticsSummary()
 
-    def run(self, *, view: BacktestView) -> Decision:
+    @property
+    def diagnostics_level(self) -> DiagnosticsLevel:
+        return self._diagnostics_level
 
-        d0 = self._strategy.decide(view=view)
+    def set_diagnostics_level(self, level: DiagnosticsLevel) -> None:
+        self._diagnostics_level = DiagnosticsLevel(level)
+        self._summary.reset()
+
+    def diagnostics_summary(self) -> dict[str, object]:
+        """
+        Aggregated counters (only populated at DiagnosticsLevel.SUMMARY).
+        """
+        return self._summary.summary()
 
-        diagnostics = {
-            "strategy": {self._strategy.metadata.name: d0.diagnostics},
-            "filters": []
+    @property
+    def pipeline_specs(self) -> list[PipelineSpec]:
+        """
+        Feature pipelines (with parameters) the strategy needs.
+        """
+        return pipeline_specs(self._strategy.metadata)
+
+    @property
+    def config(self) -> dict[str, object]:
+        """
+        Identity of the strategy stack (used to validate checkpoints).
+        """
+        return {
+            "strategy": self._strategy.metadata.name,
+            "strategy_parameters": dict(self._strategy.metadata.parameters),
+            "filters": [(f.metadata.name, dict(f.metadata.parameters)) for f in self._filters],
         }
-        d = d0
+
+    def get_state(self) -> dict[str, object]:
+        return {"diagnostics_summary": self._summary.get_state()}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self._summary.set_state(state["diagnostics_summary"])
+
+    @property
+    def required_lookback(self) -> int | None:
+        """
+        Largest history lookback declared by the strategy and its filters (None = unbounded).
+        """
+        return combine_lookbacks(
+            [self._strategy.metadata.max_lookback]
+            + [f.metadata.max_lookback for f in self._filters]
+        )
+
+    @property
+    def required_fields(self) -> frozenset[MarketField]:
+        """
+        Market fields whose history the strategy and its filters may read.
+        """
+        fields = set(self._strategy.metadata.required_fields)
         for f in self._filters:
-            d = f.apply(view=view, decision=d)
-            diagnostics["filters"].append({f.metadata.name: d.diagnostics})
+            fields |= f.metadata.required_market_fields
+        return frozenset(fields)
+
+    @property
+    def required_features(self) -> frozenset[str]:
+        """
+        Features the strategy and its filters may read.
+        """
+        features = set(self._strategy.metadata.required_features)
+        for f in self._filters:
+            features |= f.metadata.required_features
+        return frozenset(features)
+
+    def run(
+            self,
+            *,
+            view: BacktestView,
+            profiler: StageProfiler | None = None
+    ) -> Decision:
+
+        t = profiler.start() if profiler is not None else 0
+        d0 = self._strategy.decide(view=view)
+        if profiler is not None:
+            t = profiler.lap(Stage.STRATEGY_DECIDE, t)
+
+        level = self._diagnostics_level
+        d = d0
+        if level is DiagnosticsLevel.FULL:
+            diagnostics = {
+                "strategy": {self._strategy.metadata.name: d0.diagnostics},
+                "filters": []
+            }
+            for f in self._filters:
+                d = f.apply(view=view, decision=d)
+                diagnostics["filters"].append({f.metadata.name: d.diagnostics})
+        else:
+            diagnostics = None
+            if level is DiagnosticsLevel.SUMMARY:
+                self._summary.record_strategy(d0)
+                for f in self._filters:
+                    prev, d = d, f.apply(view=view, decision=d)
+                    self._summary.record_filter(f.metadata.name, prev, d)
+            else:
+                for f in self._filters:
+                    d = f.apply(view=view, decision=d)
+        if profiler is not None:
+            profiler.lap(Stage.FILTERS, t)
 
         return Decision(
             timestamp=d.timestamp,
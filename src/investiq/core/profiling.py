@@ -0,0 +1,117 @@
+from enum import StrEnum
+from time import perf_counter_ns
+from typing import Final
+
+# Bucket b holds durations d (ns) with d.bit_length() == b, i.e. 2**(b-1) <= d < 2**b.
+_N_BUCKETS: Final[int] = 64
+
+
+class Stage(StrEnum):
+    MARKET_INGEST = "market_ingest"
+    FEATURE_INGEST = "feature_ingest"
+    VIEW_BUILD = "view_build"
+    STRATEGY_DECIDE = "strategy_decide"
+    FILTERS = "filters"
+    PLANNER = "planner"
+    TRANSITION = "transition"
+    PORTFOLIO = "portfolio"
+
+
+class StageHistogram:
+    """
+    Wall-time distribution of one stage: count, total, min/max and a
+    log2-bucketed histogram of durations in nanoseconds.
+    """
+    __slots__ = ("count", "total_ns", "min_ns", "max_ns", "buckets")
+
+    def __init__(self):
+        self.count: int = 0
+        self.total_ns: int = 0
+        self.min_ns: int = 0
+        self.max_ns: int = 0
+        self.buckets: list[int] = [0] * _N_BUCKETS
+
+    def record(self, duration_ns: int) -> None:
+        if self.count == 0 or duration_ns < self.min_ns:
+            self.min_ns = duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self.count += 1
+        self.total_ns += duration_ns
+        self.buckets[min(duration_ns.bit_length(), _N_BUCKETS - 1)] += 1
+
+    def quantile_ns(self, q: float) -> int:
+        """
+        Upper bound of the histogram bucket holding the q-quantile.
+        """
+        if self.count == 0:
+            return 0
+        rank = q * self.count
+        seen = 0
+        for b, n in enumerate(self.buckets):
+            seen += n
+            if seen >= rank and n:
+                return min(1 << b, self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> dict[str, object]:
+        mean_ns = self.total_ns / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_us": mean_ns / 1e3,
+            "min_us": self.min_ns / 1e3,
+            "p50_us": self.quantile_ns(0.50) / 1e3,
+            "p90_us": self.quantile_ns(0.90) / 1e3,
+            "p99_us": self.quantile_ns(0.99) / 1e3,
+            "max_us": self.max_ns / 1e3,
+            # upper bound (ns) -> count, non-empty buckets only
+            "histogram_ns": {1 << b: n for b, n in enumerate(self.buckets) if n},
+        }
+
+
+class StageProfiler:
+    """
+    Opt-in per-stage wall-time recorder for BacktestEngine.step.
+
+    Uses the monotonic `perf_counter_ns` clock. Usage:
+        t = profiler.start()
+        ...stage...
+        t = profiler.lap(Stage.PLANNER, t)
+    """
+    __slots__ = ("_stages",)
+
+    def __init__(self):
+        self._stages: dict[Stage, StageHistogram] = {s: StageHistogram() for s in Stage}
+
+    @staticmethod
+    def start() -> int:
+        return perf_counter_ns()
+
+    def lap(self, stage: Stage, t0: int) -> int:
+        """
+        Record the time elapsed since `t0` for `stage`; return the current time.
+        """
+        now = perf_counter_ns()
+        self._stages[stage].record(now - t0)
+        return now
+
+    def reset(self) -> None:
+        self._stages = {s: StageHistogram() for s in Stage}
+
+    def histogram(self, stage: Stage) -> StageHistogram:
+        return self._stages[stage]
+
+    def summary(self) -> dict[str, dict[str, object]]:
+        """
+        Per-stage summary, plus each stage's share of total recorded time.
+        """
+        total = sum(h.total_ns for h in self._stages.values())
+        out: dict[str, dict[str, object]] = {}
+        for stage, h in self._stages.items():
+            if h.count == 0:
+                continue
+            s = h.summary()
+            s["share"] = h.total_ns / total if total else 0.0
+            out[stage.value] = s
+        return out
@@ -0,0 +1,161 @@
+import time
+from collections.abc import Mapping
+from typing import ClassVar, Protocol, runtime_checkable
+
+from investiq.runs.audit import StepRecord
+
+
+@runtime_checkable
+class StopCondition(Protocol):
+    """
+    Early-termination rule evaluated by BacktestEngine.run after every bar.
+
+    - start(): called before the first bar of an engine; not called again
+      when a run continues or resumes from a checkpoint
+    - check(record): None to continue, or the reason the run must stop
+
+    Conditions holding state across bars also implement SupportsCheckpoint
+    (get_state / set_state), so that a resumed run stops where an
+    uninterrupted one would.
+    """
+    NAME: ClassVar[str]
+
+    def start(self) -> None:
+        ...
+
+    def check(self, record: StepRecord) -> str | None:
+        ...
+
+
+def _equity(record: StepRecord) -> float:
+    # Cash is moved by full notional, so equity marks the position at the close.
+    # With cash shared across instruments, only this instrument's own cash
+    # flows count: the other instruments' fills must not look like a loss.
+    ex = record.execution_after
+    cash = ex.cash if ex.instrument_cash is None else ex.instrument_cash
+    return cash + ex.current_position * record.event.bar.close
+
+
+class MaxDrawdown:
+    """
+    Stop once equity falls `max_drawdown` below its running peak; a fraction
+    of the peak when `relative=True`, a currency amount otherwise.
+    """
+    NAME: ClassVar[str] = "MaxDrawdown"
+
+    def __init__(self, max_drawdown: float, relative: bool = True):
+        if max_drawdown <= 0:
+            raise ValueError("max_drawdown must be positive")
+        self._max_drawdown = max_drawdown
+        self._relative = relative
+        self._peak: float | None = None
+
+    def start(self) -> None:
+        pass
+
+    def check(self, record: StepRecord) -> str | None:
+        equity = _equity(record)
+        if self._peak is None or equity > self._peak:
+            self._peak = equity
+            return None
+        drawdown = self._peak - equity
+        if self._relative:
+            drawdown /= self._peak
+        if drawdown >= self._max_drawdown:
+            return f"{self.NAME}: drawdown {drawdown:.6g} >= {self._max_drawdown:.6g}"
+        return None
+
+    def get_state(self) -> dict[str, object]:
+        return {"peak": self._peak}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self._peak = state["peak"]
+
+
+class MinEquity:
+    """
+    Stop once equity falls below `min_equity`.
+    """
+    NAME: ClassVar[str] = "MinEquity"
+
+    def __init__(self, min_equity: float):
+        self._min_equity = min_equity
+
+    def start(self) -> None:
+        pass
+
+    def check(self, record: StepRecord) -> str | None:
+        equity = _equity(record)
+        if equity < self._min_equity:
+            return f"{self.NAME}: equity {equity:.6g} < {self._min_equity:.6g}"
+        return None
+
+
+class MaxBarsWithoutTrade:
+    """
+    Stop after `max_bars` consecutive bars without any FIFO operation.
+    """
+    NAME: ClassVar[str] = "MaxBarsWithoutTrade"
+
+    def __init__(self, max_bars: int):
+        if max_bars <= 0:
+            raise ValueError("max_bars must be positive")
+        self._max_bars = max_bars
+        self._idle = 0
+
+    def start(self) -> None:
+        pass
+
+    def check(self, record: StepRecord) -> str | None:
+        if record.transition_result:
+            self._idle = 0
+            return None
+        self._idle += 1
+        if self._idle >= self._max_bars:
+            return f"{self.NAME}: {self._idle} bars without a trade"
+        return None
+
+    def get_state(self) -> dict[str, object]:
+        return {"idle": self._idle}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self._idle = state["idle"]
+
+
+class WallClockBudget:
+    """
+    Stop once a run has used `seconds` of wall-clock time.
+    The clock is read every `check_every` bars only. A checkpoint carries the
+    remaining budget, so time spent between save and resume is not counted.
+    """
+    NAME: ClassVar[str] = "WallClockBudget"
+
+    def __init__(self, seconds: float, check_every: int = 1024):
+        if seconds <= 0:
+            raise ValueError("seconds must be positive")
+        if check_every <= 0:
+            raise ValueError("check_every must be positive")
+        self._seconds = seconds
+        self._check_every = check_every
+        self._deadline = 0.0
+        self._countdown = check_every
+
+    def start(self) -> None:
+        self._deadline = time.monotonic() + self._seconds
+        self._countdown = self._check_every
+
+    def check(self, record: StepRecord) -> str | None:
+        self._countdown -= 1
+        if self._countdown:
+            return None
+        self._countdown = self._check_every
+        if time.monotonic() >= self._deadline:
+            return f"{self.NAME}: exceeded {self._seconds:g}s"
+        return None
+
+    def get_state(self) -> dict[str, object]:
+        return {"remaining": self._deadline - time.monotonic(), "countdown": self._countdown}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self._deadline = time.monotonic() + state["remaining"]
+        self._countdown = state["countdown"]
@@ -0,0 +1,99 @@
+from collections.abc import Iterator, Mapping
+from typing import TypeVar
+
+from investiq.api.backtest import BacktestView
+from investiq.api.execution import ExecutionView
+from investiq.api.feature import FeatureSnapshot
+from investiq.api.market import MarketField, MarketSate
+from investiq.core.errors import UndeclaredInputError
+from investiq.core.features.store import FeatureStore
+from investiq.core.market_state_builder import MarketStateBuilder
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class _DeclaredMapping(Mapping[K, V]):
+    """
+    Restricts a mapping to a declared key set.
+
+    Reading an undeclared key raises UndeclaredInputError (not KeyError, so
+    `.get()` does not silently turn the violation into a missing value).
+    """
+    __slots__ = ("_inner", "_declared", "_kind")
+
+    def __init__(self, inner: Mapping[K, V], declared: frozenset[K], kind: str):
+        self._inner = inner
+        self._declared = declared
+        self._kind = kind
+
+    def __getitem__(self, key: K) -> V:
+        if key not in self._declared:
+            raise UndeclaredInputError(
+                f"{self._kind} '{key}' read but not declared by the strategy, filters or planner"
+            )
+        return self._inner[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._declared and key in self._inner
+
+    def __iter__(self) -> Iterator[K]:
+        return (k for k in self._inner if k in self._declared)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class LazyViewBuilder:
+    """
+    Builds the per-bar BacktestView without materializing history.
+
+    Market and feature history are exposed through lazy mappings: an array
+    view is only created for the field or feature actually read. Access is
+    restricted to the declared inputs (`fields`, `features`); anything else
+    raises UndeclaredInputError. The latest bar and pipeline readiness are
+    always available.
+
+    History mappings are only valid for the current step.
+    """
+
+    def __init__(
+            self,
+            fields: frozenset[MarketField],
+            features: frozenset[str],
+    ):
+        self._fields = fields
+        self._features = features
+
+    @property
+    def fields(self) -> frozenset[MarketField]:
+        return self._fields
+
+    @property
+    def features(self) -> frozenset[str]:
+        return self._features
+
+    def build(
+            self,
+            market_store: MarketStateBuilder,
+            feature_store: FeatureStore,
+            execution: ExecutionView,
+            collect_diagnostics: bool = True,
+            ready_mask: int | None = None,
+    ) -> BacktestView:
+        market = market_store.lazy_view()
+        feats = feature_store.view(snapshot_history=False, ready_mask=ready_mask)
+        return BacktestView(
+            market=MarketSate(
+                snapshot=market.snapshot,
+                history=_DeclaredMapping(market.history, self._fields, "Market field"),
+            ),
+            features=FeatureSnapshot(
+                values=_DeclaredMapping(feats.values, self._features, "Feature"),
+                history=_DeclaredMapping(feats.history, self._features, "Feature history"),
+                pipeline_ready=feats.pipeline_ready,
+                global_ready=feats.global_ready,
+            ),
+            execution=execution,
+            collect_diagnostics=collect_diagnostics,
+        )
@@ -0,0 +1,79 @@
+import dataclasses
+from collections.abc import Mapping
+
+from investiq.utilities.logger.factory import LoggerFactory
+from investiq.execution.portfolio.portfolio import Portfolio
+from investiq.execution.transition.types import FIFOOperation
+
+
+class CashAccount:
+    """
+    Cash shared by several InstrumentPortfolios.
+
+    `version` is bumped on every cash change, so holders of cached
+    ExecutionViews can tell when another instrument moved the balance.
+    """
+    __slots__ = ("cash", "version")
+
+    def __init__(self, initial_cash: float):
+        self.cash: float = initial_cash
+        self.version: int = 0
+
+
+class InstrumentPortfolio(Portfolio):
+    """
+    Portfolio of a single instrument (its own position, PnL and FIFO queues)
+    drawing on a CashAccount shared with the other instruments.
+
+    Fills are tagged with the instrument's symbol. `instrument_cash` tracks
+    the initial cash plus this instrument's own cash flows, i.e. the cash a
+    standalone portfolio would hold (the shared balance also moves with the
+    other instruments' fills).
+    """
+
+    def __init__(
+            self,
+            logger_factory: LoggerFactory,
+            account: CashAccount,
+            symbol: str,
+    ):
+        self._account = account
+        self.symbol = symbol
+        self._instrument_cash: float = account.cash
+        super().__init__(logger_factory=logger_factory, initial_cash=account.cash)
+
+    @property
+    def cash(self) -> float:
+        return self._account.cash
+
+    @cash.setter
+    def cash(self, value: float) -> None:
+        if value != self._account.cash:
+            self._instrument_cash += value - self._account.cash
+            self._account.cash = value
+            self._account.version += 1
+
+    @property
+    def instrument_cash(self) -> float:
+        return self._instrument_cash
+
+    @property
+    def account(self) -> CashAccount:
+        return self._account
+
+    def get_state(self) -> dict[str, object]:
+        return {**super().get_state(), "instrument_cash": self._instrument_cash}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        super().set_state(state)
+        self._instrument_cash = state["instrument_cash"]
+
+    def apply_operations(
+            self,
+            operations: list[FIFOOperation]
+    ) -> None:
+        start = len(self.execution_log)
+        super().apply_operations(operations)
+        log = self.execution_log
+        for i in range(start, len(log)):
+            log[i] = dataclasses.replace(log[i], instrument_id=self.symbol)
@@ -1,4 +1,6 @@
+import copy
 from collections import defaultdict
+from collections.abc import Mapping
 
 from investiq.utilities.logger.factory import LoggerFactory
 from investiq.utilities.logger.protocol import LoggerProtocol
@@ -43,4 +45,26 @@ class Portfolio:
         for op in operations:
             strategy: PortfolioExecutionStrategy = self._fifo_exec_factory.create(op_type=op.type)
             execution_log: Fill = strategy.apply(portfolio=self, operation=op)
-            self.append_log_entry(execution_log)
\ No newline at end of file
+            self.append_log_entry(execution_log)
+
+    def get_state(self) -> dict[str, object]:
+        """
+        Checkpoint state: position, cash, PnL, FIFO queues and execution log.
+        FIFO positions are mutable, so the queues are deep-copied.
+        """
+        return {
+            "current_position": self.current_position,
+            "cash": self.cash,
+            "realized_pnl": self.realized_pnl,
+            "unrealized_pnl": self.unrealized_pnl,
+            "fifo_queues": copy.deepcopy(dict(self.fifo_queues)),
+            "execution_log": list(self.execution_log),
+        }
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self.current_position = state["current_position"]
+        self.cash = state["cash"]
+        self.realized_pnl = state["realized_pnl"]
+        self.unrealized_pnl = state["unrealized_pnl"]
+        self.fifo_queues = defaultdict(list, copy.deepcopy(state["fifo_queues"]))
+        self.execution_log = list(state["execution_log"])
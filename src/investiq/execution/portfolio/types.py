@@ -1,21 +1,21 @@
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Optional
 
+from investiq.api.market import EventTime
 from investiq.execution.transition.enums import FIFOOperationType, FIFOSide
 from investiq.execution.transition.types import FIFOOperation
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PortfolioSignal:
-    timestamp: datetime
+    timestamp: EventTime
     price: float
     target_position: float
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Fill:
 
-    timestamp: datetime
+    timestamp: EventTime
     operation_type : FIFOOperationType
     side : FIFOSide
 
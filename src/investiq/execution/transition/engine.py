@@ -1,30 +1,92 @@
-from investiq.api.execution import Decision
+import logging
+from collections.abc import Mapping
+
 from investiq.api.planner import ExecutionPlan
 from investiq.execution.transition.fifo.resolver import FIFOResolver
 from investiq.utilities.logger.factory import LoggerFactory
-from investiq.execution.transition.enums import FIFOSide, TransitionType
+from investiq.execution.transition.enums import CurrentState, Event, FIFOSide, TransitionType
 from investiq.execution.transition.logs import TransitionLog
-from investiq.execution.transition.rules.api import TransitionRule
-from investiq.execution.transition.rules.classifier import compute_key
+from investiq.execution.transition.rules.api import TransitionKey, TransitionRule
 from investiq.execution.transition.rules.factory import TransitionRuleFactory
 from investiq.execution.transition.strategies.api import TransitionStrategy
 from investiq.execution.transition.strategies.factory import TransitionStrategyFactory
 from investiq.execution.transition.types import FIFOPosition, FIFOOperation, AtomicAction
 
+# Sign (-1, 0, +1) -> enum member, matching `compute_key`.
+_STATE_BY_SIGN: dict[int, CurrentState] = {-1: CurrentState.SHORT, 0: CurrentState.FLAT, 1: CurrentState.LONG}
+_EVENT_BY_SIGN: dict[int, Event] = {-1: Event.GO_SHORT, 0: Event.GO_FLAT, 1: Event.GO_LONG}
+
+
+def _dispatch_index(current_position: float, target_position: float) -> int:
+    """
+    Flat index of the (state, event) cell in the 3x3 dispatch table.
+    """
+    state = (current_position > 0) - (current_position < 0)
+    event = (target_position > 0) - (target_position < 0)
+    return (state + 1) * 3 + (event + 1)
+
 
 class TransitionEngine:
+    """
+    Resolves (current_position, target_position) into FIFO operations.
+
+    The (state, event) space is compiled at construction into a 3x3 table of
+    rule instances, and every TransitionType into a strategy instance: per-bar
+    dispatch is one indexed lookup, with no registry access or instantiation.
+
+    Audit logs are only built when DEBUG logging or `audit` is enabled.
+
+    Fast path: an unchanged target (target == current) skips classification,
+    strategy and FIFO resolution entirely (see `process_unchanged`).
+    """
 
     def __init__(
             self,
             logger_factory: LoggerFactory,
+            audit: bool = False,
     ) -> None:
         self._logger_factory : LoggerFactory = logger_factory
         self._logger = logger_factory.child("TransitionEngine").get()
-        self._transition_rule_factory =  TransitionRuleFactory()
-        self._transition_strategy_factory = TransitionStrategyFactory()
         self._fifo_resolver = FIFOResolver()
         self._last_resolution : TransitionLog | None = None
 
+        # 1. Compile dispatch tables (fail fast on missing registrations)
+        self._keys: list[TransitionKey] = [
+            TransitionKey(state=_STATE_BY_SIGN[s], event=_EVENT_BY_SIGN[e])
+            for s in (-1, 0, 1)
+            for e in (-1, 0, 1)
+        ]
+        self._rules: list[TransitionRule] = [TransitionRuleFactory.create(key=k) for k in self._keys]
+        self._strategies: dict[TransitionType, TransitionStrategy] = {
+            t: TransitionStrategyFactory.create(transition_type=t) for t in TransitionType
+        }
+
+        # 2. Audit / logging switches
+        self._audit = audit
+        self._transition_log: list[TransitionLog] = []
+        self._log_enabled = self._logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def transition_log(self) -> list[TransitionLog]:
+        """
+        Audited transitions (only distinct consecutive resolutions are kept).
+        Empty unless the engine was built with `audit=True`.
+        """
+        return self._transition_log
+
+    def get_state(self) -> dict[str, object]:
+        """
+        Checkpoint state: last resolution (for log de-duplication) and the audit log.
+        """
+        return {
+            "last_resolution": self._last_resolution,
+            "transition_log": list(self._transition_log),
+        }
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self._last_resolution = state["last_resolution"]
+        self._transition_log = list(state["transition_log"])
+
     def process(
             self,
             plan: ExecutionPlan,
@@ -32,21 +94,20 @@ class TransitionEngine:
             fifo_queues : dict[FIFOSide, list[FIFOPosition]],
     ) -> list[FIFOOperation]:
 
-        # 1. Build context
-        key = compute_key(
-            current_position=current_position,
-            target_position=plan.target_position
-        )
+        # 0. Fast path: nothing to do
+        if plan.target_position == current_position:
+            return self.process_unchanged(plan=plan, current_position=current_position)
+
+        # 1. Dispatch: one indexed lookup
+        idx = _dispatch_index(current_position, plan.target_position)
         # 2. Get the transition rule and resolve transition
-        rule: TransitionRule = self._transition_rule_factory.create(key=key)
+        rule: TransitionRule = self._rules[idx]
         transition_type: TransitionType = rule.classify(
             current_position=current_position,
             target_position=plan.target_position
         )
         # 3. Get the transition strategy and resolve the atomic actions
-        strategy : TransitionStrategy = self._transition_strategy_factory.create(
-            transition_type=transition_type
-        )
+        strategy : TransitionStrategy = self._strategies[transition_type]
         atomic_actions: list[AtomicAction] = strategy.resolve(
             current_position=current_position,
             target_position=plan.target_position,
@@ -58,23 +119,74 @@ class TransitionEngine:
             fifo_queues=fifo_queues,
             execution_price=plan.execution_price
         )
-        # 5.Build Audit Log
+        # 5. Build Audit Log (only if someone consumes it)
+        if self._log_enabled or self._audit:
+            self._record(
+                idx=idx,
+                current_position=current_position,
+                target_position=plan.target_position,
+                rule=rule,
+                strategy=strategy,
+                transition_type=transition_type,
+                actions_len=len(atomic_actions),
+                fifo_ops_len=len(fifo_operations),
+            )
+        # 6. Return the FIFOOperation list
+        return fifo_operations
+
+    def process_unchanged(
+            self,
+            plan: ExecutionPlan,
+            current_position: float,
+    ) -> list[FIFOOperation]:
+        """
+        Fast path for target == current: always a NO_OP with no actions and
+        no FIFO operations. Audit output is the same as through `process`.
+        """
+        if self._log_enabled or self._audit:
+            idx = _dispatch_index(current_position, plan.target_position)
+            self._record(
+                idx=idx,
+                current_position=current_position,
+                target_position=plan.target_position,
+                rule=self._rules[idx],
+                strategy=self._strategies[TransitionType.NO_OP],
+                transition_type=TransitionType.NO_OP,
+                actions_len=0,
+                fifo_ops_len=0,
+            )
+        return []
+
+    def _record(
+            self,
+            *,
+            idx: int,
+            current_position: float,
+            target_position: float,
+            rule: TransitionRule,
+            strategy: TransitionStrategy,
+            transition_type: TransitionType,
+            actions_len: int,
+            fifo_ops_len: int,
+    ) -> None:
+        key = self._keys[idx]
         log_entry = TransitionLog(
             state=key.state,
             event=key.event,
             current_position=current_position,
-            target_position=plan.target_position,
+            target_position=target_position,
             rule_name=rule.NAME,
             transition_strategy=strategy.NAME,
             transition_type=transition_type.name,
-            actions_len=len(atomic_actions),
-            fifo_ops_len=len(fifo_operations)
+            actions_len=actions_len,
+            fifo_ops_len=fifo_ops_len
         )
         if log_entry != self._last_resolution:
-            self._log_operation(log=log_entry)
+            if self._log_enabled:
+                self._log_operation(log=log_entry)
+            if self._audit:
+                self._transition_log.append(log_entry)
             self._last_resolution = log_entry
-        # 6. Return the FIFOOperation list
-        return fifo_operations
 
     def _log_operation(
             self,
@@ -97,4 +209,4 @@ class TransitionEngine:
             log.transition_type,
             log.actions_len,
             log.fifo_ops_len,
-        )
\ No newline at end of file
+        )
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from investiq.execution.transition.enums import CurrentState, Event
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransitionLog:
     state: CurrentState
     event: Event
@@ -5,7 +5,7 @@ from typing import ClassVar
 from investiq.execution.transition.enums import CurrentState, Event, TransitionType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransitionKey:
     state: CurrentState
     event: Event
@@ -1,4 +1,4 @@
-from datetime import datetime
+from investiq.api.market import EventTime
 from typing import Protocol, runtime_checkable, ClassVar
 
 from investiq.execution.transition.types import AtomicAction
@@ -10,7 +10,7 @@ class TransitionStrategy(Protocol):
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
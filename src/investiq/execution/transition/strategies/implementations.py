@@ -15,7 +15,7 @@ Registration:
 
 from __future__ import annotations
 
-from datetime import datetime
+from investiq.api.market import EventTime
 from typing import ClassVar, Final
 
 from investiq.execution.transition.enums import AtomicActionType, TransitionType
@@ -36,19 +36,19 @@ def _require(cond: bool, msg: str) -> None:
         raise ValueError(msg)
 
 
-def _close_long(*, qty: float, ts: datetime) -> AtomicAction:
+def _close_long(*, qty: float, ts: EventTime) -> AtomicAction:
     return AtomicAction(type=AtomicActionType.CLOSE_LONG, quantity=qty, timestamp=ts)
 
 
-def _open_long(*, qty: float, ts: datetime) -> AtomicAction:
+def _open_long(*, qty: float, ts: EventTime) -> AtomicAction:
     return AtomicAction(type=AtomicActionType.OPEN_LONG, quantity=qty, timestamp=ts)
 
 
-def _close_short(*, qty: float, ts: datetime) -> AtomicAction:
+def _close_short(*, qty: float, ts: EventTime) -> AtomicAction:
     return AtomicAction(type=AtomicActionType.CLOSE_SHORT, quantity=qty, timestamp=ts)
 
 
-def _open_short(*, qty: float, ts: datetime) -> AtomicAction:
+def _open_short(*, qty: float, ts: EventTime) -> AtomicAction:
     return AtomicAction(type=AtomicActionType.OPEN_SHORT, quantity=qty, timestamp=ts)
 
 
@@ -65,7 +65,7 @@ class NoOpStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -86,7 +86,7 @@ class OpenLongStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -111,7 +111,7 @@ class OpenShortStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -136,7 +136,7 @@ class CloseLongStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -161,7 +161,7 @@ class CloseShortStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -186,7 +186,7 @@ class IncreaseLongStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -212,7 +212,7 @@ class IncreaseShortStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -238,7 +238,7 @@ class ReduceLongStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -268,7 +268,7 @@ class ReduceShortStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -300,7 +300,7 @@ class ReversalToLongStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
@@ -330,7 +330,7 @@ class ReversalToShortStrategy:
     def resolve(
         self,
         *,
-        timestamp: datetime,
+        timestamp: EventTime,
         current_position: float,
         target_position: float,
     ) -> list[AtomicAction]:
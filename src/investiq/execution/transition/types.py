@@ -1,20 +1,20 @@
 from dataclasses import dataclass
-from datetime import datetime
 
+from investiq.api.market import EventTime
 from investiq.execution.transition.enums import AtomicActionType, FIFOOperationType, FIFOSide
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtomicAction:
     type : AtomicActionType
     quantity : float
-    timestamp: datetime
+    timestamp: EventTime
 
-@dataclass
+@dataclass(slots=True)
 class FIFOPosition:
     id : int
     is_active : bool
-    timestamp : datetime
+    timestamp : EventTime
     type : FIFOOperationType
     side : FIFOSide
     quantity : float
@@ -28,10 +28,10 @@ class FIFOPosition:
         cls._next_id += 1
         return id_
 
-@dataclass
+@dataclass(slots=True)
 class FIFOOperation:
     id : int
-    timestamp : datetime
+    timestamp : EventTime
     type : FIFOOperationType
     side : FIFOSide
     execution_price : float
@@ -44,7 +44,7 @@ class FIFOOperation:
         cls._next_id += 1
         return id_
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolveContext:
     """
     Unchanging context passed to SafeGuards strategies.
@@ -54,3 +54,18 @@ class ResolveContext:
     action: AtomicAction
     fifo_queues: dict[FIFOSide, list[FIFOPosition]]
     execution_price: float
+
+
+def get_id_counters() -> dict[str, int]:
+    """
+    Current values of the process-wide FIFO id counters (for checkpoints).
+    """
+    return {
+        "FIFOPosition": FIFOPosition._next_id,
+        "FIFOOperation": FIFOOperation._next_id,
+    }
+
+
+def set_id_counters(counters: dict[str, int]) -> None:
+    FIFOPosition._next_id = counters["FIFOPosition"]
+    FIFOOperation._next_id = counters["FIFOOperation"]
@@ -5,7 +5,7 @@ import pandas as pd
 from investiq.execution.portfolio.types import Fill
 from investiq.export_engine.formatters.base_batch_formatter import BatchFormatter
 from investiq.utilities.logger.protocol import LoggerProtocol
-from investiq.utilities.time_utils import format_utc_offset
+from investiq.utilities.time_utils import format_utc_offset, to_timestamp
 
 
 class BacktestDataFrameFormatter(BatchFormatter[Fill, pd.DataFrame]):
@@ -21,7 +21,7 @@ class BacktestDataFrameFormatter(BatchFormatter[Fill, pd.DataFrame]):
     def _format(self, data: Iterable[Fill]) -> pd.DataFrame:
         rows = []
         for entry in data:
-            ts = entry.timestamp
+            ts = to_timestamp(entry.timestamp)
             timezone_str = format_utc_offset(ts)
             ts_naive = ts.replace(tzinfo=None)
             rows.append({
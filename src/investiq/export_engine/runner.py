@@ -1,4 +1,6 @@
+import dataclasses
 from collections.abc import Mapping
+from datetime import tzinfo
 from pathlib import Path
 
 from openpyxl import load_workbook
@@ -8,6 +10,7 @@ from investiq.export_engine.registries.config import ExportKey, ExportOptions
 
 from investiq.utilities.logger.factory import LoggerFactory
 from investiq.execution.portfolio.types import Fill
+from investiq.utilities.time_utils import to_timestamp
 
 
 class BacktestExportRunner:
@@ -32,7 +35,16 @@ class BacktestExportRunner:
         self,
         execution_log: list[Fill],
         metrics: Mapping[str, float] | None = None,
+        tz: tzinfo | str | None = "UTC",
     ) -> None:
+        """
+        Export the execution log (+ metrics sheet). `tz` is the source
+        timezone (RunResult.tz): epoch-ns fill times are exported in it.
+        """
+        execution_log = [
+            dataclasses.replace(f, timestamp=to_timestamp(f.timestamp, tz)) if isinstance(f.timestamp, int) else f
+            for f in execution_log
+        ]
 
         export_service = self._export_service_factory.create_backtest_batch_export_service(
             key=self._export_key,
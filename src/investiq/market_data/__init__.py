@@ -38,6 +38,7 @@ from .adapters.ibkr.data_source import IBKRHistoricalDataSource
 # ===== FEEDS =====
 
 from .feeds.dataframe_feed import DataFrameBacktestFeed
+from .feeds.merge import merge_feeds
 
 
 __all__ = [
@@ -68,4 +69,5 @@ __all__ = [
 
     # feeds
     "DataFrameBacktestFeed",
+    "merge_feeds",
 ]
\ No newline at end of file
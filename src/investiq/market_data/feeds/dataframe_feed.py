@@ -1,12 +1,24 @@
 from collections.abc import Iterator
+from datetime import tzinfo
+
+import numpy as np
 import pandas as pd
 
-from investiq.api.market import MarketDataEvent, OHLCV
+from investiq.api.market import MarketDataEvent, MarketField, OHLCV
 from investiq.market_data.domain.enums import BarSize
 from investiq.utilities.logger.protocol import LoggerProtocol
 
 
 class DataFrameBacktestFeed:
+    """
+    Replays a OHLCV DataFrame (timestamp column or DatetimeIndex) as MarketDataEvents.
+
+    With `epoch_ns=True`, event timestamps are plain int epoch nanoseconds
+    (UTC) instead of pd.Timestamp: they flow unchanged through decisions,
+    plans, FIFO operations and fills, and are only converted back to pandas
+    at the export boundary (`investiq.utilities.time_utils.to_timestamp`),
+    in the source timezone (`tz`).
+    """
 
     def __init__(
         self,
@@ -14,11 +26,36 @@ class DataFrameBacktestFeed:
         df: pd.DataFrame,
         symbol: str,
         bar_size: BarSize,
+        epoch_ns: bool = False,
     ):
         self._logger = logger
         self._df = df
         self._symbol = symbol
         self._bar_size = bar_size
+        self._epoch_ns = epoch_ns
+
+    @property
+    def tz(self) -> tzinfo | None:
+        """
+        Timezone of the source timestamps (None if tz-naive).
+        """
+        df = self._df
+        return pd.DatetimeIndex(df["timestamp"] if "timestamp" in df.columns else df.index).tz
+
+    def columns(self) -> dict[MarketField, np.ndarray]:
+        """
+        Full OHLCV series as float64 arrays, in event order.
+        """
+        df = self._df
+        cols = {
+            f: df[f.value].to_numpy(dtype=np.float64)
+            for f in (MarketField.OPEN, MarketField.HIGH, MarketField.LOW, MarketField.CLOSE)
+        }
+        if MarketField.VOLUME.value in df.columns:
+            cols[MarketField.VOLUME] = df[MarketField.VOLUME.value].to_numpy(dtype=np.float64)
+        else:
+            cols[MarketField.VOLUME] = np.zeros(len(df), dtype=np.float64)
+        return cols
 
     def __iter__(self) -> Iterator[MarketDataEvent]:
 
@@ -30,6 +67,9 @@ class DataFrameBacktestFeed:
         else:
             ts_iter = df.index
             rows = df
+        if self._epoch_ns:
+            # int64 ns since epoch (UTC for tz-aware data), as Python ints
+            ts_iter = pd.DatetimeIndex(ts_iter).asi8.tolist()
 
         prev_ts = None
         n = len(df)
@@ -0,0 +1,40 @@
+import heapq
+from collections.abc import Iterable, Iterator, Mapping
+
+from investiq.api.market import MarketDataEvent
+
+
+def merge_feeds(
+        feeds: Mapping[str, Iterable[MarketDataEvent]],
+) -> Iterator[tuple[str, MarketDataEvent]]:
+    """
+    k-way merge of per-symbol feeds into one (symbol, event) stream ordered by
+    timestamp.
+
+    The heap holds one pending event per feed, so each event costs
+    O(log k) for k feeds. Events with equal timestamps are yielded in feed
+    order (the mapping's order), which keeps runs deterministic. Every feed
+    must itself be in timestamp order and all feeds must use the same
+    timestamp type (pd.Timestamp or epoch-ns int).
+    """
+    heap: list[tuple[object, int, MarketDataEvent, Iterator[MarketDataEvent]]] = []
+    symbols = list(feeds)
+    for i, symbol in enumerate(symbols):
+        it = iter(feeds[symbol])
+        event = next(it, None)
+        if event is not None:
+            heap.append((event.timestamp, i, event, it))
+    heapq.heapify(heap)
+
+    while heap:
+        _, i, event, it = heap[0]
+        yield symbols[i], event
+        nxt = next(it, None)
+        if nxt is None:
+            heapq.heappop(heap)
+        else:
+            if nxt.timestamp < event.timestamp:
+                raise ValueError(
+                    f"Non-monotonic timestamps in feed {symbols[i]}: {nxt.timestamp} < {event.timestamp}"
+                )
+            heapq.heapreplace(heap, (nxt.timestamp, i, nxt, it))
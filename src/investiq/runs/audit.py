@@ -1,18 +1,206 @@
 from collections.abc import Mapping
 from dataclasses import dataclass
+from enum import StrEnum
+from pathlib import Path
+from typing import Final, Protocol, runtime_checkable
 
+import numpy as np
 import pandas as pd
 
 from investiq.api.execution import Decision, ExecutionView
-from investiq.api.market import MarketDataEvent
+from investiq.api.market import EventTime, MarketDataEvent
 from investiq.execution.transition.types import FIFOOperation
+from investiq.utilities.time_utils import to_epoch_ns
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepRecord:
-    timestamp: pd.Timestamp
+    timestamp: EventTime
     event: MarketDataEvent
     decision: Decision
     transition_result: list[FIFOOperation]
     execution_after: ExecutionView
-    diagnostics: Mapping[str, object]
\ No newline at end of file
+    diagnostics: Mapping[str, object]
+
+
+@runtime_checkable
+class AuditSink(Protocol):
+    """
+    Receives every StepRecord of a run, in order.
+
+    - write(record): called once per bar (the sink decides what to keep)
+    - flush(): called by the engine at the end of the run
+    """
+    def write(self, record: StepRecord) -> None:
+        ...
+
+    def flush(self) -> None:
+        ...
+
+
+class AuditSampling(StrEnum):
+    ALL = "all"
+    EVERY_N = "every_n"
+    FILLS_ONLY = "fills_only"
+
+
+# Column name -> dtype of one audit chunk
+AUDIT_COLUMNS: Final[Mapping[str, type]] = {
+    "bar_index": np.int64,
+    "timestamp_ns": np.int64,
+    "open": np.float64,
+    "high": np.float64,
+    "low": np.float64,
+    "close": np.float64,
+    "volume": np.float64,
+    "target_position": np.float64,
+    "execution_price": np.float64,
+    "fifo_ops": np.int32,
+    "position": np.float64,
+    "cash": np.float64,
+    "realized_pnl": np.float64,
+    "unrealized_pnl": np.float64,
+}
+
+
+class ChunkedAuditSink:
+    """
+    Streams StepRecords into fixed-size columnar chunks spilled to disk.
+
+    Each record is flattened into preallocated NumPy columns (see
+    AUDIT_COLUMNS); when `chunk_size` rows are buffered, the chunk is written
+    as `chunk_<n>.npz` (compressed) under `directory` and the buffer reused.
+    Memory is bounded by one chunk regardless of run length.
+
+    Sampling:
+    - ALL: every bar
+    - EVERY_N: bars whose index is a multiple of `every_n`
+    - FILLS_ONLY: bars that produced FIFO operations
+
+    Use `load_audit(directory)` to read the chunks back as a DataFrame.
+
+    Checkpointing (SupportsCheckpoint): `get_state()` spills the buffered
+    rows first, so the chunks on disk hold every bar up to the checkpoint;
+    `set_state()` continues the numbering and drops the chunks written
+    after the checkpoint (their bars are replayed by the resumed run). A
+    fresh sink refuses a directory that already holds chunks.
+    """
+
+    def __init__(
+            self,
+            directory: str | Path,
+            chunk_size: int = 65_536,
+            sampling: AuditSampling = AuditSampling.ALL,
+            every_n: int = 1,
+    ):
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        if every_n <= 0:
+            raise ValueError("every_n must be positive")
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._chunk_size = chunk_size
+        self._sampling = AuditSampling(sampling)
+        self._every_n = every_n
+        self._columns: dict[str, np.ndarray] = {
+            name: np.empty(chunk_size, dtype=dtype) for name, dtype in AUDIT_COLUMNS.items()
+        }
+        self._n: int = 0
+        self._bar_index: int = -1
+        self._chunks: int = 0
+        self._rows_written: int = 0
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    @property
+    def rows_written(self) -> int:
+        return self._rows_written
+
+    def _keep(self, record: StepRecord) -> bool:
+        if self._sampling is AuditSampling.ALL:
+            return True
+        if self._sampling is AuditSampling.EVERY_N:
+            return self._bar_index % self._every_n == 0
+        return len(record.transition_result) > 0
+
+    def write(self, record: StepRecord) -> None:
+        if self._bar_index < 0 and self._chunk_paths():
+            raise FileExistsError(
+                f"{self._dir} already holds audit chunks: use an empty directory or resume from a checkpoint"
+            )
+        self._bar_index += 1
+        if not self._keep(record):
+            return
+        i = self._n
+        c = self._columns
+        bar = record.event.bar
+        ex = record.execution_after
+        c["bar_index"][i] = self._bar_index
+        c["timestamp_ns"][i] = to_epoch_ns(record.timestamp)
+        c["open"][i] = bar.open
+        c["high"][i] = bar.high
+        c["low"][i] = bar.low
+        c["close"][i] = bar.close
+        c["volume"][i] = bar.volume
+        c["target_position"][i] = record.decision.target_position
+        c["execution_price"][i] = record.decision.execution_price
+        c["fifo_ops"][i] = len(record.transition_result)
+        c["position"][i] = ex.current_position
+        c["cash"][i] = ex.cash
+        c["realized_pnl"][i] = ex.realized_pnl
+        c["unrealized_pnl"][i] = ex.unrealized_pnl
+        self._n = i + 1
+        if self._n == self._chunk_size:
+            self._spill()
+
+    def _spill(self) -> None:
+        n = self._n
+        if n == 0:
+            return
+        path = self._dir / f"chunk_{self._chunks:06d}.npz"
+        np.savez_compressed(path, **{name: col[:n] for name, col in self._columns.items()})
+        self._chunks += 1
+        self._rows_written += n
+        self._n = 0
+
+    def flush(self) -> None:
+        self._spill()
+
+    def get_state(self) -> dict[str, object]:
+        self._spill()
+        return {
+            "bar_index": self._bar_index,
+            "chunks": self._chunks,
+            "rows_written": self._rows_written,
+        }
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self._bar_index = state["bar_index"]
+        self._chunks = state["chunks"]
+        self._rows_written = state["rows_written"]
+        self._n = 0
+        for path in self._chunk_paths()[self._chunks:]:
+            path.unlink()
+
+    def _chunk_paths(self) -> list[Path]:
+        return sorted(self._dir.glob("chunk_*.npz"))
+
+
+def load_audit(directory: str | Path) -> pd.DataFrame:
+    """
+    Read the chunks written by a ChunkedAuditSink (in order) into a DataFrame
+    indexed by timestamp (tz-naive, from the stored epoch nanoseconds).
+    """
+    frames: list[pd.DataFrame] = []
+    for path in sorted(Path(directory).glob("chunk_*.npz")):
+        with np.load(path) as data:
+            frames.append(pd.DataFrame({name: data[name] for name in AUDIT_COLUMNS}))
+    if not frames:
+        df = pd.DataFrame({name: np.empty(0, dtype=dtype) for name, dtype in AUDIT_COLUMNS.items()})
+    else:
+        df = pd.concat(frames, ignore_index=True)
+    df.index = pd.to_datetime(df.pop("timestamp_ns"), unit="ns")
+    df.index.name = "timestamp"
+    return df
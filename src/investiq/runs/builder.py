@@ -1,10 +1,24 @@
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+
 from investiq.api.filter import Filter
 from investiq.api.strategy import Strategy
+from investiq.core.checkpoint import CheckpointManager
+from investiq.core.diagnostics import DiagnosticsLevel
 from investiq.core.engine import BacktestEngine
+from investiq.core.multi_engine import MultiInstrumentEngine
+from investiq.core.multi_strategy_engine import MultiStrategyEngine
+from investiq.core.market_state_builder import MarketStateBuilder
 from investiq.core.execution_planner import ExecutionPlanner
+from investiq.core.features.factory import FeaturePipelineFactory, PipelineSpec, pipeline_specs
+from investiq.core.features.graph import FeatureGraph, pipeline_key
 from investiq.core.features.store import FeatureStore
+from investiq.core.profiling import StageProfiler
+from investiq.core.stop_conditions import StopCondition
 
+from investiq.execution.portfolio.account import CashAccount, InstrumentPortfolio
 from investiq.execution.portfolio.portfolio import Portfolio
+from investiq.runs.audit import AuditSink
 from investiq.execution.transition.engine import TransitionEngine
 from investiq.core.orchestrator import StrategyOrchestrator
 from investiq.utilities.logger.factory import LoggerFactory
@@ -16,26 +30,46 @@ def bootstrap_backtest_engine(
         execution_planner: ExecutionPlanner,
         filters: list[Filter] | None = None,
         initial_cash: float = 100_000,
+        precompute_features: bool = False,
+        profile_stages: bool = False,
+        audit_transitions: bool = False,
+        diagnostics_level: DiagnosticsLevel = DiagnosticsLevel.FULL,
+        audit_sink: AuditSink | None = None,
+        checkpoints: CheckpointManager | None = None,
+        portfolio: Portfolio | None = None,
+        market_store: MarketStateBuilder | None = None,
+        feature_store: FeatureStore | None = None,
+        stop_conditions: Sequence[StopCondition] | None = None,
 ) -> BacktestEngine:
 
-    feature_store = FeatureStore(logger=logger_factory.child("Feature store").get())
+    # Only the pipelines the strategy requires, built with its parameters
+    if feature_store is None:
+        feature_store = FeatureStore(
+            logger=logger_factory.child("Feature store").get(),
+            pipelines=FeaturePipelineFactory.create_all(pipeline_specs(strategy.metadata)),
+        )
 
     # 1. Build Strategy Orchestrator
     strategy_orchestrator = StrategyOrchestrator(
         available_pipelines=feature_store.pipeline_names(),
         strategy=strategy,
         filters=filters,
+        diagnostics_level=diagnostics_level,
     )
 
     # 2. Build Transition Engine
-    transition_engine = TransitionEngine(logger_factory=logger_factory)
-
-    # 3. Build Portfolio
-    portfolio = Portfolio(
+    transition_engine = TransitionEngine(
         logger_factory=logger_factory,
-        initial_cash=initial_cash
+        audit=audit_transitions,
     )
 
+    # 3. Build Portfolio (unless given, e.g. one drawing on shared cash)
+    if portfolio is None:
+        portfolio = Portfolio(
+            logger_factory=logger_factory,
+            initial_cash=initial_cash
+        )
+
     # 4. Build Backtest Engine
     return BacktestEngine(
         logger_factory=logger_factory,
@@ -43,4 +77,139 @@ def bootstrap_backtest_engine(
         execution_planner=execution_planner,
         transition_engine=transition_engine,
         portfolio=portfolio,
-    )
\ No newline at end of file
+        market_store=market_store,
+        feature_store=feature_store,
+        precompute_features=precompute_features,
+        profiler=StageProfiler() if profile_stages else None,
+        audit_sink=audit_sink,
+        checkpoints=checkpoints,
+        stop_conditions=stop_conditions,
+    )
+
+def bootstrap_multi_instrument_engine(
+        logger_factory: LoggerFactory,
+        symbols: Iterable[str],
+        strategy_factory: Callable[[str], Strategy],
+        planner_factory: Callable[[str], ExecutionPlanner],
+        filters_factory: Callable[[str], list[Filter] | None] | None = None,
+        initial_cash: float = 100_000,
+        precompute_features: bool = False,
+        diagnostics_level: DiagnosticsLevel = DiagnosticsLevel.FULL,
+        stop_conditions_factory: Callable[[str], Sequence[StopCondition] | None] | None = None,
+) -> MultiInstrumentEngine:
+    """
+    One BacktestEngine per symbol (factories are called with the symbol),
+    all trading against a single CashAccount. Stop conditions are stateful:
+    the factory must return new instances for every symbol; equity based
+    ones see the symbol's own equity (its cash flows and position), not the
+    shared balance.
+    """
+    account = CashAccount(initial_cash)
+    engines = {
+        symbol: bootstrap_backtest_engine(
+            logger_factory=logger_factory,
+            strategy=strategy_factory(symbol),
+            execution_planner=planner_factory(symbol),
+            filters=filters_factory(symbol) if filters_factory is not None else None,
+            precompute_features=precompute_features,
+            diagnostics_level=diagnostics_level,
+            stop_conditions=stop_conditions_factory(symbol) if stop_conditions_factory is not None else None,
+            portfolio=InstrumentPortfolio(
+                logger_factory=logger_factory,
+                account=account,
+                symbol=symbol,
+            ),
+        )
+        for symbol in symbols
+    }
+    return MultiInstrumentEngine(
+        logger_factory=logger_factory,
+        engines=engines,
+        account=account,
+    )
+
+
+def _merge_pipeline_specs(
+        stack_specs: Mapping[str, Sequence[PipelineSpec]],
+) -> list[tuple[list[PipelineSpec], list[str]]]:
+    """
+    Greedily merge the stacks' pipeline specs into as few groups as possible:
+    each stack joins the first group its specs are compatible with.
+    Returns (deduplicated specs, stack names) per group.
+    """
+    groups: list[tuple[list[PipelineSpec], list[str]]] = []
+    for name, specs in stack_specs.items():
+        for group_specs, names in groups:
+            merged = list(dict.fromkeys([*group_specs, *specs]))
+            if _compatible(merged):
+                group_specs[:] = merged
+                names.append(name)
+                break
+        else:
+            groups.append((list(dict.fromkeys(specs)), [name]))
+    return groups
+
+
+def _compatible(specs: Sequence[PipelineSpec]) -> bool:
+    # Same checks as a FeatureStore over these specs (unique keys, one producer per feature, no cycle)
+    try:
+        FeatureGraph.build({pipeline_key(p): p for p in FeaturePipelineFactory.create_all(specs)})
+    except ValueError:
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class StrategyStackSpec:
+    """
+    One strategy stack of a MultiStrategyEngine.
+    """
+    strategy: Strategy
+    execution_planner: ExecutionPlanner
+    filters: list[Filter] | None = None
+    initial_cash: float = 100_000
+    # Stateful: not to be shared with another stack
+    stop_conditions: tuple[StopCondition, ...] = ()
+
+
+def bootstrap_multi_strategy_engine(
+        logger_factory: LoggerFactory,
+        stacks: Mapping[str, StrategyStackSpec],
+        precompute_features: bool = False,
+        diagnostics_level: DiagnosticsLevel = DiagnosticsLevel.FULL,
+) -> MultiStrategyEngine:
+    """
+    One BacktestEngine per named stack over a single MarketStateBuilder.
+    The pipeline specs of all stacks are merged (deduplicated) into one
+    shared FeatureStore, so e.g. MA variants compute each distinct SMA
+    window once. A stack whose specs cannot join a store (two specs with
+    the same pipeline key, or features published twice) gets another one.
+    """
+    market_store = MarketStateBuilder()
+    groups = _merge_pipeline_specs({name: pipeline_specs(stack.strategy.metadata) for name, stack in stacks.items()})
+    feature_stores: dict[str, FeatureStore] = {}
+    for specs, names in groups:
+        feature_store = FeatureStore(
+            logger=logger_factory.child("Feature store").get(),
+            pipelines=FeaturePipelineFactory.create_all(specs),
+        )
+        feature_stores.update(dict.fromkeys(names, feature_store))
+    engines: dict[str, BacktestEngine] = {}
+    for name, stack in stacks.items():
+        feature_store = feature_stores[name]
+        engines[name] = bootstrap_backtest_engine(
+            logger_factory=logger_factory,
+            strategy=stack.strategy,
+            execution_planner=stack.execution_planner,
+            filters=stack.filters,
+            initial_cash=stack.initial_cash,
+            diagnostics_level=diagnostics_level,
+            market_store=market_store,
+            feature_store=feature_store,
+            stop_conditions=stack.stop_conditions,
+        )
+    return MultiStrategyEngine(
+        logger_factory=logger_factory,
+        engines=engines,
+        precompute_features=precompute_features,
+    )
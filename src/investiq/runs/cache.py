@@ -0,0 +1,194 @@
+import dataclasses
+import hashlib
+import importlib.util
+import json
+import os
+import pickle
+from collections.abc import Mapping, Sequence
+from functools import cache
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Final, Protocol, runtime_checkable
+
+import pandas as pd
+
+from investiq.api.execution import RunResult
+from investiq.api.filter import Filter
+from investiq.api.strategy import Strategy
+from investiq.core.execution_planner import ExecutionPlanner
+
+_SUFFIX: Final[str] = ".pkl"
+# Packages whose code determines a RunResult (engine + research components)
+_SOURCE_PACKAGES: Final[tuple[str, ...]] = ("investiq", "investiq_research")
+
+
+@cache
+def source_digest() -> str:
+    """
+    Content hash of the Python sources of `_SOURCE_PACKAGES` (computed once
+    per process), so editing the engine or a component invalidates results
+    cached by an otherwise identical installed version.
+    """
+    h = hashlib.sha256()
+    for package in _SOURCE_PACKAGES:
+        spec = importlib.util.find_spec(package)
+        if spec is None or not spec.submodule_search_locations:
+            continue
+        for root in spec.submodule_search_locations:
+            root = Path(root)
+            for path in sorted(root.rglob("*.py")):
+                h.update(f"{package}/{path.relative_to(root).as_posix()}".encode())
+                h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def engine_version() -> str:
+    """
+    Installed version plus the source digest (editable installs change
+    without a version bump).
+    """
+    try:
+        installed = version("Invest-IQ")
+    except PackageNotFoundError:
+        installed = "dev"
+    return f"{installed}+{source_digest()[:16]}"
+
+
+@runtime_checkable
+class SupportsCacheParams(Protocol):
+    """
+    Component without metadata that declares the parameters identifying it
+    in a result key.
+
+    - cache_params(): JSON-serializable constructor parameters; two
+      components with equal params must produce the same RunResult
+    """
+    def cache_params(self) -> Mapping[str, object]:
+        ...
+
+
+def _component_params(component: object) -> dict[str, object]:
+    """
+    Identity of a component: its metadata (name, version, parameters) when it
+    has one, else its class and its `cache_params()` or dataclass fields.
+    Other components are rejected: their attributes may hold runtime state.
+    """
+    meta = getattr(component, "metadata", None)
+    if meta is not None:
+        return {"name": meta.name, "version": meta.version, "parameters": dict(meta.parameters)}
+    cls = type(component)
+    if isinstance(component, SupportsCacheParams):
+        params = dict(component.cache_params())
+    elif dataclasses.is_dataclass(component):
+        params = dataclasses.asdict(component)
+    else:
+        raise TypeError(
+            f"{cls.__qualname__} has no metadata, cache_params() or dataclass fields: cannot key its results"
+        )
+    return {"name": f"{cls.__module__}.{cls.__qualname__}", "parameters": params}
+
+
+def dataset_digest(df: pd.DataFrame) -> str:
+    """
+    Content hash of a market data frame (values, index and column names).
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps([str(c) for c in df.columns]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return h.hexdigest()
+
+
+def result_key(
+        df: pd.DataFrame,
+        strategy: Strategy,
+        execution_planner: ExecutionPlanner,
+        filters: Sequence[Filter] | None = None,
+        initial_cash: float = 100_000,
+        engine: str | None = None,
+) -> str:
+    """
+    Stable content address of a run: dataset contents, strategy / planner /
+    filter identities and parameters, initial cash and engine version
+    (including the source digest). Parameters must be JSON values.
+    """
+    payload = {
+        "engine": engine or engine_version(),
+        "data": dataset_digest(df),
+        "strategy": _component_params(strategy),
+        "planner": _component_params(execution_planner),
+        "filters": [_component_params(f) for f in filters or ()],
+        "initial_cash": initial_cash,
+    }
+    try:
+        encoded = json.dumps(payload, sort_keys=True)
+    except TypeError as exc:
+        raise TypeError(f"Result key parameters must be JSON values: {exc}") from exc
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    Local RunResult store addressed by `result_key`.
+
+    Entries are pickles named after their key (written atomically). A hit
+    refreshes the entry's mtime; when the total size exceeds `max_bytes`,
+    the least recently used entries are evicted.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 1 << 30):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be positive")
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        return self._dir
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}{_SUFFIX}"
+
+    def get(self, key: str) -> RunResult | None:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as fh:
+                result = pickle.load(fh)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            # Unreadable or written by an incompatible version: treat as a miss
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        return result
+
+    def put(self, key: str, result: RunResult) -> Path:
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as fh:
+            pickle.dump(result, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self.evict()
+        return path
+
+    def size_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self._entries())
+
+    def evict(self) -> None:
+        """
+        Remove least recently used entries until the cache fits `max_bytes`.
+        """
+        entries = [(p, p.stat()) for p in self._entries()]
+        total = sum(st.st_size for _, st in entries)
+        if total <= self._max_bytes:
+            return
+        for path, st in sorted(entries, key=lambda e: e[1].st_mtime_ns):
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            if total <= self._max_bytes:
+                break
+
+    def _entries(self) -> list[Path]:
+        return list(self._dir.glob(f"*/*{_SUFFIX}"))
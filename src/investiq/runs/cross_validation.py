@@ -0,0 +1,174 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from investiq.core.history_buffer import combine_lookbacks
+from investiq.runs.shared_data import SharedOHLCV
+from investiq.runs.sweep import SweepCandidate, SweepConfig, feature_lookback, process_pool, run_candidate
+
+
+@dataclass(frozen=True)
+class CVFold:
+    """
+    Boolean bar masks of one fold. The test set is one contiguous block;
+    the train set is every other bar minus the purged bars before the block
+    and the embargoed bars after it.
+    """
+    index: int
+    train_mask: np.ndarray
+    test_mask: np.ndarray
+
+    def train_segments(self) -> list[tuple[int, int]]:
+        return mask_segments(self.train_mask)
+
+    def test_segment(self) -> tuple[int, int]:
+        (segment,) = mask_segments(self.test_mask)
+        return segment
+
+
+@dataclass(frozen=True)
+class CVResult:
+    folds: tuple[CVFold, ...]
+    selected: tuple[SweepCandidate, ...]
+    # One row per (fold, candidate): metrics summed over the train segments
+    train: pd.DataFrame
+    # One row per fold: the selected candidate on the test block
+    test: pd.DataFrame
+
+    def summary(self, metrics: Sequence[str] = ("Realized PnL", "Fills")) -> dict[str, float]:
+        """
+        Mean and standard deviation of test metrics across folds.
+        """
+        out: dict[str, float] = {"Folds": float(len(self.folds))}
+        for m in metrics:
+            out[f"{m} mean"] = float(self.test[m].mean())
+            out[f"{m} std"] = float(self.test[m].std(ddof=0))
+        return out
+
+
+def mask_segments(mask: np.ndarray) -> list[tuple[int, int]]:
+    """
+    Contiguous runs of True in `mask`, as [start, stop) bar ranges.
+    """
+    edges = np.diff(np.r_[0, mask.astype(np.int8), 0])
+    return list(zip(np.flatnonzero(edges == 1).tolist(), np.flatnonzero(edges == -1).tolist()))
+
+
+def purged_kfold(
+        n_bars: int,
+        n_folds: int,
+        purge_bars: int = 0,
+        embargo_bars: int = 0,
+) -> list[CVFold]:
+    """
+    K contiguous test blocks. Train bars within `purge_bars` before a test
+    block and `embargo_bars` after it are dropped, so that no train bar
+    overlaps the information window of a test bar.
+    """
+    if n_folds < 2:
+        raise ValueError("n_folds must be >= 2")
+    if n_bars < n_folds:
+        raise ValueError(f"{n_bars} bars cannot be split into {n_folds} folds")
+    if purge_bars < 0 or embargo_bars < 0:
+        raise ValueError("purge_bars and embargo_bars must be >= 0")
+    bounds = np.linspace(0, n_bars, n_folds + 1).astype(np.int64)
+    folds: list[CVFold] = []
+    for k in range(n_folds):
+        start, stop = int(bounds[k]), int(bounds[k + 1])
+        test = np.zeros(n_bars, dtype=bool)
+        test[start:stop] = True
+        train = ~test
+        train[max(0, start - purge_bars):start] = False
+        train[stop:stop + embargo_bars] = False
+        folds.append(CVFold(index=k, train_mask=train, test_mask=test))
+    return folds
+
+
+def _feature_embargo(config: SweepConfig, candidates: Sequence[SweepCandidate]) -> int:
+    lookbacks: list[int | None] = []
+    for candidate in candidates:
+        try:
+            lookbacks.append(feature_lookback(config, candidate))
+        except ValueError:
+            # invalid candidates are reported in the `Error` column
+            continue
+    lookback = combine_lookbacks(lookbacks)
+    if lookback is None:
+        raise ValueError(
+            "Precomputed features with an unbounded lookback leak test bars into train segments; "
+            "run with precompute_features=False"
+        )
+    return lookback
+
+
+def run_purged_cv(
+        df: pd.DataFrame,
+        config: SweepConfig,
+        candidates: Sequence[SweepCandidate],
+        n_folds: int = 5,
+        purge_bars: int = 0,
+        embargo_bars: int = 0,
+        objective: str = "Realized PnL",
+        maximize: bool = True,
+        max_workers: int | None = None,
+) -> CVResult:
+    """
+    Purged / embargoed k-fold evaluation over `df`.
+
+    Per fold, every candidate runs on each train segment (a fresh engine per
+    segment), the summed `objective` selects the fold's candidate, which is
+    then run on the test block. All runs of a pass go to one process pool
+    over shared-memory data. With a single candidate this is a plain
+    per-fold evaluation.
+
+    With `config.precompute_features`, features are computed over the whole
+    series, so a train bar after a test block would see test bars through its
+    features: `embargo_bars` is raised to the largest feature lookback of the
+    candidates (the effective masks are in `CVResult.folds`).
+    """
+    if config.precompute_features:
+        embargo_bars = max(embargo_bars, _feature_embargo(config, candidates))
+    folds = purged_kfold(len(df), n_folds, purge_bars, embargo_bars)
+
+    with SharedOHLCV.publish(df) as data, process_pool(data, config, max_workers) as pool:
+        # (candidate index, fold index, start, stop)
+        tasks = [
+            (i, f.index, start, stop)
+            for i in range(len(candidates))
+            for f in folds
+            for start, stop in f.train_segments()
+        ]
+        rows = list(pool.map(
+            run_candidate,
+            [candidates[t[0]] for t in tasks],
+            [t[2] for t in tasks],
+            [t[3] for t in tasks],
+        ))
+        segments = pd.DataFrame(rows)
+        segments.insert(0, "Candidate", [t[0] for t in tasks])
+        segments.insert(0, "Fold", [t[1] for t in tasks])
+        train = (
+            segments[segments["Error"].isna()]
+            .groupby(["Fold", "Candidate"], as_index=False)
+            .agg({objective: "sum", "Fills": "sum"})
+        )
+        if train.empty:
+            raise ValueError("No valid candidate")
+
+        selected: list[SweepCandidate] = []
+        for f in folds:
+            scores = train[train["Fold"] == f.index].set_index("Candidate")[objective]
+            selected.append(candidates[int(scores.idxmax() if maximize else scores.idxmin())])
+
+        test_rows = list(pool.map(
+            run_candidate,
+            selected,
+            [f.test_segment()[0] for f in folds],
+            [f.test_segment()[1] for f in folds],
+        ))
+
+    test = pd.DataFrame(test_rows)
+    test.insert(0, "Fold", [f.index for f in folds])
+    return CVResult(folds=tuple(folds), selected=tuple(selected), train=train, test=test)
@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+
+import numpy as np
+
+from investiq.execution.portfolio.types import Fill
+from investiq.utilities.time_utils import to_epoch_ns
+
+
+def equity_curve(
+        fills: Sequence[Fill],
+        timestamps_ns: np.ndarray,
+        close: np.ndarray,
+        initial_cash: float,
+) -> np.ndarray:
+    """
+    Mark-to-close equity (cash + position * close) on every bar, rebuilt from
+    the execution log: each bar carries the cash and position after the last
+    fill at or before it.
+    """
+    n = timestamps_ns.shape[0]
+    position = np.zeros(n, dtype=np.float64)
+    cash = np.full(n, initial_cash, dtype=np.float64)
+    if fills:
+        fill_ts = np.fromiter((to_epoch_ns(f.timestamp) for f in fills), dtype=np.int64, count=len(fills))
+        bar = np.searchsorted(timestamps_ns, fill_ts, side="right") - 1
+        # last fill of each bar wins (fills are in time order)
+        last = np.r_[bar[1:] != bar[:-1], True] & (bar >= 0)
+        latest = np.full(n, -1, dtype=np.int64)
+        latest[bar[last]] = np.flatnonzero(last)
+        latest = np.maximum.accumulate(latest)
+        filled = latest >= 0
+        position_after = np.fromiter((f.position_after for f in fills), dtype=np.float64, count=len(fills))
+        cash_after = np.fromiter((f.cash_after for f in fills), dtype=np.float64, count=len(fills))
+        position[filled] = position_after[latest[filled]]
+        cash[filled] = cash_after[latest[filled]]
+    return cash + position * close
@@ -0,0 +1,100 @@
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import pandas as pd
+
+from investiq.core.checkpoint import EngineCheckpoint
+from investiq.runs.shared_data import SharedOHLCV
+from investiq.runs.sweep import SweepCandidate, SweepConfig, advance_candidate, process_pool
+
+
+@dataclass(frozen=True)
+class HalvingResult:
+    # Bar horizon of each rung (the last one is the full data)
+    budgets: tuple[int, ...]
+    # One row per (rung, candidate) evaluation
+    rungs: pd.DataFrame
+    best: SweepCandidate
+    # Bars processed in total vs. running every candidate on the full data
+    bars_processed: int
+    bars_exhaustive: int
+
+
+def halving_budgets(n_bars: int, n_candidates: int, eta: int = 3, min_bars: int = 1) -> list[int]:
+    """
+    Increasing bar horizons ending at `n_bars`, each `eta` times the previous
+    one: enough rungs to narrow `n_candidates` down to one, without going
+    below `min_bars`.
+    """
+    if eta < 2:
+        raise ValueError("eta must be >= 2")
+    n_rungs = 1 + math.ceil(math.log(max(n_candidates, 1), eta))
+    budgets = [n_bars // eta ** k for k in range(n_rungs)]
+    return sorted({b for b in budgets if b >= min_bars} | {n_bars})
+
+
+def successive_halving(
+        df: pd.DataFrame,
+        config: SweepConfig,
+        candidates: Sequence[SweepCandidate],
+        eta: int = 3,
+        min_bars: int = 1,
+        objective: str = "Realized PnL",
+        maximize: bool = True,
+        max_workers: int | None = None,
+) -> HalvingResult:
+    """
+    Successive halving over increasing prefixes of `df`.
+
+    Every candidate runs on the first rung's prefix; only the best 1/`eta`
+    (by `objective` over the prefix) is promoted to the next, longer one.
+    Promoted candidates continue from their EngineCheckpoint, so each bar is
+    processed at most once per candidate. Candidates stopped by a stop
+    condition or with invalid parameters are never promoted.
+    """
+    if not candidates:
+        raise ValueError("No candidates")
+    budgets = halving_budgets(len(df), len(candidates), eta, min_bars)
+    states: dict[int, EngineCheckpoint | None] = {i: None for i in range(len(candidates))}
+    survivors = list(range(len(candidates)))
+    frames: list[pd.DataFrame] = []
+    bars_processed = 0
+
+    with SharedOHLCV.publish(df) as data, process_pool(data, config, max_workers) as pool:
+        for rung, budget in enumerate(budgets):
+            outputs = list(pool.map(
+                advance_candidate,
+                [candidates[i] for i in survivors],
+                [states[i] for i in survivors],
+                [budget] * len(survivors),
+            ))
+            rows: list[dict[str, object]] = []
+            for i, (row, checkpoint) in zip(survivors, outputs):
+                prev = states[i].bars if states[i] is not None else 0
+                states[i] = checkpoint
+                bars_processed += (checkpoint.bars if checkpoint is not None else prev) - prev
+                rows.append({"Rung": rung, "Budget": budget, "Candidate": i, **row})
+            frame = pd.DataFrame(rows)
+            frames.append(frame)
+
+            promotable = frame["Error"].isna()
+            if "Stop Reason" in frame:
+                promotable &= frame["Stop Reason"].isna()
+            ranked = frame[promotable]
+            if ranked.empty:
+                raise ValueError(f"No candidate left to promote at rung {rung}")
+            ranked = ranked.sort_values(objective, ascending=not maximize, kind="stable")
+            keep = max(1, math.ceil(len(survivors) / eta)) if rung < len(budgets) - 1 else 1
+            survivors = ranked["Candidate"].head(keep).tolist()
+            # Drop the state of eliminated candidates
+            for i in set(states) - set(survivors):
+                states.pop(i)
+
+    return HalvingResult(
+        budgets=tuple(budgets),
+        rungs=pd.concat(frames, ignore_index=True),
+        best=candidates[survivors[0]],
+        bars_processed=bars_processed,
+        bars_exhaustive=len(df) * len(candidates),
+    )
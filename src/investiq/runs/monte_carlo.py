@@ -0,0 +1,126 @@
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Final
+
+import numpy as np
+
+from investiq.execution.portfolio.types import Fill
+
+# Target size of one (samples x trades) float64 batch
+_BATCH_BYTES: Final[int] = 16 * 1024 * 1024
+
+
+class ResampleMethod(StrEnum):
+    # Draw trades with replacement: varies both the trade mix and the order
+    BOOTSTRAP = "bootstrap"
+    # Shuffle the observed trades: same final PnL, varies the path (drawdowns)
+    PERMUTATION = "permutation"
+
+
+def trade_pnls(execution_log: Sequence[Fill]) -> np.ndarray:
+    """
+    Realized PnL of every closing fill, in execution order.
+    """
+    return np.fromiter(
+        (f.realized_pnl for f in execution_log if f.realized_pnl is not None),
+        dtype=np.float64,
+    )
+
+
+@dataclass(frozen=True)
+class MonteCarloResult:
+    method: ResampleMethod
+    n_trades: int
+    # One value per resample
+    final_pnl: np.ndarray
+    max_drawdown: np.ndarray
+    max_drawdown_pct: np.ndarray
+
+    def summary(self, quantiles: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95)) -> dict[str, float]:
+        out: dict[str, float] = {
+            "Samples": float(self.final_pnl.shape[0]),
+            "Trades": float(self.n_trades),
+            "P(Loss)": float(np.mean(self.final_pnl < 0)),
+            "Mean PnL": float(self.final_pnl.mean()),
+            "Mean Max Drawdown": float(self.max_drawdown.mean()),
+        }
+        for q, pnl, dd, dd_pct in zip(
+                quantiles,
+                np.quantile(self.final_pnl, quantiles),
+                np.quantile(self.max_drawdown, quantiles),
+                np.quantile(self.max_drawdown_pct, quantiles),
+        ):
+            out[f"PnL q{q:g}"] = float(pnl)
+            out[f"Max Drawdown q{q:g}"] = float(dd)
+            out[f"Max Drawdown % q{q:g}"] = float(dd_pct)
+        return out
+
+
+def resample_batch(
+        pnl: np.ndarray,
+        n_samples: int,
+        method: ResampleMethod,
+        initial_cash: float,
+        seed: np.random.SeedSequence,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    `n_samples` resampled trade sequences at once: (final PnL, max drawdown,
+    max drawdown as a fraction of the peak equity) per sample.
+    """
+    rng = np.random.default_rng(seed)
+    n = pnl.shape[0]
+    if method is ResampleMethod.BOOTSTRAP:
+        paths = pnl[rng.integers(0, n, size=(n_samples, n))]
+    else:
+        paths = rng.permuted(np.broadcast_to(pnl, (n_samples, n)), axis=1)
+    equity = np.cumsum(paths, axis=1, out=paths)
+    equity += initial_cash
+    peak = np.maximum.accumulate(equity, axis=1)
+    # starting equity counts as the first peak
+    np.maximum(peak, initial_cash, out=peak)
+    drawdown = peak - equity
+    max_dd = drawdown.max(axis=1)
+    max_dd_pct = (drawdown / peak).max(axis=1)
+    return equity[:, -1] - initial_cash, max_dd, max_dd_pct
+
+
+def run_monte_carlo(
+        pnl: np.ndarray,
+        n_samples: int = 10_000,
+        method: ResampleMethod = ResampleMethod.BOOTSTRAP,
+        initial_cash: float = 100_000,
+        seed: int = 0,
+        batch_size: int | None = None,
+        executor: Executor | None = None,
+) -> MonteCarloResult:
+    """
+    Resample a trade PnL sequence (see `trade_pnls`) `n_samples` times.
+
+    Samples are generated in vectorized batches (about 16 MiB each by
+    default). With an `executor` (e.g. a ProcessPoolExecutor reused across
+    sweep candidates) the batches run in parallel; otherwise in-process.
+    Each batch has its own child seed, so results depend on `seed` and
+    `batch_size` only, not on the executor.
+    """
+    pnl = np.asarray(pnl, dtype=np.float64)
+    if pnl.ndim != 1 or pnl.shape[0] == 0:
+        raise ValueError("pnl must be a non-empty 1-D sequence of trade PnLs")
+    if n_samples <= 0:
+        raise ValueError("n_samples must be positive")
+    method = ResampleMethod(method)
+    batch_size = batch_size or max(1, _BATCH_BYTES // (8 * pnl.shape[0]))
+    sizes = [min(batch_size, n_samples - i) for i in range(0, n_samples, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = ([pnl] * len(sizes), sizes, [method] * len(sizes), [initial_cash] * len(sizes), seeds)
+
+    batches = list(executor.map(resample_batch, *args) if executor is not None else map(resample_batch, *args))
+    final_pnl, max_dd, max_dd_pct = (np.concatenate(parts) for parts in zip(*batches))
+    return MonteCarloResult(
+        method=method,
+        n_trades=pnl.shape[0],
+        final_pnl=final_pnl,
+        max_drawdown=max_dd,
+        max_drawdown_pct=max_dd_pct,
+    )
@@ -0,0 +1,101 @@
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import Final
+
+import numpy as np
+import pandas as pd
+
+from investiq.api.market import MarketField
+
+_FIELDS: Final[tuple[MarketField, ...]] = (
+    MarketField.OPEN,
+    MarketField.HIGH,
+    MarketField.LOW,
+    MarketField.CLOSE,
+    MarketField.VOLUME,
+)
+
+
+@dataclass(frozen=True)
+class SharedOHLCVHandle:
+    """
+    Picklable reference to an OHLCV frame published in shared memory.
+
+    Layout: one block of (1 + len(fields)) rows of `n_bars` 8-byte values,
+    int64 epoch-ns timestamps first, then the float64 columns.
+    """
+    name: str
+    n_bars: int
+    tz: str | None
+
+
+class SharedOHLCV:
+    """
+    Owner of an OHLCV frame published through `multiprocessing.shared_memory`.
+
+    Workers attach with `attach_ohlcv(handle)` and read the columns in place
+    (no copy, no re-parse). The owner unlinks the block on `close()`; use it
+    as a context manager around the pool.
+    """
+
+    def __init__(self, shm: SharedMemory, handle: SharedOHLCVHandle):
+        self._shm = shm
+        self._handle = handle
+
+    @classmethod
+    def publish(cls, df: pd.DataFrame) -> "SharedOHLCV":
+        """
+        Copy `df` (DatetimeIndex or `timestamp` column, OHLC[V] columns) into a new block.
+        """
+        ts = pd.DatetimeIndex(df["timestamp"] if "timestamp" in df.columns else df.index)
+        n = len(ts)
+        shm = SharedMemory(create=True, size=max(1, (1 + len(_FIELDS)) * n * 8))
+        try:
+            ts_out, cols_out = _views(shm, n)
+            ts_out[:] = ts.asi8
+            for i, f in enumerate(_FIELDS):
+                if f.value in df.columns:
+                    cols_out[i] = df[f.value].to_numpy(dtype=np.float64)
+                else:
+                    cols_out[i] = 0.0
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+        tz = str(ts.tz) if ts.tz is not None else None
+        return cls(shm, SharedOHLCVHandle(name=shm.name, n_bars=n, tz=tz))
+
+    @property
+    def handle(self) -> SharedOHLCVHandle:
+        return self._handle
+
+    def close(self) -> None:
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedOHLCV":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def attach_ohlcv(handle: SharedOHLCVHandle) -> tuple[SharedMemory, pd.DataFrame]:
+    """
+    Attach to a published block and wrap it in a DataFrame (zero-copy columns).
+
+    The returned SharedMemory must be kept alive as long as the frame is used.
+    """
+    shm = SharedMemory(name=handle.name, track=False)
+    ts, cols = _views(shm, handle.n_bars)
+    index = pd.DatetimeIndex(ts.view("M8[ns]"))
+    index = index.tz_localize("UTC").tz_convert(handle.tz) if handle.tz is not None else index
+    # (fields, n) C-order is exactly pandas' block layout: the frame wraps it without copying
+    df = pd.DataFrame(cols.T, index=index, columns=[f.value for f in _FIELDS], copy=False)
+    return shm, df
+
+
+def _views(shm: SharedMemory, n: int) -> tuple[np.ndarray, np.ndarray]:
+    ts = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+    cols = np.ndarray((len(_FIELDS), n), dtype=np.float64, buffer=shm.buf, offset=n * 8)
+    return ts, cols
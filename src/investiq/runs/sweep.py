@@ -0,0 +1,316 @@
+import copy
+import itertools
+import logging
+import multiprocessing
+from collections import OrderedDict
+from collections.abc import Callable, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Final
+
+import numpy as np
+import pandas as pd
+
+from investiq.api.backtest import BacktestInput
+from investiq.api.execution import RunResult
+from investiq.api.instruments import AssetClass, InstrumentSpec
+from investiq.api.strategy import Strategy
+from investiq.core.diagnostics import DiagnosticsLevel
+from investiq.core.checkpoint import EngineCheckpoint
+from investiq.core.engine import BacktestEngine
+from investiq.core.execution_planner import ExecutionPlanner
+from investiq.core.features.factory import FeaturePipelineFactory, PipelineSpec, pipeline_specs
+from investiq.core.features.store import FeatureStore
+from investiq.core.history_buffer import combine_lookbacks
+from investiq.core.stop_conditions import StopCondition
+from investiq.market_data import BarSize, DataFrameBacktestFeed
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq.runs.equity import equity_curve
+from investiq.runs.shared_data import SharedOHLCV, SharedOHLCVHandle, attach_ohlcv
+from investiq.utilities.logger.factory import LoggerFactory
+from investiq.utilities.logger.setup import init_base_logger
+
+type Params = tuple[tuple[str, object], ...]
+
+# Precomputed feature sets kept per worker (one per distinct pipeline spec set)
+FEATURE_CACHE_SIZE: Final[int] = 16
+
+
+@dataclass(frozen=True)
+class SweepCandidate:
+    """
+    One point of a parameter grid: constructor parameters of the strategy
+    and of the planner, as sorted (key, value) pairs (hashable).
+    """
+    strategy_params: Params = ()
+    planner_params: Params = ()
+
+    @classmethod
+    def of(
+            cls,
+            strategy_params: Mapping[str, object] | None = None,
+            planner_params: Mapping[str, object] | None = None,
+    ) -> "SweepCandidate":
+        return cls(
+            strategy_params=tuple(sorted((strategy_params or {}).items())),
+            planner_params=tuple(sorted((planner_params or {}).items())),
+        )
+
+    def params(self) -> dict[str, object]:
+        return {**dict(self.strategy_params), **dict(self.planner_params)}
+
+
+@dataclass(frozen=True)
+class SweepConfig:
+    """
+    Everything a worker needs to build and run an engine for a candidate.
+    Classes must be importable (module-level) so they pickle by reference.
+    """
+    strategy_cls: Callable[..., Strategy]
+    planner_cls: Callable[..., ExecutionPlanner]
+    symbol: str = "SWEEP"
+    asset_class: AssetClass = AssetClass.CONT_FUT
+    bar_size: BarSize = BarSize.ONE_MINUTE
+    initial_cash: float = 100_000
+    precompute_features: bool = True
+    stop_conditions: tuple[StopCondition, ...] = field(default=())
+
+
+def expand_grid(
+        strategy_grid: Mapping[str, Sequence[object]],
+        planner_grid: Mapping[str, Sequence[object]] | None = None,
+) -> list[SweepCandidate]:
+    """
+    Cartesian product of both grids. Parameter names must not overlap, since
+    they share one column namespace in the result table.
+    """
+    planner_grid = planner_grid or {}
+    overlap = set(strategy_grid) & set(planner_grid)
+    if overlap:
+        raise ValueError(f"Parameters in both strategy and planner grids: {sorted(overlap)}")
+    s_keys, p_keys = list(strategy_grid), list(planner_grid)
+    return [
+        SweepCandidate.of(dict(zip(s_keys, s_vals)), dict(zip(p_keys, p_vals)))
+        for s_vals in itertools.product(*strategy_grid.values())
+        for p_vals in itertools.product(*planner_grid.values())
+    ]
+
+
+# ---- worker side ---------------------------------------------------------
+# Set once per worker process by `init_worker` (the shared block stays mapped).
+_WORKER: dict[str, object] = {}
+
+
+def init_worker(handle: SharedOHLCVHandle, config: SweepConfig) -> None:
+    init_base_logger(debug=False)
+    logging.getLogger("InvestIQ").setLevel(logging.WARNING)
+    shm, df = attach_ohlcv(handle)
+    _WORKER.update(
+        shm=shm,
+        df=df,
+        config=config,
+        logger_factory=LoggerFactory(engine_type="Sweep", run_id="sweep"),
+        features=OrderedDict(),
+    )
+
+
+def worker_data() -> pd.DataFrame:
+    return _WORKER["df"]
+
+
+def _precomputed_features(specs: tuple[PipelineSpec, ...], logger_factory: LoggerFactory) -> FeatureStore:
+    """
+    Features of `specs` precomputed once over the worker's full data (LRU cached).
+
+    Candidates (and windows) that need the same pipelines share the columns:
+    features are causal, so row i only depends on bars up to i whatever
+    slice of the data a run covers.
+    """
+    cache: OrderedDict[tuple[PipelineSpec, ...], FeatureStore] = _WORKER["features"]
+    store = cache.get(specs)
+    if store is not None:
+        cache.move_to_end(specs)
+        return store
+    df = worker_data()
+    store = FeatureStore(
+        logger=logger_factory.child("Feature store").get(),
+        pipelines=FeaturePipelineFactory.create_all(specs),
+    )
+    store.precompute(backtest_input(_WORKER["config"], df, logger_factory).events.columns())
+    cache[specs] = store
+    if len(cache) > FEATURE_CACHE_SIZE:
+        cache.popitem(last=False)
+    return store
+
+
+def build_engine(
+        config: SweepConfig,
+        candidate: SweepCandidate,
+        logger_factory: LoggerFactory,
+        start: int = 0,
+) -> BacktestEngine:
+    """
+    Engine for `candidate`. In a worker with `precompute_features`, its
+    FeatureStore reuses the worker's precomputed columns, positioned so that
+    the first ingested bar is bar `start` of the shared data.
+    """
+    strategy = config.strategy_cls(**dict(candidate.strategy_params))
+    feature_store: FeatureStore | None = None
+    if config.precompute_features and _WORKER:
+        specs = tuple(pipeline_specs(strategy.metadata))
+        feature_store = FeatureStore(
+            logger=logger_factory.child("Feature store").get(),
+            pipelines=FeaturePipelineFactory.create_all(specs),
+        )
+        feature_store.share_precomputed(_precomputed_features(specs, logger_factory))
+        feature_store.set_state({"bulk": True, "row": start - 1})
+    return bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=strategy,
+        execution_planner=config.planner_cls(**dict(candidate.planner_params)),
+        initial_cash=config.initial_cash,
+        precompute_features=config.precompute_features and feature_store is None,
+        diagnostics_level=DiagnosticsLevel.OFF,
+        # conditions are stateful: every run gets fresh copies
+        stop_conditions=copy.deepcopy(config.stop_conditions),
+        feature_store=feature_store,
+    )
+
+
+def feature_lookback(config: SweepConfig, candidate: SweepCandidate) -> int | None:
+    """
+    Largest lookback declared by the feature pipelines of `candidate`
+    (None = unbounded): how many bars back a precomputed feature reads.
+    """
+    strategy = config.strategy_cls(**dict(candidate.strategy_params))
+    pipelines = FeaturePipelineFactory.create_all(pipeline_specs(strategy.metadata))
+    return combine_lookbacks(getattr(p, "max_lookback", None) for p in pipelines)
+
+
+def backtest_input(config: SweepConfig, df: pd.DataFrame, logger_factory: LoggerFactory) -> BacktestInput:
+    return BacktestInput(
+        instrument=InstrumentSpec(
+            symbol=config.symbol,
+            asset_class=config.asset_class,
+            bar_size=config.bar_size,
+        ),
+        events=DataFrameBacktestFeed(
+            logger=logger_factory.child("BacktestFeed").get(),
+            df=df,
+            symbol=config.symbol,
+            bar_size=config.bar_size,
+            epoch_ns=True,
+        ),
+    )
+
+
+def summarize(result: RunResult) -> dict[str, object]:
+    """
+    Compact row for a run: metrics, fill count and stop reason.
+    """
+    return {
+        **result.metrics,
+        "Fills": len(result.execution_log),
+        "Stop Reason": result.stop_reason,
+    }
+
+
+def run_candidate(
+        candidate: SweepCandidate,
+        start: int = 0,
+        stop: int | None = None,
+        equity: bool = False,
+) -> dict[str, object]:
+    """
+    Run `candidate` over bars [start, stop) of the worker's shared data.
+    Invalid parameter combinations are reported in the `Error` column.
+    With `equity=True` the row also holds the per-bar `Equity` array.
+    """
+    config: SweepConfig = _WORKER["config"]
+    logger_factory: LoggerFactory = _WORKER["logger_factory"]
+    row: dict[str, object] = candidate.params()
+    t0 = perf_counter()
+    try:
+        engine = build_engine(config, candidate, logger_factory, start=start)
+    except ValueError as exc:
+        return {**row, "Error": str(exc)}
+    df = worker_data().iloc[start:stop]
+    result = engine.run(backtest_input(config, df, logger_factory))
+    row = {**row, **summarize(result), "Elapsed (s)": perf_counter() - t0, "Error": None}
+    if equity:
+        row["Equity"] = equity_curve(
+            result.execution_log,
+            np.asarray(df.index.asi8),
+            df["close"].to_numpy(),
+            config.initial_cash,
+        )
+    return row
+
+
+def advance_candidate(
+        candidate: SweepCandidate,
+        checkpoint: EngineCheckpoint | None,
+        stop: int,
+) -> tuple[dict[str, object], EngineCheckpoint | None]:
+    """
+    Continue `candidate` from `checkpoint` (None: from bar 0) up to bar `stop`
+    of the worker's shared data, without replaying the processed bars.
+
+    Returns the row for the whole horizon [0, stop) and the engine state to
+    continue from later (None for invalid parameters). The state includes
+    the stop conditions', so a continued candidate stops on the same bar as
+    an uninterrupted run.
+    """
+    config: SweepConfig = _WORKER["config"]
+    logger_factory: LoggerFactory = _WORKER["logger_factory"]
+    row: dict[str, object] = candidate.params()
+    t0 = perf_counter()
+    try:
+        engine = build_engine(config, candidate, logger_factory)
+    except ValueError as exc:
+        return {**row, "Error": str(exc)}, None
+    start = 0
+    if checkpoint is not None:
+        engine.restore(checkpoint)
+        start = checkpoint.bars
+    bt_input = backtest_input(config, worker_data().iloc[start:stop], logger_factory)
+    stop_reason = engine.consume(bt_input.events)
+    engine.finish()
+    result = engine.result(bt_input.instrument, stop_reason=stop_reason, tz=bt_input.tz)
+    return {**row, **summarize(result), "Elapsed (s)": perf_counter() - t0, "Error": None}, engine.checkpoint()
+
+
+# ---- driver side ---------------------------------------------------------
+def process_pool(
+        data: SharedOHLCV,
+        config: SweepConfig,
+        max_workers: int | None = None,
+) -> ProcessPoolExecutor:
+    """
+    Spawned worker pool attached to `data`, each worker initialized once.
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(data.handle, config),
+    )
+
+
+def run_sweep(
+        df: pd.DataFrame,
+        config: SweepConfig,
+        candidates: Sequence[SweepCandidate],
+        max_workers: int | None = None,
+) -> pd.DataFrame:
+    """
+    Run every candidate over `df` on a process pool.
+
+    The OHLCV columns are published once in shared memory; workers attach at
+    start-up and build their feeds from it. Returns one row per candidate
+    (parameters + metrics), in candidate order.
+    """
+    with SharedOHLCV.publish(df) as data, process_pool(data, config, max_workers) as pool:
+        rows = list(pool.map(run_candidate, candidates))
+    return pd.DataFrame(rows)
@@ -0,0 +1,154 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from investiq.runs.shared_data import SharedOHLCV
+from investiq.runs.sweep import SweepCandidate, SweepConfig, process_pool, run_candidate
+
+
+@dataclass(frozen=True)
+class WalkForwardWindow:
+    """
+    Bar ranges [start, stop) of one train / test split.
+    """
+    index: int
+    train_start: int
+    train_stop: int
+    test_start: int
+    test_stop: int
+
+
+@dataclass(frozen=True)
+class WalkForwardResult:
+    windows: tuple[WalkForwardWindow, ...]
+    # Candidate chosen on each train window, in window order
+    selected: tuple[SweepCandidate, ...]
+    # One row per (window, candidate) train run
+    in_sample: pd.DataFrame
+    # One row per window: the selected candidate on its test window
+    out_of_sample: pd.DataFrame
+    # Stitched out-of-sample equity (each window continues from the previous PnL)
+    equity: pd.Series
+
+
+def walk_forward_windows(
+        n_bars: int,
+        train_bars: int,
+        test_bars: int,
+        step_bars: int | None = None,
+        anchored: bool = False,
+) -> list[WalkForwardWindow]:
+    """
+    Consecutive train/test splits: each test window directly follows its
+    train window, and windows advance by `step_bars` (default `test_bars`,
+    i.e. contiguous test windows). `step_bars` may not be smaller than
+    `test_bars`: overlapping test windows would count bars twice in the
+    stitched out-of-sample equity. `anchored=True` keeps every train window
+    starting at bar 0 (expanding window).
+    """
+    if train_bars <= 0 or test_bars <= 0:
+        raise ValueError("train_bars and test_bars must be positive")
+    step_bars = test_bars if step_bars is None else step_bars
+    if step_bars < test_bars:
+        raise ValueError(f"step_bars={step_bars} < test_bars={test_bars}: test windows would overlap")
+    windows: list[WalkForwardWindow] = []
+    train_start = 0
+    while train_start + train_bars < n_bars:
+        train_stop = train_start + train_bars
+        windows.append(WalkForwardWindow(
+            index=len(windows),
+            train_start=0 if anchored else train_start,
+            train_stop=train_stop,
+            test_start=train_stop,
+            test_stop=min(train_stop + test_bars, n_bars),
+        ))
+        train_start += step_bars
+    return windows
+
+
+def _select(rows: pd.DataFrame, objective: str, maximize: bool) -> int:
+    valid = rows[rows["Error"].isna()]
+    if valid.empty:
+        raise ValueError("No valid candidate on a train window")
+    scores = valid[objective]
+    return int(scores.idxmax() if maximize else scores.idxmin())
+
+
+def run_walk_forward(
+        df: pd.DataFrame,
+        config: SweepConfig,
+        candidates: Sequence[SweepCandidate],
+        train_bars: int,
+        test_bars: int,
+        step_bars: int | None = None,
+        anchored: bool = False,
+        objective: str = "Realized PnL",
+        maximize: bool = True,
+        max_workers: int | None = None,
+) -> WalkForwardResult:
+    """
+    Walk-forward optimization over `df`.
+
+    1. Every candidate runs on every train window (one process-pool pass);
+       the best `objective` metric is selected per window.
+    2. Each selected candidate runs on the following test window (second pass).
+    3. Test-window equity curves are stitched into one out-of-sample series.
+
+    Market data is published once in shared memory. With
+    `config.precompute_features`, each worker computes the features of a
+    pipeline parameterization once over the whole series and every window
+    slices them, instead of recomputing per window (features are causal, so
+    no future bar leaks into a window; test windows start already warm).
+    """
+    windows = walk_forward_windows(len(df), train_bars, test_bars, step_bars, anchored)
+    if not windows:
+        raise ValueError(f"{len(df)} bars are not enough for train_bars={train_bars}")
+
+    with SharedOHLCV.publish(df) as data, process_pool(data, config, max_workers) as pool:
+        # Candidate-major order: consecutive tasks of a worker reuse the same features
+        tasks = [(c, w) for c in candidates for w in windows]
+        rows = list(pool.map(
+            run_candidate,
+            [c for c, _ in tasks],
+            [w.train_start for _, w in tasks],
+            [w.train_stop for _, w in tasks],
+            chunksize=max(1, len(windows) // 2),
+        ))
+        in_sample = pd.DataFrame(rows)
+        in_sample.insert(0, "Window", [w.index for _, w in tasks])
+
+        selected: list[SweepCandidate] = []
+        for w in windows:
+            best = _select(in_sample[in_sample["Window"] == w.index], objective, maximize)
+            selected.append(tasks[best][0])
+
+        test_rows = list(pool.map(
+            run_candidate,
+            selected,
+            [w.test_start for w in windows],
+            [w.test_stop for w in windows],
+            [True] * len(windows),
+        ))
+
+    # Stitch: each window's PnL is added on top of the previous windows' total
+    pieces: list[np.ndarray] = []
+    offset = 0.0
+    for row in test_rows:
+        pnl = row.pop("Equity") - config.initial_cash
+        pieces.append(pnl + offset)
+        offset += float(pnl[-1])
+    index = df.index[np.concatenate([np.arange(w.test_start, w.test_stop) for w in windows])]
+    equity = pd.Series(np.concatenate(pieces) + config.initial_cash, index=index, name="Equity")
+
+    out_of_sample = pd.DataFrame(test_rows)
+    out_of_sample.insert(0, "Window", [w.index for w in windows])
+
+    return WalkForwardResult(
+        windows=tuple(windows),
+        selected=tuple(selected),
+        in_sample=in_sample,
+        out_of_sample=out_of_sample,
+        equity=equity,
+    )
@@ -1,4 +1,6 @@
-from datetime import datetime
+from datetime import datetime, tzinfo
+
+import pandas as pd
 
 
 def format_utc_offset(ts: datetime) -> str:
@@ -13,4 +15,26 @@ def format_utc_offset(ts: datetime) -> str:
     total_min = int(offset.total_seconds() // 60)
     sign = "+" if total_min >= 0 else "-"
     hours, minutes = divmod(abs(total_min), 60)
-    return f"UTC{sign}{hours:02d}:{minutes:02d}"
\ No newline at end of file
+    return f"UTC{sign}{hours:02d}:{minutes:02d}"
+
+
+def to_timestamp(ts: pd.Timestamp | int, tz: tzinfo | str | None = "UTC") -> pd.Timestamp:
+    """
+    Event time -> pandas Timestamp (export boundary).
+    Epoch nanoseconds are UTC and come back in `tz`, the timezone of the
+    source data (None: the source was tz-naive, returns a naive Timestamp).
+    """
+    if isinstance(ts, int):
+        if tz is None:
+            return pd.Timestamp(ts, unit="ns")
+        return pd.Timestamp(ts, unit="ns", tz="UTC").tz_convert(tz)
+    return ts
+
+
+def to_epoch_ns(ts: pd.Timestamp | int) -> int:
+    """
+    Event time -> int epoch nanoseconds (UTC for tz-aware timestamps).
+    """
+    if isinstance(ts, int):
+        return ts
+    return ts.value
@@ -0,0 +1,3 @@
+from investiq_app.benchmarks.cli import main
+
+main()
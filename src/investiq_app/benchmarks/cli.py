@@ -0,0 +1,80 @@
+import argparse
+import json
+from pathlib import Path
+
+from investiq_app.benchmarks.suite import (
+    DEFAULT_SIZES,
+    PLANNERS,
+    BenchmarkCase,
+    compare_results,
+    results_to_json,
+    run_suite,
+)
+
+
+def _run(args: argparse.Namespace) -> None:
+    cases = [
+        BenchmarkCase(
+            n_bars=n,
+            planner=planner,
+            seed=args.seed,
+            precompute_features=args.precompute_features,
+            profile_stages=args.profile_stages,
+            diagnostics_level=args.diagnostics,
+            epoch_ns=args.epoch_ns,
+            alloc_sample_steps=args.alloc_sample,
+        )
+        for n in args.sizes
+        for planner in args.planners
+    ]
+    results = run_suite(cases)
+    for r in results:
+        rss = f"{r.peak_rss_mib:.0f} MiB" if r.peak_rss_mib is not None else "n/a"
+        print(
+            f"{r.case.n_bars:>10} bars | {r.case.planner:<14} | "
+            f"{r.bars_per_sec:>10.0f} bars/s | peak RSS {rss} | "
+            f"alloc/step {r.alloc_peak_bytes_per_step:.0f} B"
+        )
+    doc = results_to_json(results)
+    out = Path(args.out or f"bench_{(doc['meta']['commit'] or 'nocommit')[:10]}.json")
+    out.write_text(json.dumps(doc, indent=2, default=str), encoding="utf-8")
+    print(f"Saved {out}")
+
+
+def _compare(args: argparse.Namespace) -> None:
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    candidate = json.loads(Path(args.candidate).read_text(encoding="utf-8"))
+    for row in compare_results(baseline, candidate):
+        print(
+            f"{row['n_bars']:>10} bars | {row['planner']:<14} | "
+            f"{row['bars_per_sec']:>10.0f} bars/s | speedup x{row['speedup']:.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="InvestIQ backtest loop benchmarks (synthetic data)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run the benchmark suite and save results as JSON")
+    run.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run.add_argument("--planners", nargs="+", choices=sorted(PLANNERS), default=sorted(PLANNERS))
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--alloc-sample", type=int, default=5_000, help="bars traced for allocation stats")
+    run.add_argument("--precompute-features", action="store_true")
+    run.add_argument("--profile-stages", action="store_true")
+    run.add_argument("--epoch-ns", action="store_true", help="int64 nanosecond event timestamps")
+    run.add_argument("--diagnostics", choices=["off", "summary", "full"], default="full")
+    run.add_argument("--out", help="output JSON path (default: bench_<commit>.json)")
+    run.set_defaults(func=_run)
+
+    cmp_ = sub.add_parser("compare", help="compare two saved result files")
+    cmp_.add_argument("baseline")
+    cmp_.add_argument("candidate")
+    cmp_.set_defaults(func=_compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
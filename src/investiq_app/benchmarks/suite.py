@@ -0,0 +1,253 @@
+import logging
+import multiprocessing
+import platform
+import subprocess
+import sys
+import tracemalloc
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Final
+
+import numpy as np
+import pandas as pd
+
+from investiq.api.backtest import BacktestInput
+from investiq.api.instruments import AssetClass, InstrumentSpec
+from investiq.api.market import MarketDataEvent, MarketField
+from investiq.core.diagnostics import DiagnosticsLevel
+from investiq.core.engine import BacktestEngine
+from investiq.core.execution_planner import ExecutionPlanner
+from investiq.market_data import BarSize, DataFrameBacktestFeed
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq.utilities.logger.factory import LoggerFactory
+from investiq.utilities.logger.setup import init_base_logger
+from investiq_app.benchmarks.synthetic import synthetic_ohlcv
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.execution_planners.no_brackets import NoBracketsPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+import investiq_research.features  # registers feature pipelines
+
+DEFAULT_SIZES: Final[tuple[int, ...]] = (10_000, 100_000, 1_000_000, 10_000_000)
+
+PLANNERS: Final[Mapping[str, Callable[[], ExecutionPlanner]]] = {
+    "fixed_pct_oco": FixedPctOCOPlanner,
+    "no_brackets": NoBracketsPlanner,
+}
+
+_SYMBOL: Final[str] = "SYNTH"
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    n_bars: int
+    planner: str
+    fast_window: int = 20
+    slow_window: int = 100
+    seed: int = 0
+    precompute_features: bool = False
+    profile_stages: bool = False
+    diagnostics_level: str = "full"
+    epoch_ns: bool = False
+    alloc_sample_steps: int = 5_000
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    case: BenchmarkCase
+    elapsed_s: float
+    bars_per_sec: float
+    fills: int
+    # Process peak RSS (None where `resource` is unavailable, e.g. Windows)
+    peak_rss_mib: float | None
+    # Allocation pass over the first `alloc_sample_steps` bars (tracemalloc)
+    traced_peak_mib: float
+    alloc_peak_bytes_per_step: float
+    retained_bytes_per_step: float
+    stage_timings: Mapping[str, object] = field(default_factory=dict)
+
+
+class _AllocationProbe:
+    """
+    Wraps a feed and measures, between two events, the tracemalloc peak
+    reached while the engine processed the previous event.
+    """
+
+    def __init__(self, feed: DataFrameBacktestFeed):
+        self._feed = feed
+        self.steps: int = 0
+        self.alloc_peak_bytes: int = 0
+
+    def columns(self) -> Mapping[MarketField, np.ndarray]:
+        return self._feed.columns()
+
+    def __iter__(self) -> Iterator[MarketDataEvent]:
+        for event in self._feed:
+            tracemalloc.reset_peak()
+            base, _ = tracemalloc.get_traced_memory()
+            yield event
+            _, peak = tracemalloc.get_traced_memory()
+            self.alloc_peak_bytes += peak - base
+            self.steps += 1
+
+
+def _init_quiet_logging() -> LoggerFactory:
+    init_base_logger(debug=False)
+    logging.getLogger("InvestIQ").setLevel(logging.WARNING)
+    return LoggerFactory(engine_type="Benchmark", run_id="bench")
+
+
+def _build_engine(logger_factory: LoggerFactory, case: BenchmarkCase) -> BacktestEngine:
+    return bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=MovingAverageCrossStrategy(
+            fast_window=case.fast_window,
+            slow_window=case.slow_window,
+        ),
+        execution_planner=PLANNERS[case.planner](),
+        precompute_features=case.precompute_features,
+        profile_stages=case.profile_stages,
+        diagnostics_level=DiagnosticsLevel(case.diagnostics_level),
+    )
+
+
+def _bt_input(events) -> BacktestInput:
+    return BacktestInput(
+        instrument=InstrumentSpec(
+            symbol=_SYMBOL,
+            asset_class=AssetClass.CONT_FUT,
+            bar_size=BarSize.ONE_MINUTE,
+        ),
+        events=events,
+    )
+
+
+def _peak_rss_mib() -> float | None:
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(case: BenchmarkCase) -> BenchmarkResult:
+    """
+    Run one case: a timed full run, then a traced run over a sample of bars.
+    Meant to be executed in a fresh process so that peak RSS is per case.
+    """
+    logger_factory = _init_quiet_logging()
+    df = synthetic_ohlcv(case.n_bars, seed=case.seed)
+    feed_logger = logger_factory.child("BacktestFeed").get()
+
+    # 1. Timing pass (no tracing)
+    engine = _build_engine(logger_factory, case)
+    feed = DataFrameBacktestFeed(
+        logger=feed_logger, df=df, symbol=_SYMBOL, bar_size=BarSize.ONE_MINUTE, epoch_ns=case.epoch_ns
+    )
+    t0 = perf_counter()
+    result = engine.run(bt_input=_bt_input(feed))
+    elapsed = perf_counter() - t0
+    peak_rss = _peak_rss_mib()
+
+    # 2. Allocation pass (tracemalloc is slow: sample only)
+    sample = df.iloc[:min(case.n_bars, case.alloc_sample_steps)]
+    engine = _build_engine(logger_factory, case)
+    probe = _AllocationProbe(
+        DataFrameBacktestFeed(
+            logger=feed_logger, df=sample, symbol=_SYMBOL, bar_size=BarSize.ONE_MINUTE, epoch_ns=case.epoch_ns
+        )
+    )
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    engine.run(bt_input=_bt_input(probe))
+    current, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    steps = max(probe.steps, 1)
+
+    return BenchmarkResult(
+        case=case,
+        elapsed_s=elapsed,
+        bars_per_sec=case.n_bars / elapsed,
+        fills=len(result.execution_log),
+        peak_rss_mib=peak_rss,
+        traced_peak_mib=(traced_peak - base) / (1024 * 1024),
+        alloc_peak_bytes_per_step=probe.alloc_peak_bytes / steps,
+        retained_bytes_per_step=(current - base) / steps,
+        stage_timings=result.diagnostics.get("stage_timings", {}),
+    )
+
+
+def run_suite(cases: Sequence[BenchmarkCase]) -> list[BenchmarkResult]:
+    """
+    Run each case in its own fresh (spawned) process, sequentially.
+    """
+    results: list[BenchmarkResult] = []
+    for case in cases:
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results.append(pool.submit(run_case, case).result())
+    return results
+
+
+def environment_metadata() -> dict[str, object]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def results_to_json(results: Sequence[BenchmarkResult]) -> dict[str, object]:
+    return {
+        "meta": environment_metadata(),
+        "results": [asdict(r) for r in results],
+    }
+
+
+def compare_results(
+        baseline: Mapping[str, object],
+        candidate: Mapping[str, object],
+) -> list[dict[str, object]]:
+    """
+    Match cases of two saved runs and report candidate/baseline ratios.
+    """
+    def index(doc: Mapping[str, object]) -> dict[tuple, Mapping[str, object]]:
+        return {tuple(sorted(r["case"].items())): r for r in doc["results"]}
+
+    base_idx, cand_idx = index(baseline), index(candidate)
+    rows: list[dict[str, object]] = []
+    for key, cand in cand_idx.items():
+        base = base_idx.get(key)
+        if base is None:
+            continue
+        rows.append({
+            "n_bars": cand["case"]["n_bars"],
+            "planner": cand["case"]["planner"],
+            "bars_per_sec": cand["bars_per_sec"],
+            "speedup": cand["bars_per_sec"] / base["bars_per_sec"],
+            "alloc_peak_ratio": (
+                cand["alloc_peak_bytes_per_step"] / base["alloc_peak_bytes_per_step"]
+                if base["alloc_peak_bytes_per_step"] else None
+            ),
+            "peak_rss_ratio": (
+                cand["peak_rss_mib"] / base["peak_rss_mib"]
+                if cand["peak_rss_mib"] and base["peak_rss_mib"] else None
+            ),
+        })
+    return rows
@@ -0,0 +1,39 @@
+import numpy as np
+import pandas as pd
+
+
+def synthetic_ohlcv(
+        n_bars: int,
+        seed: int = 0,
+        start: str = "2020-01-01",
+        freq: str = "1min",
+        start_price: float = 15_000.0,
+        volatility: float = 2e-4,
+) -> pd.DataFrame:
+    """
+    Reproducible OHLCV frame following a geometric random walk.
+
+    - open = previous close, so bars chain without gaps
+    - high / low wrap open and close with a non-negative excursion
+    - timestamps are strictly increasing, UTC, spaced by `freq`
+    """
+    if n_bars <= 0:
+        raise ValueError("n_bars must be positive")
+
+    rng = np.random.default_rng(seed)
+    log_returns = rng.normal(0.0, volatility, n_bars)
+    close = start_price * np.exp(np.cumsum(log_returns))
+    open_ = np.empty_like(close)
+    open_[0] = start_price
+    open_[1:] = close[:-1]
+
+    excursion = np.abs(rng.normal(0.0, volatility, (2, n_bars))) * close
+    high = np.maximum(open_, close) + excursion[0]
+    low = np.minimum(open_, close) - excursion[1]
+    volume = rng.integers(1, 500, n_bars).astype(np.float64)
+
+    index = pd.date_range(start=start, periods=n_bars, freq=freq, tz="UTC")
+    return pd.DataFrame(
+        {"open": open_, "high": high, "low": low, "close": close, "volume": volume},
+        index=index,
+    )
@@ -1,5 +1,7 @@
+import os
+
 from investiq.market_data import BarSize
-from investiq_app.experiments.builder import build_experiment
+from investiq_app.experiments.builder import build_experiment, run_experiment
 from investiq.api.instruments import AssetClass, FutureCME
 from investiq_app.experiments.config import BacktestConfig
 from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
@@ -21,13 +23,11 @@ def main() -> None:
         execution_planner=FixedPctOCOPlanner(), #type: ignore
         filters=None,
         initial_cash=100_000,
+        # Opt-in: cached results are reused only when INVESTIQ_RESULT_CACHE names a directory
+        cache_dir=os.getenv("INVESTIQ_RESULT_CACHE"),
     )
     bundle = build_experiment(config=config)
-    result = bundle.backtest_engine.run(bt_input=bundle.backtest_input)
-    bundle.exporter.export(
-        execution_log=result.execution_log,
-        metrics=result.metrics
-    )
+    run_experiment(bundle)
 
 if __name__ == "__main__":
     main()
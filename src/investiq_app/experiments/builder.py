@@ -15,6 +15,7 @@ from investiq.market_data import (
 )
 
 from investiq.api.backtest import BacktestInput
+from investiq.api.execution import RunResult
 from investiq.api.instruments import InstrumentSpec
 from investiq.core.engine import BacktestEngine
 
@@ -24,6 +25,7 @@ from investiq.export_engine.runner import BacktestExportRunner
 from investiq.utilities.logger.factory import LoggerFactory
 from investiq.utilities.logger.setup import init_base_logger
 from investiq.runs.builder import bootstrap_backtest_engine
+from investiq.runs.cache import ResultCache, result_key
 from investiq_app.experiments.config import BacktestConfig
 
 @dataclass
@@ -32,6 +34,9 @@ class BacktestBundle:
     backtest_input: BacktestInput
     backtest_engine: BacktestEngine
     exporter: BacktestExportRunner
+    # Set when the config enables the result cache
+    result_cache: ResultCache | None = None
+    cache_key: str | None = None
 
 
 class FutureCME:
@@ -114,10 +119,49 @@ def build_experiment(config: BacktestConfig) -> BacktestBundle:
         )
     )
 
-    # 5. Return BacktestBundle
+    # 5. Result cache, addressed by data contents + components + engine version
+    result_cache = None
+    cache_key = None
+    if config.cache_dir is not None:
+        result_cache = ResultCache(config.cache_dir, max_bytes=config.cache_max_bytes)
+        cache_key = result_key(
+            df=df,
+            strategy=config.strategy,
+            execution_planner=config.execution_planner,
+            filters=config.filters,
+            initial_cash=config.initial_cash,
+        )
+
+    # 6. Return BacktestBundle
     return BacktestBundle(
         logger_factory=logger_factory,
         backtest_input=bt_input,
         backtest_engine=backtest_engine,
-        exporter=export_runner
-    )
\ No newline at end of file
+        exporter=export_runner,
+        result_cache=result_cache,
+        cache_key=cache_key,
+    )
+
+
+def run_experiment(bundle: BacktestBundle) -> RunResult:
+    """
+    Run and export the experiment, unless the result cache already holds
+    this exact run: a hit returns the stored RunResult (no run, no export).
+    """
+    logger = bundle.logger_factory.child("Experiment").get()
+    cache = bundle.result_cache
+    if cache is not None and bundle.cache_key is not None:
+        result = cache.get(bundle.cache_key)
+        if result is not None:
+            logger.info(f"Result cache hit {bundle.cache_key[:12]}")
+            return result
+
+    result = bundle.backtest_engine.run(bt_input=bundle.backtest_input)
+    bundle.exporter.export(
+        execution_log=result.execution_log,
+        metrics=result.metrics,
+        tz=result.tz,
+    )
+    if cache is not None and bundle.cache_key is not None:
+        cache.put(bundle.cache_key, result)
+    return result
\ No newline at end of file
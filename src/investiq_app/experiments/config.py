@@ -17,4 +17,8 @@ class BacktestConfig:
     strategy : Strategy
     execution_planner: ExecutionPlanner
     filters : list[Filter] | None
-    initial_cash : int
\ No newline at end of file
+    initial_cash : int
+    # Local RunResult cache (None disables it); least recently used entries
+    # are evicted beyond `cache_max_bytes`
+    cache_dir: str | None = None
+    cache_max_bytes: int = 1 << 30
@@ -6,6 +6,9 @@ class NoBracketsPlanner:
     """
     Pure target execution (no SL/TP).
     """
+    def cache_params(self) -> dict[str, object]:
+        return {}
+
     def plan(
             self,
             *,
@@ -0,0 +1,159 @@
+from collections.abc import Mapping
+from math import sqrt
+from typing import ClassVar
+
+import numpy as np
+
+from investiq.api.market import MarketField
+from investiq.core.features.factory import PipelineSpec
+from investiq.core.features.registry import register_feature_pipeline
+from investiq.core.features.store import FeatureStore
+from investiq.core.market_state_builder import MarketStateBuilder
+from investiq_research.features.RollingMoments import RollingMomentsPipeline, moments_key, sum_feature, var_feature
+
+
+def bollinger_features(window: int, k: float) -> tuple[str, str, str]:
+    """
+    (mid, upper, lower) feature names of BollingerPipeline(window, k).
+    """
+    suffix = f"{window}_{k:g}"
+    return f"bb_mid_{suffix}", f"bb_upper_{suffix}", f"bb_lower_{suffix}"
+
+
+def bollinger_key(window: int, k: float) -> str:
+    return f"{BollingerPipeline.NAME}_{window}_{k:g}"
+
+
+def zscore_feature(window: int) -> str:
+    return f"zscore_{window}"
+
+
+def zscore_key(window: int) -> str:
+    return f"{ZScorePipeline.NAME}_{window}"
+
+
+def _mean_std(feature_store: FeatureStore, window: int) -> tuple[float, float]:
+    mean = feature_store.get_value(sum_feature(window)) / window
+    return mean, sqrt(feature_store.get_value(var_feature(window)))
+
+
+def _mean_std_bulk(arrays: Mapping[str, np.ndarray], window: int) -> tuple[np.ndarray, np.ndarray]:
+    return arrays[sum_feature(window)] / window, np.sqrt(arrays[var_feature(window)])
+
+
+@register_feature_pipeline
+class BollingerPipeline:
+    """
+    Bollinger bands over CLOSE, derived from the shared rolling moments.
+
+    Reads no market data: skipped by the FeatureStore on bars where the
+    rolling moments did not change.
+
+    Outputs are namespaced by window and k (see `bollinger_features`), so
+    several bands can share a FeatureStore.
+
+    Output:
+        bb_mid_<w>_<k>, bb_upper_<w>_<k>, bb_lower_<w>_<k> – mean and
+        mean ± k * std over `window` bars.
+    """
+    NAME: ClassVar[str] = "BOLLINGER"
+    market_inputs: ClassVar[frozenset[MarketField]] = frozenset()
+    max_lookback: ClassVar[int | None] = 1
+
+    def __init__(self, window: int = 20, k: float = 2.0):
+        if k <= 0:
+            raise ValueError("k must be positive")
+        self.window = window
+        self.k = k
+        self.key: str = bollinger_key(window, k)
+        self._mid, self._upper, self._lower = bollinger_features(window, k)
+        self.produces: frozenset[str] = frozenset({self._mid, self._upper, self._lower})
+        self.consumes: frozenset[str] = frozenset({sum_feature(window), var_feature(window)})
+        self.dependencies: tuple[PipelineSpec, ...] = (
+            PipelineSpec.of(RollingMomentsPipeline.NAME, {"window": window}),
+        )
+
+    def reset(self) -> None:
+        pass
+
+    def get_state(self) -> dict[str, object]:
+        return {}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        pass
+
+    def update(
+            self,
+            *,
+            market_store: MarketStateBuilder,
+            feature_store: FeatureStore
+    ) -> None:
+        if not feature_store.pipeline_ready(moments_key(self.window)):
+            return
+        mean, std = _mean_std(feature_store, self.window)
+        feature_store.set_value(self._mid, mean)
+        feature_store.set_value(self._upper, mean + self.k * std)
+        feature_store.set_value(self._lower, mean - self.k * std)
+        feature_store.set_pipeline_ready(self.key)
+
+    def compute_bulk(
+            self,
+            arrays: Mapping[str, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        mean, std = _mean_std_bulk(arrays, self.window)
+        return {self._mid: mean, self._upper: mean + self.k * std, self._lower: mean - self.k * std}
+
+
+@register_feature_pipeline
+class ZScorePipeline:
+    """
+    Z-score of CLOSE against its rolling mean / std (shared rolling moments).
+
+    Output:
+        zscore_<window> – (close - mean) / std, 0.0 when the window is flat.
+    """
+    NAME: ClassVar[str] = "ZSCORE"
+    market_inputs: ClassVar[frozenset[MarketField]] = frozenset({MarketField.CLOSE})
+    max_lookback: ClassVar[int | None] = 1
+
+    def __init__(self, window: int = 20):
+        self.window = window
+        self.key: str = zscore_key(window)
+        self.produces: frozenset[str] = frozenset({zscore_feature(window)})
+        self.consumes: frozenset[str] = frozenset({sum_feature(window), var_feature(window)})
+        self.dependencies: tuple[PipelineSpec, ...] = (
+            PipelineSpec.of(RollingMomentsPipeline.NAME, {"window": window}),
+        )
+
+    def reset(self) -> None:
+        pass
+
+    def get_state(self) -> dict[str, object]:
+        return {}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        pass
+
+    def update(
+            self,
+            *,
+            market_store: MarketStateBuilder,
+            feature_store: FeatureStore
+    ) -> None:
+        if not feature_store.pipeline_ready(moments_key(self.window)):
+            return
+        mean, std = _mean_std(feature_store, self.window)
+        close = market_store.view().snapshot.bar.close
+        feature_store.set_value(zscore_feature(self.window), (close - mean) / std if std > 0.0 else 0.0)
+        feature_store.set_pipeline_ready(self.key)
+
+    def compute_bulk(
+            self,
+            arrays: Mapping[str, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        mean, std = _mean_std_bulk(arrays, self.window)
+        closes = np.asarray(arrays[MarketField.CLOSE], dtype=np.float64)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = np.where(std > 0.0, (closes - mean) / std, 0.0)
+        z[np.isnan(mean)] = np.nan
+        return {zscore_feature(self.window): z}
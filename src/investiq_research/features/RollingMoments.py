@@ -0,0 +1,239 @@
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from math import fsum
+from typing import ClassVar, Final
+
+import numpy as np
+
+from investiq.api.market import MarketField
+from investiq.core.features.factory import PipelineSpec
+from investiq.core.features.registry import register_feature_pipeline
+from investiq.core.features.store import FeatureStore
+from investiq.core.market_state_builder import MarketStateBuilder
+
+# Running sums are recomputed from the window every RESEED_EVERY bars, so
+# rounding errors of the O(1) updates cannot accumulate over long runs.
+RESEED_EVERY: Final[int] = 4096
+
+
+def sum_feature(window: int) -> str:
+    return f"close_sum_{window}"
+
+
+def var_feature(window: int) -> str:
+    return f"close_var_{window}"
+
+
+def sum_key(window: int) -> str:
+    return f"{RollingSumPipeline.NAME}_{window}"
+
+
+def moments_key(window: int) -> str:
+    return f"{RollingMomentsPipeline.NAME}_{window}"
+
+
+def _seed_sum(values: Sequence[float]) -> float:
+    return fsum(map(float, values))
+
+
+def _seed_m2(values: Sequence[float], window: int) -> float:
+    # Two-pass sum of squared deviations: exact for a flat window
+    mean = _seed_sum(values) / window
+    return fsum((float(v) - mean) ** 2 for v in values)
+
+
+def _reseeded_cumsum(
+        n: int,
+        window: int,
+        seed: Callable[[int], float],
+        increments: np.ndarray,
+) -> np.ndarray:
+    """
+    Running values for bars window-1 .. n-1: `seed(i)` on every RESEED_EVERY-th
+    bar (starting at the first full window), then `increments[i - window]`
+    accumulated sequentially by np.cumsum, as the per-bar update does.
+    """
+    out = np.full(n, np.nan, dtype=np.float64)
+    for start in range(window - 1, n, RESEED_EVERY):
+        stop = min(start + RESEED_EVERY, n)
+        out[start:stop] = np.cumsum(
+            np.concatenate(([seed(start)], increments[start + 1 - window:stop - window]))
+        )
+    return out
+
+
+@dataclass
+class _RollingSumState:
+    """
+    Incremental rolling sum (O(1) updates once warmup is complete, reseeded
+    every RESEED_EVERY bars).
+    """
+    window: int
+    value: float | None = None
+    count: int = 0
+
+    def reset(self) -> None:
+        self.value = None
+        self.count = 0
+
+    def update(self, series: Sequence[float]) -> float | None:
+        if len(series) < self.window:
+            self.reset()
+            return None
+        if self.value is None or self.count % RESEED_EVERY == 0:
+            self.value = _seed_sum(series[-self.window:])
+        else:
+            self.value = self.value + (series[-1] - series[-self.window - 1])
+        self.count += 1
+        return self.value
+
+    def bulk(self, series: np.ndarray) -> np.ndarray:
+        """
+        Vectorized equivalent of `update()` on every prefix (same seeds and
+        increments, accumulated sequentially by np.cumsum).
+        """
+        w = self.window
+        return _reseeded_cumsum(
+            series.shape[0], w, lambda i: _seed_sum(series[i + 1 - w:i + 1]), series[w:] - series[:-w]
+        )
+
+
+@register_feature_pipeline
+class RollingSumPipeline:
+    """
+    Shared intermediate: rolling sum of CLOSE over `window` bars.
+
+    Output:
+        close_sum_<window> – consumed by SMA and the rolling moments instead
+        of each recomputing it.
+    """
+    NAME: ClassVar[str] = "ROLLING_SUM"
+    consumes: ClassVar[frozenset[str]] = frozenset()
+    market_inputs: ClassVar[frozenset[MarketField]] = frozenset({MarketField.CLOSE})
+
+    def __init__(self, window: int = 20):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.key: str = sum_key(window)
+        self.produces: frozenset[str] = frozenset({sum_feature(window)})
+        self._sum = _RollingSumState(window=window)
+        # incremental update drops series[-window - 1]
+        self.max_lookback: int | None = window + 1
+
+    def reset(self) -> None:
+        self._sum.reset()
+
+    def get_state(self) -> dict[str, object]:
+        return {"sum": self._sum.value, "count": self._sum.count}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self._sum.value = state["sum"]
+        self._sum.count = state["count"]
+
+    def update(
+            self,
+            *,
+            market_store: MarketStateBuilder,
+            feature_store: FeatureStore
+    ) -> None:
+        close_seq = market_store.view().history.get(MarketField.CLOSE)
+        if close_seq is None:
+            return
+        s = self._sum.update(close_seq)
+        if s is None:
+            return
+        feature_store.set_value(sum_feature(self.window), s)
+        feature_store.set_pipeline_ready(self.key)
+
+    def compute_bulk(
+            self,
+            arrays: Mapping[MarketField, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        closes = np.asarray(arrays[MarketField.CLOSE], dtype=np.float64)
+        return {sum_feature(self.window): self._sum.bulk(closes)}
+
+
+@register_feature_pipeline
+class RollingMomentsPipeline:
+    """
+    Shared intermediate: rolling (population) variance of CLOSE over `window`
+    bars, on top of the shared rolling sum.
+
+    The sum of squared deviations is updated in O(1) per bar with the
+    Welford-style sliding-window recurrence
+        M2 += (x_in - x_out) * ((x_in - mean) + (x_out - mean_prev))
+    instead of E[x²] - E[x]² (which cancels catastrophically at price
+    levels), reseeded exactly every RESEED_EVERY bars and clamped at 0.
+
+    Output:
+        close_var_<window> – consumed with close_sum_<window> by mean/variance
+        based pipelines (Bollinger, z-score) instead of each recomputing them.
+    """
+    NAME: ClassVar[str] = "ROLLING_MOMENTS"
+    market_inputs: ClassVar[frozenset[MarketField]] = frozenset({MarketField.CLOSE})
+
+    def __init__(self, window: int = 20):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.key: str = moments_key(window)
+        self.consumes: frozenset[str] = frozenset({sum_feature(window)})
+        self.produces: frozenset[str] = frozenset({var_feature(window)})
+        self.dependencies: tuple[PipelineSpec, ...] = (
+            PipelineSpec.of(RollingSumPipeline.NAME, {"window": window}),
+        )
+        # incremental update drops series[-window - 1]
+        self.max_lookback: int | None = window + 1
+        self._m2: float | None = None
+        self._prev_sum: float | None = None
+        self._count = 0
+
+    def reset(self) -> None:
+        self._m2 = None
+        self._prev_sum = None
+        self._count = 0
+
+    def get_state(self) -> dict[str, object]:
+        return {"m2": self._m2, "prev_sum": self._prev_sum, "count": self._count}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        self._m2 = state["m2"]
+        self._prev_sum = state["prev_sum"]
+        self._count = state["count"]
+
+    def update(
+            self,
+            *,
+            market_store: MarketStateBuilder,
+            feature_store: FeatureStore
+    ) -> None:
+        if not feature_store.pipeline_ready(sum_key(self.window)):
+            self.reset()
+            return
+        w = self.window
+        close_seq = market_store.view().history.get(MarketField.CLOSE)
+        s = feature_store.get_value(sum_feature(w))
+        if self._m2 is None or self._count % RESEED_EVERY == 0:
+            self._m2 = _seed_m2(close_seq[-w:], w)
+        else:
+            x_in = close_seq[-1]
+            x_out = close_seq[-w - 1]
+            self._m2 = self._m2 + (x_in - x_out) * ((x_in - s / w) + (x_out - self._prev_sum / w))
+        self._prev_sum = s
+        self._count += 1
+        feature_store.set_value(var_feature(w), max(self._m2 / w, 0.0))
+        feature_store.set_pipeline_ready(self.key)
+
+    def compute_bulk(
+            self,
+            arrays: Mapping[MarketField, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        w = self.window
+        closes = np.asarray(arrays[MarketField.CLOSE], dtype=np.float64)
+        sums = arrays[sum_feature(w)]
+        x_in = closes[w:]
+        x_out = closes[:-w]
+        increments = (x_in - x_out) * ((x_in - sums[w:] / w) + (x_out - sums[w - 1:-1] / w))
+        m2 = _reseeded_cumsum(closes.shape[0], w, lambda i: _seed_m2(closes[i + 1 - w:i + 1], w), increments)
+        return {var_feature(w): np.maximum(m2 / w, 0.0)}
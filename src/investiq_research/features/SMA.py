@@ -1,57 +1,102 @@
-from collections.abc import Sequence
-from dataclasses import dataclass
+from collections.abc import Mapping
 from typing import ClassVar
 
+import numpy as np
+
 from investiq.api.market import MarketField
+from investiq.core.features.factory import PipelineSpec
 from investiq.core.features.registry import register_feature_pipeline
 from investiq.core.features.store import FeatureStore
 from investiq.core.market_state_builder import MarketStateBuilder
+from investiq_research.features.RollingMoments import RollingSumPipeline, sum_feature, sum_key
+
+
+def sma_feature(window: int) -> str:
+    return f"sma_{window}"
+
+
+def sma_key(window: int) -> str:
+    return f"{SMAPipeline.NAME}_{window}"
 
-@dataclass
-class _SMAState:
+
+@register_feature_pipeline
+class SMAPipeline:
     """
-    Incremental Simple Moving Average state.
-    Maintains the rolling SMA using O(1) updates once warmup is complete.
+    Simple moving average of CLOSE over `window` bars, derived from the
+    shared rolling sum (one RollingSumPipeline per window, whoever needs it).
+
+    Outputs are namespaced by window, so strategies needing several averages
+    (or several strategies sharing a FeatureStore) request one instance per
+    window and every distinct window is computed once.
+
+    Reads no market data: skipped by the FeatureStore on bars where the
+    rolling sum did not change.
+
+    Output:
+        sma_<window> – rolling mean of the last `window` closes.
     """
-    window: int
-    value: float | None = None
+    NAME: ClassVar[str] = "SMA"
+    market_inputs: ClassVar[frozenset[MarketField]] = frozenset()
+    max_lookback: ClassVar[int | None] = 1
+
+    def __init__(self, window: int = 20):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        self.window = window
+        self.key: str = sma_key(window)
+        self.consumes: frozenset[str] = frozenset({sum_feature(window)})
+        self.produces: frozenset[str] = frozenset({sma_feature(window)})
+        self.dependencies: tuple[PipelineSpec, ...] = (
+            PipelineSpec.of(RollingSumPipeline.NAME, {"window": window}),
+        )
 
     def reset(self) -> None:
-        """Reset internal SMA state."""
-        self.value = None
+        pass
 
-    def update(self, series: Sequence[float]) -> float | None:
-        """
-        Update the SMA using the latest series values.
-
-        Returns: float | None
-        Current SMA if enough observations are available, otherwise None.
-        """
-        n = len(series)
+    def get_state(self) -> dict[str, object]:
+        return {}
 
-        if n < self.window:
-            self.value = None
-            return None
+    def set_state(self, state: Mapping[str, object]) -> None:
+        pass
 
-        if self.value is None or n == self.window:
-            self.value = sum(series[-self.window:]) / self.window
-            return self.value
+    def update(
+            self,
+            *,
+            market_store: MarketStateBuilder,
+            feature_store: FeatureStore
+    ) -> None:
+        """
+        Publish the average of the current rolling sum once it is available.
+        """
+        if not feature_store.pipeline_ready(sum_key(self.window)):
+            return
+        s = feature_store.get_value(sum_feature(self.window))
+        feature_store.set_value(sma_feature(self.window), s / self.window)
+        feature_store.set_pipeline_ready(self.key)
 
-        x_t = series[-1]
-        x_out = series[-self.window - 1]
-        self.value = self.value + (x_t - x_out) / self.window
-        return self.value
+    def compute_bulk(
+            self,
+            arrays: Mapping[str, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        return {sma_feature(self.window): arrays[sum_feature(self.window)] / self.window}
 
 
 @register_feature_pipeline
-class SMAPipeline:
+class SMAFastSlowPipeline:
     """
-    Feature pipeline producing fast and slow SMAs from CLOSE prices.
+    Fast and slow SMAs of CLOSE under the original, stable feature names,
+    derived from the shared rolling sums (one RollingSumPipeline per window,
+    shared with SMAPipeline and the rolling moments).
+
+    Ready once both averages are available. Reads no market data.
 
     Output:
-        ma_fast, ma_slow – rolling moving averages for the configured windows.
+        ma_fast, ma_slow – rolling means over `fast_window` / `slow_window` bars.
     """
     NAME: ClassVar[str] = "SMA_FAST_SLOW"
+    produces: ClassVar[frozenset[str]] = frozenset({"ma_fast", "ma_slow"})
+    market_inputs: ClassVar[frozenset[MarketField]] = frozenset()
+    max_lookback: ClassVar[int | None] = 1
 
     def __init__(
             self,
@@ -62,16 +107,22 @@ class SMAPipeline:
             raise ValueError("fast_window and slow_window must be positive")
         if fast_window >= slow_window:
             raise ValueError("fast_window must be < slow_window")
-
-        self._fast = _SMAState(window=fast_window)
-        self._slow = _SMAState(window=slow_window)
+        self.fast_window = fast_window
+        self.slow_window = slow_window
+        self.consumes: frozenset[str] = frozenset({sum_feature(fast_window), sum_feature(slow_window)})
+        self.dependencies: tuple[PipelineSpec, ...] = (
+            PipelineSpec.of(RollingSumPipeline.NAME, {"window": fast_window}),
+            PipelineSpec.of(RollingSumPipeline.NAME, {"window": slow_window}),
+        )
 
     def reset(self) -> None:
-        """
-        Reset internal rolling statistics.
-        """
-        self._fast.reset()
-        self._slow.reset()
+        pass
+
+    def get_state(self) -> dict[str, object]:
+        return {}
+
+    def set_state(self, state: Mapping[str, object]) -> None:
+        pass
 
     def update(
             self,
@@ -80,23 +131,21 @@ class SMAPipeline:
             feature_store: FeatureStore
     ) -> None:
         """
-        Compute SMAs for the current tick and write features to the FeatureStore.
-        Marks the pipeline ready when both averages are available.
+        Publish both averages once both rolling sums are available.
         """
-        market_view = market_store.view()
-        close_seq = market_view.history.get(MarketField.CLOSE)
-
-        if close_seq is None:
+        fast, slow = self.fast_window, self.slow_window
+        if not (feature_store.pipeline_ready(sum_key(fast)) and feature_store.pipeline_ready(sum_key(slow))):
             return
+        feature_store.set_value("ma_fast", feature_store.get_value(sum_feature(fast)) / fast)
+        feature_store.set_value("ma_slow", feature_store.get_value(sum_feature(slow)) / slow)
+        feature_store.set_pipeline_ready(self.NAME)
 
-        closes = list(close_seq)
-
-        ma_fast = self._fast.update(closes)
-        ma_slow = self._slow.update(closes)
-
-        if ma_fast is None or ma_slow is None:
-            return
-
-        feature_store.set_value("ma_fast", ma_fast)
-        feature_store.set_value("ma_slow", ma_slow)
-        feature_store.set_pipeline_ready(self.NAME)
\ No newline at end of file
+    def compute_bulk(
+            self,
+            arrays: Mapping[str, np.ndarray]
+    ) -> dict[str, np.ndarray]:
+        ma_fast = arrays[sum_feature(self.fast_window)] / self.fast_window
+        ma_slow = arrays[sum_feature(self.slow_window)] / self.slow_window
+        # like update(): published only once both averages are available
+        ma_fast[np.isnan(ma_slow)] = np.nan
+        return {"ma_fast": ma_fast, "ma_slow": ma_slow}
@@ -1 +1,3 @@
 import investiq_research.features.SMA  # déclenche register_feature_pipeline
+import investiq_research.features.RollingMoments
+import investiq_research.features.Bollinger
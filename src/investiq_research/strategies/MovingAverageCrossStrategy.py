@@ -2,7 +2,7 @@ from investiq.api.backtest import BacktestView
 from investiq.api.execution import Decision
 from investiq.api.market import MarketField
 from investiq.api.strategy import StrategyMetadata
-from investiq_research.features.SMA import SMAPipeline
+from investiq_research.features.SMA import SMAPipeline, sma_feature, sma_key
 
 
 class MovingAverageCrossStrategy:
@@ -17,6 +17,9 @@ class MovingAverageCrossStrategy:
         if fast_window >= slow_window:
             raise ValueError("fast_window must be < slow_window for a classic MA cross")
 
+        self.fast_window = fast_window
+        self.slow_window = slow_window
+
         self.metadata = StrategyMetadata(
             name="MovingAverageCross",
             version="1.0.0",
@@ -25,7 +28,12 @@ class MovingAverageCrossStrategy:
             price_type=MarketField.CLOSE,
             required_fields=frozenset({MarketField.CLOSE}),
             required_pipelines=frozenset({SMAPipeline.NAME}),
-            required_features=frozenset({"ma_fast", "ma_slow"}),
+            required_features=frozenset({sma_feature(fast_window), sma_feature(slow_window)}),
+            # reads the current bar only; SMAPipeline declares its own lookback
+            max_lookback=1,
+            pipeline_parameters={
+                SMAPipeline.NAME: ({"window": fast_window}, {"window": slow_window}),
+            },
         )
 
     def decide(self, view: BacktestView) -> Decision:
@@ -34,10 +42,9 @@ class MovingAverageCrossStrategy:
         close = view.market.bar.close
         fv = view.features
 
-        pipeline = SMAPipeline.NAME
-
-        # Gate on pipeline readiness (this tick)
-        if not fv.pipeline_is_ready(pipeline):
+        # Gate on pipeline readiness (this tick); the slow average is ready last
+        pipeline = sma_key(self.slow_window)
+        if not (fv.pipeline_is_ready(sma_key(self.fast_window)) and fv.pipeline_is_ready(pipeline)):
             return Decision(
                 timestamp=ts,
                 target_position=0.0,
@@ -45,11 +52,11 @@ class MovingAverageCrossStrategy:
                 diagnostics={
                     "warming_up": True,
                     "pipeline": pipeline,
-                },
+                } if view.collect_diagnostics else None,
             )
 
-        ma_fast = fv.require("ma_fast")
-        ma_slow = fv.require("ma_slow")
+        ma_fast = fv.require(sma_feature(self.fast_window))
+        ma_slow = fv.require(sma_feature(self.slow_window))
 
         if ma_fast > ma_slow:
             target = 1.0
@@ -65,5 +72,5 @@ class MovingAverageCrossStrategy:
             diagnostics={
                 "ma_fast": ma_fast,
                 "ma_slow": ma_slow,
-            },
+            } if view.collect_diagnostics else None,
         )
\ No newline at end of file
@@ -0,0 +1,95 @@
+import logging
+from collections.abc import Callable, Sequence
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from investiq.api.backtest import BacktestInput
+from investiq.api.instruments import AssetClass, InstrumentSpec
+from investiq.core.features.api import FeaturePipeline
+from investiq.core.features.graph import pipeline_key, produces
+from investiq.core.features.store import FeatureStore
+from investiq.core.market_state_builder import MarketStateBuilder
+from investiq.market_data import BarSize, DataFrameBacktestFeed
+from investiq.utilities.logger.factory import LoggerFactory
+from investiq.utilities.logger.setup import init_base_logger
+from investiq_app.benchmarks.synthetic import synthetic_ohlcv
+
+import investiq_research.features  # registers the research pipelines
+
+SYMBOL = "TEST"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _base_logger(tmp_path_factory: pytest.TempPathFactory) -> None:
+    run_dir = tmp_path_factory.mktemp("runs")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("INVESTIQ_RUN_DIR", str(run_dir))
+        init_base_logger(debug=False, log_file=run_dir / "output.log")
+    logging.getLogger("InvestIQ").setLevel(logging.WARNING)
+
+
+@pytest.fixture(scope="session")
+def logger_factory() -> LoggerFactory:
+    return LoggerFactory(engine_type="Test", run_id="test")
+
+
+@pytest.fixture(scope="session")
+def ohlcv() -> pd.DataFrame:
+    return synthetic_ohlcv(3_000, seed=3)
+
+
+def backtest_input(
+        logger_factory: LoggerFactory,
+        df: pd.DataFrame,
+        epoch_ns: bool = False,
+        symbol: str = SYMBOL,
+) -> BacktestInput:
+    return BacktestInput(
+        instrument=InstrumentSpec(symbol=symbol, asset_class=AssetClass.CONT_FUT, bar_size=BarSize.ONE_MINUTE),
+        events=DataFrameBacktestFeed(
+            logger=logger_factory.child("BacktestFeed").get(),
+            df=df,
+            symbol=symbol,
+            bar_size=BarSize.ONE_MINUTE,
+            epoch_ns=epoch_ns,
+        ),
+    )
+
+
+def fill_rows(result) -> list[tuple]:
+    """
+    Comparable content of a run's execution log.
+    """
+    return [
+        (f.timestamp, f.operation_type, f.side, f.quantity, f.execution_price, f.realized_pnl, f.position_after, f.cash_after)
+        for f in result.execution_log
+    ]
+
+
+def feature_columns(
+        logger_factory: LoggerFactory,
+        make_pipelines: Callable[[], Sequence[FeaturePipeline]],
+        df: pd.DataFrame,
+        bulk: bool = False,
+) -> dict[str, np.ndarray]:
+    """
+    Every feature as served bar by bar (NaN while its pipeline is not ready),
+    computed per bar or, with `bulk`, precomputed over the whole frame.
+    """
+    pipelines = make_pipelines()
+    store = FeatureStore(logger_factory.child("FeatureStore").get(), pipelines=pipelines)
+    feed = backtest_input(logger_factory, df).events
+    if bulk:
+        store.precompute(feed.columns())
+    market = MarketStateBuilder()
+    owner = {feature: pipeline_key(p) for p in pipelines for feature in produces(p)}
+    out = {feature: np.full(len(df), np.nan) for feature in owner}
+    for i, event in enumerate(feed):
+        market.ingest(event)
+        store.ingest(market)
+        for feature, key in owner.items():
+            if store.pipeline_ready(key):
+                out[feature][i] = store.get_value(feature)
+    return out
@@ -0,0 +1,99 @@
+import pytest
+
+from investiq.api.backtest import BacktestInput
+from investiq.core.checkpoint import CheckpointManager
+from investiq.runs.audit import ChunkedAuditSink, load_audit
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input, fill_rows
+
+CRASH_AT = 2_250
+
+
+class Crash(Exception):
+    pass
+
+
+class CrashingFeed:
+    """
+    Feed raising after `crash_at` bars (columns() kept for bulk mode).
+    """
+
+    def __init__(self, feed, crash_at: int):
+        self._feed = feed
+        self._crash_at = crash_at
+
+    def columns(self):
+        return self._feed.columns()
+
+    def __iter__(self):
+        for i, event in enumerate(self._feed):
+            if i == self._crash_at:
+                raise Crash
+            yield event
+
+
+def _engine(logger_factory, bulk, checkpoints=None, audit_sink=None):
+    return bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=MovingAverageCrossStrategy(10, 50),
+        execution_planner=FixedPctOCOPlanner(),
+        precompute_features=bulk,
+        checkpoints=checkpoints,
+        audit_sink=audit_sink,
+    )
+
+
+def _crash(engine, bt_input: BacktestInput) -> None:
+    with pytest.raises(Crash):
+        engine.run(BacktestInput(bt_input.instrument, CrashingFeed(bt_input.events, CRASH_AT)))
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_resume_after_crash_matches_uninterrupted_run(logger_factory, ohlcv, tmp_path, bulk):
+    full = _engine(logger_factory, bulk).run(backtest_input(logger_factory, ohlcv))
+
+    checkpoints = CheckpointManager(tmp_path, every_n_bars=1_000)
+    _crash(_engine(logger_factory, bulk, checkpoints), backtest_input(logger_factory, ohlcv))
+    assert checkpoints.latest().bars == 2_000
+
+    resumed = _engine(logger_factory, bulk, checkpoints).run(backtest_input(logger_factory, ohlcv), resume=True)
+
+    assert resumed.metrics == full.metrics
+    assert (resumed.start, resumed.end) == (full.start, full.end)
+    assert fill_rows(resumed) == fill_rows(full)
+
+
+def test_continued_run_matches_uninterrupted_run(logger_factory, ohlcv):
+    full = _engine(logger_factory, False).run(backtest_input(logger_factory, ohlcv))
+
+    engine = _engine(logger_factory, False)
+    engine.run(backtest_input(logger_factory, ohlcv.iloc[:1_700]))
+    continued = engine.run(backtest_input(logger_factory, ohlcv))
+
+    assert engine.bars == len(ohlcv)
+    assert fill_rows(continued) == fill_rows(full)
+
+
+def test_resume_keeps_audit_trail(logger_factory, ohlcv, tmp_path):
+    def sink(name):
+        return ChunkedAuditSink(tmp_path / name, chunk_size=700)
+
+    _engine(logger_factory, False, audit_sink=sink("full")).run(backtest_input(logger_factory, ohlcv))
+    expected = load_audit(tmp_path / "full")
+
+    checkpoints = CheckpointManager(tmp_path / "ckpt", every_n_bars=1_000)
+    _crash(_engine(logger_factory, False, checkpoints, sink("resumed")), backtest_input(logger_factory, ohlcv))
+    _engine(logger_factory, False, checkpoints, sink("resumed")).run(backtest_input(logger_factory, ohlcv), resume=True)
+    audit = load_audit(tmp_path / "resumed")
+
+    assert len(audit) == len(ohlcv)
+    assert audit["bar_index"].tolist() == list(range(len(ohlcv)))
+    assert audit.equals(expected)
+
+
+def test_fresh_audit_sink_refuses_existing_chunks(logger_factory, ohlcv, tmp_path):
+    _engine(logger_factory, False, audit_sink=ChunkedAuditSink(tmp_path)).run(backtest_input(logger_factory, ohlcv))
+    with pytest.raises(FileExistsError):
+        _engine(logger_factory, False, audit_sink=ChunkedAuditSink(tmp_path)).run(backtest_input(logger_factory, ohlcv))
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from investiq.runs.cross_validation import mask_segments, purged_kfold, run_purged_cv
+from investiq.runs.sweep import SweepConfig, expand_grid
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+
+
+def _assert_purged(folds, n_bars: int, purge_bars: int, embargo_bars: int) -> None:
+    assert np.array_equal(sum(f.test_mask.astype(int) for f in folds), np.ones(n_bars, dtype=int))
+    for fold in folds:
+        train = np.flatnonzero(fold.train_mask)
+        for t in np.flatnonzero(fold.test_mask):
+            assert not np.any((train >= t - purge_bars) & (train <= t + embargo_bars))
+        # everything else stays in the train set
+        start, stop = fold.test_segment()
+        kept = np.ones(n_bars, dtype=bool)
+        kept[max(0, start - purge_bars):stop + embargo_bars] = False
+        assert np.array_equal(fold.train_mask, kept)
+
+
+@pytest.mark.parametrize("purge_bars, embargo_bars", [(0, 0), (2, 3), (5, 0), (0, 7)])
+def test_train_masks_exclude_purged_and_embargoed_bars(purge_bars, embargo_bars):
+    folds = purged_kfold(23, 4, purge_bars, embargo_bars)
+    _assert_purged(folds, 23, purge_bars, embargo_bars)
+
+
+def test_mask_segments():
+    mask = np.array([True, True, False, False, True, False, True])
+    assert mask_segments(mask) == [(0, 2), (4, 5), (6, 7)]
+    assert mask_segments(np.zeros(3, dtype=bool)) == []
+
+
+@pytest.mark.parametrize("precompute_features, embargo_bars", [(True, 101), (False, 0)])
+def test_precomputed_features_raise_the_embargo_to_the_feature_lookback(ohlcv, precompute_features, embargo_bars):
+    config = SweepConfig(MovingAverageCrossStrategy, FixedPctOCOPlanner, precompute_features=precompute_features)
+    # the second candidate is invalid; the slow window of 100 sets the lookback
+    candidates = expand_grid({"fast_window": [20, 200], "slow_window": [100]})
+    result = run_purged_cv(ohlcv, config, candidates, n_folds=3, purge_bars=5, max_workers=1)
+
+    _assert_purged(result.folds, len(ohlcv), 5, embargo_bars)
+    assert [c.params() for c in result.selected] == [candidates[0].params()] * 3
+    assert result.test["Error"].isna().all()
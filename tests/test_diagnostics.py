@@ -0,0 +1,52 @@
+import pytest
+
+from investiq.core.diagnostics import DiagnosticsLevel
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input, fill_rows
+
+
+class RecordingStrategy:
+    """
+    Keeps the raw diagnostics of every decision of the wrapped strategy.
+    """
+
+    def __init__(self, strategy):
+        self._strategy = strategy
+        self.metadata = strategy.metadata
+        self.diagnostics = []
+
+    def decide(self, view):
+        decision = self._strategy.decide(view)
+        self.diagnostics.append(decision.diagnostics)
+        return decision
+
+
+def _run(logger_factory, ohlcv, level):
+    strategy = RecordingStrategy(MovingAverageCrossStrategy(10, 50))
+    engine = bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=strategy,
+        execution_planner=FixedPctOCOPlanner(),
+        diagnostics_level=level,
+    )
+    return strategy, engine.run(backtest_input(logger_factory, ohlcv))
+
+
+def test_strategy_builds_no_diagnostics_when_off(logger_factory, ohlcv):
+    strategy, result = _run(logger_factory, ohlcv, DiagnosticsLevel.OFF)
+    _, full = _run(logger_factory, ohlcv, DiagnosticsLevel.FULL)
+
+    assert len(strategy.diagnostics) == len(ohlcv)
+    assert all(d is None for d in strategy.diagnostics)
+    assert fill_rows(result) == fill_rows(full)
+
+
+@pytest.mark.parametrize("level", [DiagnosticsLevel.SUMMARY, DiagnosticsLevel.FULL])
+def test_strategy_builds_diagnostics_when_collected(logger_factory, ohlcv, level):
+    strategy, _ = _run(logger_factory, ohlcv, level)
+
+    warming_up = [d for d in strategy.diagnostics if d.get("warming_up")]
+    assert len(warming_up) == 49
+    assert all(set(d) == {"ma_fast", "ma_slow"} for d in strategy.diagnostics[49:])
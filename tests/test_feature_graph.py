@@ -0,0 +1,71 @@
+from typing import ClassVar
+
+import pytest
+
+from investiq.core.features.graph import FeatureGraph
+
+
+class _Pipeline:
+    def __init__(self, name: str, consumes=(), produces=(), market_inputs=None):
+        self.NAME = name
+        self.consumes = frozenset(consumes)
+        self.produces = frozenset(produces)
+        if market_inputs is not None:
+            self.market_inputs = frozenset(market_inputs)
+
+
+class _Keyed:
+    NAME: ClassVar[str] = "KEYED"
+
+    def __init__(self, window: int):
+        self.key = f"KEYED_{window}"
+        self.produces = frozenset({f"keyed_{window}"})
+
+
+def _graph(*pipelines) -> FeatureGraph:
+    return FeatureGraph.build({getattr(p, "key", p.NAME): p for p in pipelines})
+
+
+def test_order_runs_producers_before_consumers():
+    graph = _graph(
+        _Pipeline("BANDS", consumes={"mean", "var"}, produces={"upper"}, market_inputs=()),
+        _Pipeline("VAR", consumes={"sum"}, produces={"var"}),
+        _Pipeline("MEAN", consumes={"sum"}, produces={"mean"}, market_inputs=()),
+        _Pipeline("SUM", produces={"sum"}),
+        _Pipeline("OTHER", produces={"other"}),
+    )
+
+    assert graph.order == ("SUM", "VAR", "MEAN", "BANDS", "OTHER")
+    assert graph.producer["var"] == "VAR"
+    assert graph.skippable == {"MEAN", "BANDS"}
+
+
+def test_order_keeps_given_order_without_dependencies():
+    graph = _graph(*(_Pipeline(name, produces={name.lower()}) for name in ("C", "A", "B")))
+
+    assert graph.order == ("C", "A", "B")
+
+
+def test_keyed_instances_of_one_pipeline_are_distinct_nodes():
+    graph = _graph(_Keyed(10), _Keyed(50), _Pipeline("CROSS", consumes={"keyed_10", "keyed_50"}))
+
+    assert graph.order == ("KEYED_10", "KEYED_50", "CROSS")
+
+
+def test_cycle_is_reported():
+    with pytest.raises(ValueError, match="dependency cycle: A -> C -> B -> A"):
+        _graph(
+            _Pipeline("A", consumes={"c"}, produces={"a"}),
+            _Pipeline("B", consumes={"a"}, produces={"b"}),
+            _Pipeline("C", consumes={"b"}, produces={"c"}),
+        )
+
+
+def test_unknown_input_is_reported():
+    with pytest.raises(ValueError, match=r"B consumes unknown feature\(s\): \['missing'\]"):
+        _graph(_Pipeline("A", produces={"a"}), _Pipeline("B", consumes={"a", "missing"}))
+
+
+def test_feature_with_two_producers_is_rejected():
+    with pytest.raises(ValueError, match="produced by both A and B"):
+        _graph(_Pipeline("A", produces={"x"}), _Pipeline("B", produces={"x"}))
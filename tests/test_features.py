@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from investiq.core.features.factory import FeaturePipelineFactory, PipelineSpec
+from investiq.runs.builder import StrategyStackSpec, bootstrap_backtest_engine, bootstrap_multi_strategy_engine
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.features.Bollinger import BollingerPipeline, ZScorePipeline
+from investiq_research.features.SMA import SMAFastSlowPipeline, SMAPipeline
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input, feature_columns, fill_rows
+
+
+def _pipelines():
+    return FeaturePipelineFactory.create_all([
+        PipelineSpec.of(SMAPipeline.NAME, {"window": 10}),
+        PipelineSpec.of(SMAPipeline.NAME, {"window": 50}),
+        PipelineSpec.of(SMAFastSlowPipeline.NAME, {"fast_window": 10, "slow_window": 50}),
+        PipelineSpec.of(BollingerPipeline.NAME, {"window": 20, "k": 2.0}),
+        PipelineSpec.of(BollingerPipeline.NAME, {"window": 50, "k": 2.5}),
+        PipelineSpec.of(ZScorePipeline.NAME, {"window": 20}),
+    ])
+
+
+def test_bulk_features_match_incremental(logger_factory, ohlcv):
+    incremental = feature_columns(logger_factory, _pipelines, ohlcv)
+    bulk = feature_columns(logger_factory, _pipelines, ohlcv, bulk=True)
+
+    assert incremental.keys() == bulk.keys()
+    for feature, column in incremental.items():
+        assert np.array_equal(bulk[feature], column, equal_nan=True), feature
+        # equal_nan above also pins the warmup; the column must not be all warmup
+        assert not np.isnan(column).all(), feature
+
+
+@pytest.mark.parametrize("window", [10, 50])
+def test_sma_matches_rolling_mean(logger_factory, ohlcv, window):
+    sma = feature_columns(logger_factory, _pipelines, ohlcv)[f"sma_{window}"]
+    expected = ohlcv["close"].rolling(window).mean().to_numpy()
+
+    assert np.array_equal(np.isnan(sma), np.isnan(expected))
+    np.testing.assert_allclose(sma, expected, rtol=1e-12)
+
+
+def test_fast_slow_pipeline_keeps_its_feature_names(logger_factory, ohlcv):
+    features = feature_columns(logger_factory, _pipelines, ohlcv)
+    slow_ready = ~np.isnan(features["sma_50"])
+
+    np.testing.assert_array_equal(features["ma_slow"], features["sma_50"])
+    np.testing.assert_array_equal(features["ma_fast"][slow_ready], features["sma_10"][slow_ready])
+    assert np.isnan(features["ma_fast"][~slow_ready]).all()
+
+
+def test_bulk_engine_run_matches_incremental(logger_factory, ohlcv):
+    def run(bulk):
+        return bootstrap_backtest_engine(
+            logger_factory=logger_factory,
+            strategy=MovingAverageCrossStrategy(10, 50),
+            execution_planner=FixedPctOCOPlanner(),
+            precompute_features=bulk,
+        ).run(backtest_input(logger_factory, ohlcv))
+
+    incremental, bulk = run(False), run(True)
+
+    assert bulk.metrics == incremental.metrics
+    assert fill_rows(bulk) == fill_rows(incremental)
+
+
+def test_bulk_multi_strategy_run_matches_incremental(logger_factory, ohlcv):
+    def run(bulk):
+        engine = bootstrap_multi_strategy_engine(
+            logger_factory,
+            {
+                "fast": StrategyStackSpec(MovingAverageCrossStrategy(10, 50), FixedPctOCOPlanner()),
+                "slow": StrategyStackSpec(MovingAverageCrossStrategy(20, 100), FixedPctOCOPlanner()),
+            },
+            precompute_features=bulk,
+        )
+        return engine.run(backtest_input(logger_factory, ohlcv)).results
+
+    incremental, bulk = run(False), run(True)
+
+    for name, result in incremental.items():
+        assert fill_rows(bulk[name]) == fill_rows(result), name
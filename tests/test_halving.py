@@ -0,0 +1,50 @@
+import pandas as pd
+
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq.runs.halving import halving_budgets, successive_halving
+from investiq.runs.sweep import SweepConfig, expand_grid, summarize
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input
+
+
+def test_budgets_grow_by_eta_up_to_the_full_data():
+    assert halving_budgets(3_000, 9, eta=3) == [333, 1_000, 3_000]
+    assert halving_budgets(3_000, 27, eta=3, min_bars=300) == [333, 1_000, 3_000]
+    assert halving_budgets(3_000, 1) == [3_000]
+
+
+def test_survivor_matches_its_full_run(logger_factory, ohlcv):
+    config = SweepConfig(MovingAverageCrossStrategy, FixedPctOCOPlanner)
+    candidates = expand_grid(
+        {"fast_window": [5, 10, 20], "slow_window": [50, 100]},
+        {"sl_pct": [0.002, 0.004]},
+    ) + expand_grid({"fast_window": [200], "slow_window": [100]})
+    result = successive_halving(ohlcv, config, candidates, eta=3, min_bars=300, max_workers=2)
+
+    assert result.budgets == (333, 1_000, 3_000)
+    final = result.rungs[result.rungs["Rung"] == len(result.budgets) - 1]
+    assert len(final) == 2
+    best = final.sort_values("Realized PnL", ascending=False).iloc[0]
+    assert candidates[best["Candidate"]] == result.best
+
+    engine = bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=MovingAverageCrossStrategy(**dict(result.best.strategy_params)),
+        execution_planner=FixedPctOCOPlanner(**dict(result.best.planner_params)),
+        initial_cash=config.initial_cash,
+    )
+    expected = summarize(engine.run(backtest_input(logger_factory, ohlcv)))
+    assert expected.pop("Stop Reason") is None and pd.isna(best["Stop Reason"])
+    pd.testing.assert_series_equal(best[list(expected)], pd.Series(expected, name=best.name), check_dtype=False)
+
+
+def test_halving_processes_fewer_bars_than_exhaustive(ohlcv):
+    config = SweepConfig(MovingAverageCrossStrategy, FixedPctOCOPlanner)
+    candidates = expand_grid({"fast_window": [5, 10, 20], "slow_window": [50, 100, 200]})
+    result = successive_halving(ohlcv, config, candidates, eta=3, min_bars=300, max_workers=1)
+
+    # each candidate processes the bars up to the last budget it reached, once
+    reached = result.rungs.groupby("Candidate")["Budget"].max()
+    assert result.bars_processed == reached.sum() == 6 * 333 + 2 * 1_000 + 3_000
+    assert result.bars_processed < result.bars_exhaustive == 9 * 3_000
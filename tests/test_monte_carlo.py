@@ -0,0 +1,97 @@
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from investiq.execution.portfolio.types import FIFOSide
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq.runs.monte_carlo import ResampleMethod, resample_batch, run_monte_carlo, trade_pnls
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input
+
+PNL = np.array([120.0, -80.0, 45.0, -200.0, 60.0, 15.0, -35.0])
+INITIAL_CASH = 1_000.0
+
+
+def _brute_force_drawdowns(path) -> tuple[float, float, float]:
+    equity = peak = INITIAL_CASH
+    max_dd = max_dd_pct = 0.0
+    for trade in path:
+        equity += trade
+        peak = max(peak, equity)
+        max_dd = max(max_dd, peak - equity)
+        max_dd_pct = max(max_dd_pct, (peak - equity) / peak)
+    return equity - INITIAL_CASH, max_dd, max_dd_pct
+
+
+def _quantile(values: np.ndarray, q: float) -> float:
+    # linear interpolation between order statistics
+    ordered = sorted(values)
+    pos = q * (len(ordered) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+@pytest.mark.parametrize("method", list(ResampleMethod))
+def test_results_depend_on_seed_and_batch_size_only(method):
+    serial = run_monte_carlo(PNL, 1_000, method, INITIAL_CASH, seed=7, batch_size=300)
+    with ThreadPoolExecutor(2) as executor:
+        parallel = run_monte_carlo(PNL, 1_000, method, INITIAL_CASH, seed=7, batch_size=300, executor=executor)
+    for name in ("final_pnl", "max_drawdown", "max_drawdown_pct"):
+        np.testing.assert_array_equal(getattr(serial, name), getattr(parallel, name))
+
+    # the result is the concatenation of one batch per child seed
+    seeds = np.random.SeedSequence(7).spawn(4)
+    batches = [resample_batch(PNL, size, method, INITIAL_CASH, s) for size, s in zip([300, 300, 300, 100], seeds)]
+    np.testing.assert_array_equal(serial.max_drawdown, np.concatenate([b[1] for b in batches]))
+
+    other = run_monte_carlo(PNL, 1_000, method, INITIAL_CASH, seed=8, batch_size=300)
+    assert not np.array_equal(serial.max_drawdown, other.max_drawdown)
+
+
+def test_permutation_drawdowns_match_brute_force():
+    pnl = PNL[:4]
+    expected = {_brute_force_drawdowns(path) for path in itertools.permutations(pnl)}
+    result = run_monte_carlo(pnl, 2_000, ResampleMethod.PERMUTATION, INITIAL_CASH, seed=1)
+
+    samples = set(zip(result.final_pnl, result.max_drawdown, result.max_drawdown_pct))
+    rounded = {tuple(round(v, 9) for v in s) for s in expected}
+    assert {tuple(round(v, 9) for v in s) for s in samples} == rounded
+
+
+def test_bootstrap_drawdowns_and_quantiles_match_brute_force():
+    result = run_monte_carlo(PNL, 500, ResampleMethod.BOOTSTRAP, INITIAL_CASH, seed=3)
+    # replay the draws of the single batch
+    draws = np.random.default_rng(np.random.SeedSequence(3).spawn(1)[0]).integers(0, len(PNL), size=(500, len(PNL)))
+    expected = np.array([_brute_force_drawdowns(PNL[row]) for row in draws])
+    np.testing.assert_allclose(result.final_pnl, expected[:, 0])
+    np.testing.assert_allclose(result.max_drawdown, expected[:, 1])
+    np.testing.assert_allclose(result.max_drawdown_pct, expected[:, 2])
+
+    summary = result.summary(quantiles=(0.05, 0.5, 0.95))
+    assert summary["Samples"] == 500 and summary["Trades"] == len(PNL)
+    assert summary["P(Loss)"] == pytest.approx(np.mean(expected[:, 0] < 0))
+    for q in (0.05, 0.5, 0.95):
+        assert summary[f"PnL q{q:g}"] == pytest.approx(_quantile(expected[:, 0], q))
+        assert summary[f"Max Drawdown q{q:g}"] == pytest.approx(_quantile(expected[:, 1], q))
+        assert summary[f"Max Drawdown % q{q:g}"] == pytest.approx(_quantile(expected[:, 2], q))
+
+
+def test_trade_pnls_are_the_realized_pnl_of_closing_fills(logger_factory, ohlcv):
+    engine = bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=MovingAverageCrossStrategy(10, 50),
+        execution_planner=FixedPctOCOPlanner(),
+    )
+    result = engine.run(backtest_input(logger_factory, ohlcv))
+    pnl = trade_pnls(result.execution_log)
+
+    closing = [f for f in result.execution_log if abs(f.position_after) < abs(f.position_before)]
+    direction = {FIFOSide.LONG: 1.0, FIFOSide.SHORT: -1.0}
+    expected = [direction[f.side] * (f.exit_price - f.entry_price) * f.quantity for f in closing]
+    assert len(closing) > 10
+    np.testing.assert_allclose(pnl, expected)
+    assert pnl.sum() == pytest.approx(result.metrics["Realized PnL"])
@@ -0,0 +1,148 @@
+import pytest
+
+from investiq.api.backtest import MultiBacktestInput
+from investiq.api.execution import Decision
+from investiq.core.stop_conditions import MaxBarsWithoutTrade, MaxDrawdown
+from investiq.runs.builder import (
+    StrategyStackSpec,
+    bootstrap_backtest_engine,
+    bootstrap_multi_instrument_engine,
+    bootstrap_multi_strategy_engine,
+)
+from investiq_app.benchmarks.synthetic import synthetic_ohlcv
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import SYMBOL, backtest_input, fill_rows
+
+
+def _standalone(logger_factory, ohlcv, fast, slow, stop_conditions=None):
+    engine = bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=MovingAverageCrossStrategy(fast, slow),
+        execution_planner=FixedPctOCOPlanner(),
+        stop_conditions=stop_conditions,
+    )
+    return engine.run(backtest_input(logger_factory, ohlcv))
+
+
+def test_multi_strategy_stacks_check_their_stop_conditions(logger_factory, ohlcv):
+    stopped = _standalone(logger_factory, ohlcv, 10, 50, [MaxBarsWithoutTrade(60)])
+    running = _standalone(logger_factory, ohlcv, 20, 100)
+    assert stopped.stop_reason is not None
+
+    engine = bootstrap_multi_strategy_engine(logger_factory, {
+        "stopped": StrategyStackSpec(
+            MovingAverageCrossStrategy(10, 50),
+            FixedPctOCOPlanner(),
+            stop_conditions=(MaxBarsWithoutTrade(60),),
+        ),
+        "running": StrategyStackSpec(MovingAverageCrossStrategy(20, 100), FixedPctOCOPlanner()),
+    })
+    results = engine.run(backtest_input(logger_factory, ohlcv)).results
+
+    assert results["stopped"].stop_reason == stopped.stop_reason
+    assert results["stopped"].end == stopped.end
+    assert fill_rows(results["stopped"]) == fill_rows(stopped)
+    assert results["running"].stop_reason is None
+    assert fill_rows(results["running"]) == fill_rows(running)
+
+
+def test_multi_instrument_engine_checks_stop_conditions(logger_factory, ohlcv):
+    stopped = _standalone(logger_factory, ohlcv, 10, 50, [MaxBarsWithoutTrade(60)])
+
+    engine = bootstrap_multi_instrument_engine(
+        logger_factory=logger_factory,
+        symbols=[SYMBOL],
+        strategy_factory=lambda symbol: MovingAverageCrossStrategy(10, 50),
+        planner_factory=lambda symbol: FixedPctOCOPlanner(),
+        stop_conditions_factory=lambda symbol: [MaxBarsWithoutTrade(60)],
+    )
+    result = engine.run(MultiBacktestInput.of(backtest_input(logger_factory, ohlcv))).results[SYMBOL]
+
+    assert result.stop_reason == stopped.stop_reason
+    assert result.end == stopped.end
+    assert result.metrics["Realized PnL"] == stopped.metrics["Realized PnL"]
+
+
+
+def test_other_symbols_fills_do_not_stop_a_symbol(logger_factory, ohlcv):
+    other = synthetic_ohlcv(len(ohlcv), seed=11)
+    alone = _standalone(logger_factory, ohlcv, 10, 50, [MaxDrawdown(0.05)])
+    assert alone.stop_reason is None
+
+    engine = bootstrap_multi_instrument_engine(
+        logger_factory=logger_factory,
+        symbols=[SYMBOL, "OTHER"],
+        strategy_factory=lambda symbol: MovingAverageCrossStrategy(10, 50),
+        planner_factory=lambda symbol: FixedPctOCOPlanner(),
+        stop_conditions_factory=lambda symbol: [MaxDrawdown(0.05)],
+    )
+    results = engine.run(MultiBacktestInput.of(
+        backtest_input(logger_factory, ohlcv),
+        backtest_input(logger_factory, other, symbol="OTHER"),
+    )).results
+
+    assert len(results["OTHER"].execution_log) > 0
+    for symbol in (SYMBOL, "OTHER"):
+        assert results[symbol].stop_reason is None
+    assert results[SYMBOL].end == alone.end
+    assert results[SYMBOL].metrics["Realized PnL"] == alone.metrics["Realized PnL"]
+    assert [f.timestamp for f in results[SYMBOL].execution_log] == [f.timestamp for f in alone.execution_log]
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_ma_variants_share_one_feature_store(logger_factory, ohlcv, bulk):
+    windows = {"a": (10, 50), "b": (20, 50), "c": (10, 100)}
+
+    engine = bootstrap_multi_strategy_engine(
+        logger_factory,
+        {name: StrategyStackSpec(MovingAverageCrossStrategy(*w), FixedPctOCOPlanner()) for name, w in windows.items()},
+        precompute_features=bulk,
+    )
+    result = engine.run(backtest_input(logger_factory, ohlcv))
+
+    assert result.metrics["Feature Stores"] == 1
+    (store,) = {id(e.feature_store): e.feature_store for e in engine.engines.values()}.values()
+    assert store.pipeline_keys() == {
+        "SMA_10", "SMA_20", "SMA_50", "SMA_100",
+        "ROLLING_SUM_10", "ROLLING_SUM_20", "ROLLING_SUM_50", "ROLLING_SUM_100",
+    }
+    for name, (fast, slow) in windows.items():
+        assert fill_rows(result.results[name]) == fill_rows(_standalone(logger_factory, ohlcv, fast, slow))
+
+
+class GlobalReadyMACross:
+    """
+    MA cross gated on the snapshot's global readiness (flat until then).
+    """
+
+    def __init__(self, fast, slow):
+        self._strategy = MovingAverageCrossStrategy(fast, slow)
+        self.metadata = self._strategy.metadata
+
+    def decide(self, view):
+        if not view.features.global_ready:
+            return Decision(view.market.timestamp, 0.0, view.market.bar.close, None)
+        return self._strategy.decide(view)
+
+
+@pytest.mark.parametrize("bulk", [False, True])
+def test_stack_readiness_ignores_other_stacks_warmup(logger_factory, ohlcv, bulk):
+    def stack(fast, slow):
+        return StrategyStackSpec(GlobalReadyMACross(fast, slow), FixedPctOCOPlanner())
+
+    standalone = bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=GlobalReadyMACross(10, 50),
+        execution_planner=FixedPctOCOPlanner(),
+        precompute_features=bulk,
+    ).run(backtest_input(logger_factory, ohlcv))
+
+    engine = bootstrap_multi_strategy_engine(
+        logger_factory,
+        {"short": stack(10, 50), "long": stack(100, 400), "longer": stack(200, 800)},
+        precompute_features=bulk,
+    )
+    result = engine.run(backtest_input(logger_factory, ohlcv))
+
+    assert result.metrics["Feature Stores"] == 1
+    assert fill_rows(result.results["short"]) == fill_rows(standalone)
@@ -0,0 +1,92 @@
+import sys
+
+import pytest
+
+from investiq.runs import cache
+from investiq.runs.cache import ResultCache, result_key
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.execution_planners.no_brackets import NoBracketsPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input, fill_rows
+
+
+@pytest.fixture
+def fake_sources(tmp_path, monkeypatch):
+    package = tmp_path / "iq_fake_sources"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "engine.py").write_text("X = 1\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(cache, "_SOURCE_PACKAGES", ("iq_fake_sources",))
+    cache.source_digest.cache_clear()
+    yield package
+    cache.source_digest.cache_clear()
+    sys.modules.pop("iq_fake_sources", None)
+
+
+def _key(ohlcv):
+    return result_key(ohlcv, MovingAverageCrossStrategy(10, 50), FixedPctOCOPlanner())
+
+
+def test_source_edit_changes_result_key(ohlcv, fake_sources):
+    before = _key(ohlcv)
+    assert _key(ohlcv) == before
+
+    (fake_sources / "engine.py").write_text("X = 2\n")
+    cache.source_digest.cache_clear()
+
+    assert _key(ohlcv) != before
+
+
+def test_engine_version_includes_source_digest():
+    assert cache.engine_version().endswith("+" + cache.source_digest()[:16])
+
+
+def test_cache_round_trip(logger_factory, ohlcv, tmp_path):
+    result = bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=MovingAverageCrossStrategy(10, 50),
+        execution_planner=FixedPctOCOPlanner(),
+    ).run(backtest_input(logger_factory, ohlcv))
+    store = ResultCache(tmp_path)
+    key = _key(ohlcv)
+
+    assert store.get(key) is None
+    store.put(key, result)
+    assert fill_rows(store.get(key)) == fill_rows(result)
+
+
+class _ThresholdPlanner(NoBracketsPlanner):
+    """
+    Non-dataclass planner with runtime state next to its parameters.
+    """
+    def __init__(self, threshold: float):
+        self.threshold = threshold
+        self._seen: list[object] = []
+
+    def cache_params(self) -> dict[str, object]:
+        return {"threshold": self.threshold}
+
+
+class _UnkeyedPlanner:
+    def __init__(self):
+        self.calls = 0
+
+
+def test_identically_built_components_share_a_key(ohlcv):
+    strategy = MovingAverageCrossStrategy(10, 50)
+    first, second = _ThresholdPlanner(0.5), _ThresholdPlanner(0.5)
+    second._seen.append(object())
+
+    assert result_key(ohlcv, strategy, first) == result_key(ohlcv, strategy, second)
+    assert result_key(ohlcv, strategy, first) != result_key(ohlcv, strategy, _ThresholdPlanner(0.6))
+    assert result_key(ohlcv, strategy, NoBracketsPlanner()) == result_key(ohlcv, strategy, NoBracketsPlanner())
+
+
+def test_components_without_declared_params_are_rejected(ohlcv):
+    strategy = MovingAverageCrossStrategy(10, 50)
+    with pytest.raises(TypeError, match="_UnkeyedPlanner"):
+        result_key(ohlcv, strategy, _UnkeyedPlanner())
+    with pytest.raises(TypeError, match="JSON"):
+        result_key(ohlcv, strategy, _ThresholdPlanner(object()))
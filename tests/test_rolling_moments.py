@@ -0,0 +1,101 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from investiq.core.features.factory import FeaturePipelineFactory, PipelineSpec
+from investiq.core.features.graph import pipeline_key
+from investiq_app.benchmarks.synthetic import synthetic_ohlcv
+from investiq_research.features.Bollinger import BollingerPipeline, ZScorePipeline, bollinger_features, zscore_feature
+from investiq_research.features.RollingMoments import (
+    RESEED_EVERY,
+    RollingMomentsPipeline,
+    RollingSumPipeline,
+    sum_feature,
+    var_feature,
+)
+from investiq_research.features.SMA import SMAPipeline, sma_feature
+from tests.conftest import feature_columns
+
+WINDOW = 50
+FLAT = slice(500, 900)
+
+
+@pytest.fixture(scope="module")
+def high_level_ohlcv() -> pd.DataFrame:
+    """
+    Price level 1e7 with ~0.01 moves (E[x²] - E[x]² loses every digit here),
+    flat for a few hundred bars, long enough to cross the reseed period.
+    """
+    df = synthetic_ohlcv(2 * RESEED_EVERY + 500, seed=1, start_price=1e7, volatility=1e-9)
+    flat = df["close"].iloc[FLAT.start - 1]
+    for col in ("open", "high", "low", "close"):
+        df.iloc[FLAT, df.columns.get_loc(col)] = flat
+    return df
+
+
+def _pipelines():
+    return [RollingSumPipeline(WINDOW), RollingMomentsPipeline(WINDOW), ZScorePipeline(WINDOW)]
+
+
+def _reference_var(close: np.ndarray) -> np.ndarray:
+    ref = np.full(len(close), np.nan)
+    for i in range(WINDOW - 1, len(close)):
+        ref[i] = np.var(close[i + 1 - WINDOW:i + 1])
+    return ref
+
+
+def test_variance_is_stable_at_high_price_levels(logger_factory, high_level_ohlcv):
+    var = feature_columns(logger_factory, _pipelines, high_level_ohlcv)[var_feature(WINDOW)]
+    ref = _reference_var(high_level_ohlcv["close"].to_numpy())
+
+    assert np.array_equal(np.isnan(var), np.isnan(ref))
+    assert np.nanmin(var) >= 0.0
+    assert np.nanmax(np.abs(var - ref)) < 1e-3 * np.nanmedian(ref)
+
+
+def test_flat_window_has_zero_variance(logger_factory, high_level_ohlcv):
+    features = feature_columns(logger_factory, _pipelines, high_level_ohlcv)
+    fully_flat = slice(FLAT.start + WINDOW - 1, FLAT.stop)
+
+    assert (features[var_feature(WINDOW)][fully_flat] == 0.0).all()
+    assert (features[zscore_feature(WINDOW)][fully_flat] == 0.0).all()
+
+
+def test_bulk_matches_incremental_across_reseeds(logger_factory, high_level_ohlcv):
+    incremental = feature_columns(logger_factory, _pipelines, high_level_ohlcv)
+    bulk = feature_columns(logger_factory, _pipelines, high_level_ohlcv, bulk=True)
+
+    for feature in (sum_feature(WINDOW), var_feature(WINDOW), zscore_feature(WINDOW)):
+        assert np.array_equal(bulk[feature], incremental[feature], equal_nan=True), feature
+
+
+def test_sma_and_bands_share_one_rolling_sum_per_window():
+    pipelines = FeaturePipelineFactory.create_all([
+        PipelineSpec.of(SMAPipeline.NAME, {"window": 10}),
+        PipelineSpec.of(SMAPipeline.NAME, {"window": WINDOW}),
+        PipelineSpec.of(BollingerPipeline.NAME, {"window": WINDOW}),
+    ])
+
+    assert sorted(pipeline_key(p) for p in pipelines) == sorted([
+        "SMA_10", f"SMA_{WINDOW}", f"BOLLINGER_{WINDOW}_2", "ROLLING_SUM_10", f"ROLLING_SUM_{WINDOW}", f"ROLLING_MOMENTS_{WINDOW}",
+    ])
+    sma = next(p for p in pipelines if pipeline_key(p) == f"SMA_{WINDOW}")
+    assert sma.consumes == {sum_feature(WINDOW)}
+    assert sma.produces == {sma_feature(WINDOW)}
+
+
+def test_bands_with_other_parameters_share_a_store(logger_factory, high_level_ohlcv):
+    def pipelines():
+        return FeaturePipelineFactory.create_all([
+            PipelineSpec.of(BollingerPipeline.NAME, {"window": 20, "k": 2.0}),
+            PipelineSpec.of(BollingerPipeline.NAME, {"window": 20, "k": 3.0}),
+            PipelineSpec.of(BollingerPipeline.NAME, {"window": WINDOW, "k": 2.0}),
+        ])
+
+    features = feature_columns(logger_factory, pipelines, high_level_ohlcv.iloc[:1_000])
+    mid, upper, lower = (features[name] for name in bollinger_features(20, 2.0))
+    _, wide_upper, _ = (features[name] for name in bollinger_features(20, 3.0))
+
+    assert sum(name.startswith("bb_") for name in features) == 9
+    np.testing.assert_allclose(wide_upper - mid, 1.5 * (upper - mid), atol=1e-6)
+    assert np.isnan(features[bollinger_features(WINDOW, 2.0)[0]][WINDOW - 2])
@@ -0,0 +1,59 @@
+import pytest
+
+from investiq.core.stop_conditions import MaxBarsWithoutTrade, MaxDrawdown
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input, fill_rows
+
+
+def _engine(logger_factory, condition):
+    return bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=MovingAverageCrossStrategy(10, 50),
+        execution_planner=FixedPctOCOPlanner(),
+        stop_conditions=[condition],
+    )
+
+
+@pytest.mark.parametrize("make_condition", [
+    lambda: MaxBarsWithoutTrade(60),
+    lambda: MaxDrawdown(0.002),
+    lambda: MaxDrawdown(300, relative=False),
+])
+def test_restore_then_consume_stops_like_uninterrupted_run(logger_factory, ohlcv, make_condition):
+    bt_input = backtest_input(logger_factory, ohlcv)
+    full_engine = _engine(logger_factory, make_condition())
+    full = full_engine.run(bt_input)
+    assert full.stop_reason is not None
+    stop_bar = full_engine.bars
+
+    # Interrupt shortly before the stop, inside the idle streak / drawdown
+    split = stop_bar - 30
+    first = _engine(logger_factory, make_condition())
+    assert first.consume(backtest_input(logger_factory, ohlcv.iloc[:split]).events) is None
+    checkpoint = first.checkpoint()
+
+    resumed = _engine(logger_factory, make_condition())
+    resumed.restore(checkpoint)
+    rest = backtest_input(logger_factory, ohlcv.iloc[split:])
+    stop_reason = resumed.consume(rest.events)
+    resumed.finish()
+    result = resumed.result(rest.instrument, stop_reason=stop_reason)
+
+    assert resumed.bars == stop_bar
+    assert result.stop_reason == full.stop_reason
+    assert result.metrics == full.metrics
+    assert fill_rows(result) == fill_rows(full)
+
+
+def test_continued_run_keeps_condition_state(logger_factory, ohlcv):
+    full_engine = _engine(logger_factory, MaxBarsWithoutTrade(60))
+    full = full_engine.run(backtest_input(logger_factory, ohlcv))
+
+    engine = _engine(logger_factory, MaxBarsWithoutTrade(60))
+    engine.run(backtest_input(logger_factory, ohlcv.iloc[:full_engine.bars - 30]))
+    continued = engine.run(backtest_input(logger_factory, ohlcv))
+
+    assert engine.bars == full_engine.bars
+    assert continued.stop_reason == full.stop_reason
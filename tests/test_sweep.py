@@ -0,0 +1,73 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import pandas as pd
+import pytest
+
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq.runs.shared_data import SharedOHLCV
+from investiq.runs.sweep import SweepConfig, expand_grid, run_sweep, summarize
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input
+
+CONFIG = SweepConfig(MovingAverageCrossStrategy, FixedPctOCOPlanner)
+
+
+def test_expand_grid_rejects_shared_parameter_names():
+    with pytest.raises(ValueError, match="fast_window"):
+        expand_grid({"fast_window": [5]}, {"fast_window": [10]})
+
+
+def test_expand_grid_is_the_cartesian_product():
+    candidates = expand_grid({"fast_window": [5, 10], "slow_window": [50]}, {"sl_pct": [0.002, 0.004]})
+    assert [c.params() for c in candidates] == [
+        {"fast_window": 5, "slow_window": 50, "sl_pct": 0.002},
+        {"fast_window": 5, "slow_window": 50, "sl_pct": 0.004},
+        {"fast_window": 10, "slow_window": 50, "sl_pct": 0.002},
+        {"fast_window": 10, "slow_window": 50, "sl_pct": 0.004},
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_sweep_rows_match_single_runs(logger_factory, ohlcv, max_workers):
+    candidates = expand_grid({"fast_window": [10, 20, 50], "slow_window": [50]}, {"sl_pct": [0.002, 0.004]})
+    table = run_sweep(ohlcv, CONFIG, candidates, max_workers=max_workers)
+
+    assert len(table) == len(candidates)
+    for candidate, (_, row) in zip(candidates, table.iterrows()):
+        params = candidate.params()
+        assert {k: row[k] for k in params} == params
+        if params["fast_window"] >= params["slow_window"]:
+            assert "fast_window must be < slow_window" in row["Error"]
+            continue
+        engine = bootstrap_backtest_engine(
+            logger_factory=logger_factory,
+            strategy=MovingAverageCrossStrategy(**dict(candidate.strategy_params)),
+            execution_planner=FixedPctOCOPlanner(**dict(candidate.planner_params)),
+            initial_cash=CONFIG.initial_cash,
+            precompute_features=True,
+        )
+        expected = summarize(engine.run(backtest_input(logger_factory, ohlcv)))
+        assert row["Error"] is None
+        pd.testing.assert_series_equal(
+            row[list(expected)], pd.Series(expected, name=row.name), check_dtype=False,
+        )
+
+
+def test_shared_data_is_unlinked_when_a_candidate_fails(ohlcv, monkeypatch):
+    published: list[SharedOHLCV] = []
+    publish = SharedOHLCV.publish.__func__
+
+    def spy(cls, df):
+        published.append(publish(cls, df))
+        return published[-1]
+
+    monkeypatch.setattr(SharedOHLCV, "publish", classmethod(spy))
+    # an unknown constructor parameter is a TypeError, not a reported ValueError
+    candidates = expand_grid({"fast_window": [10], "slow_window": [50], "unknown": [1]})
+    with pytest.raises(TypeError):
+        run_sweep(ohlcv, CONFIG, candidates, max_workers=1)
+
+    assert len(published) == 1
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=published[0].handle.name, track=False)
@@ -0,0 +1,45 @@
+import dataclasses
+
+import pytest
+
+from investiq.export_engine.formatters.components.ExecutionLogEntryToDataFrame import BacktestDataFrameFormatter
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq.utilities.time_utils import to_timestamp
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input
+
+EXCHANGE_TZ = "America/Chicago"
+
+
+def _run(logger_factory, df, epoch_ns):
+    engine = bootstrap_backtest_engine(
+        logger_factory=logger_factory,
+        strategy=MovingAverageCrossStrategy(10, 50),
+        execution_planner=FixedPctOCOPlanner(),
+    )
+    return engine.run(backtest_input(logger_factory, df, epoch_ns=epoch_ns))
+
+
+@pytest.mark.parametrize("tz", [EXCHANGE_TZ, None])
+def test_epoch_ns_run_keeps_source_timezone(logger_factory, ohlcv, tz):
+    df = ohlcv.tz_convert(EXCHANGE_TZ) if tz is not None else ohlcv.tz_localize(None)
+    expected = _run(logger_factory, df, epoch_ns=False)
+    result = _run(logger_factory, df, epoch_ns=True)
+
+    assert (result.start, result.end) == (df.index[0], df.index[-1])
+    assert str(result.start.tz) == str(expected.start.tz) == str(tz)
+    assert [to_timestamp(f.timestamp, result.tz) for f in result.execution_log] == [
+        f.timestamp for f in expected.execution_log
+    ]
+
+
+def test_exported_timezone_is_the_exchange_one(logger_factory, ohlcv):
+    result = _run(logger_factory, ohlcv.tz_convert(EXCHANGE_TZ), epoch_ns=True)
+    fill = result.execution_log[0]
+    formatter = BacktestDataFrameFormatter(logger_factory.child("Formatter").get())
+
+    row = formatter.format([dataclasses.replace(fill, timestamp=to_timestamp(fill.timestamp, result.tz))]).iloc[0]
+
+    assert row["timezone"] == "UTC-06:00"
+    assert row["timestamp"] == to_timestamp(fill.timestamp, EXCHANGE_TZ).tz_localize(None)
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from investiq.runs.builder import bootstrap_backtest_engine
+from investiq.runs.equity import equity_curve
+from investiq.runs.sweep import SweepConfig, expand_grid
+from investiq.runs.walk_forward import WalkForwardWindow, run_walk_forward, walk_forward_windows
+from investiq_research.execution_planners.fixed_pct_oco import FixedPctOCOPlanner
+from investiq_research.strategies.MovingAverageCrossStrategy import MovingAverageCrossStrategy
+from tests.conftest import backtest_input
+
+
+def test_windows_boundaries():
+    assert walk_forward_windows(11, train_bars=4, test_bars=2) == [
+        WalkForwardWindow(0, 0, 4, 4, 6),
+        WalkForwardWindow(1, 2, 6, 6, 8),
+        WalkForwardWindow(2, 4, 8, 8, 10),
+        WalkForwardWindow(3, 6, 10, 10, 11),
+    ]
+    assert walk_forward_windows(10, train_bars=4, test_bars=2, step_bars=3, anchored=True) == [
+        WalkForwardWindow(0, 0, 4, 4, 6),
+        WalkForwardWindow(1, 0, 7, 7, 9),
+    ]
+
+
+def test_overlapping_test_windows_are_rejected():
+    with pytest.raises(ValueError, match="overlap"):
+        walk_forward_windows(100, train_bars=20, test_bars=10, step_bars=5)
+    with pytest.raises(ValueError, match="overlap"):
+        walk_forward_windows(100, train_bars=20, test_bars=10, step_bars=0)
+
+
+def test_stitched_equity_chains_the_test_windows(logger_factory, ohlcv):
+    # Without precomputed features every test run is a fresh engine over its slice
+    config = SweepConfig(MovingAverageCrossStrategy, FixedPctOCOPlanner, precompute_features=False)
+    candidates = expand_grid({"fast_window": [10, 20], "slow_window": [50]})
+    result = run_walk_forward(ohlcv, config, candidates, train_bars=1000, test_bars=500, max_workers=2)
+
+    assert [(w.test_start, w.test_stop) for w in result.windows] == [
+        (1000, 1500), (1500, 2000), (2000, 2500), (2500, 3000),
+    ]
+    assert result.equity.index.equals(ohlcv.index[1000:])
+
+    expected: list[np.ndarray] = []
+    offset = 0.0
+    for window, candidate in zip(result.windows, result.selected):
+        df = ohlcv.iloc[window.test_start:window.test_stop]
+        engine = bootstrap_backtest_engine(
+            logger_factory=logger_factory,
+            strategy=MovingAverageCrossStrategy(**dict(candidate.strategy_params)),
+            execution_planner=FixedPctOCOPlanner(),
+            initial_cash=config.initial_cash,
+        )
+        run = engine.run(backtest_input(logger_factory, df))
+        pnl = equity_curve(run.execution_log, df.index.asi8, df["close"].to_numpy(), config.initial_cash)
+        pnl -= config.initial_cash
+        expected.append(pnl + offset)
+        offset += float(pnl[-1])
+    np.testing.assert_allclose(result.equity.to_numpy(), np.concatenate(expected) + config.initial_cash)
+    assert result.equity.name == "Equity"
+    assert result.out_of_sample["Window"].tolist() == [0, 1, 2, 3]